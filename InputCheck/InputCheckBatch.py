@@ -0,0 +1,234 @@
+#  ==================================================================================
+#  
+#  Copyright (c) 2018, Evangelos G. Karakasis 
+#  
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#  
+#  ==================================================================================
+
+# ----------
+# Vectorized validation of many argument sets at once. The columns of the arguments are checked 
+# against the same specifications that are used by acceptedValues, but the checks of ranges, 
+# min/max values, lengths and sets are performed with numpy comparisons, over whole columns.
+# Instead of raising an exception on the first invalid argument set, a boolean mask is returned.
+# ----------
+
+import sys
+sys.path.append('../')
+sys.path.append('../../')
+
+from InputCheck import np
+from InputCheck.InputCheckDecorators import CompileValidationPlan, ArgumentError, _intervals, _isStreamSpec, _isSchemaSpec
+import numbers
+
+
+def _numberMembers(vset):
+    # only the numbers of a set can be equal to a number
+    return [value for value in vset if isinstance(value, numbers.Number)]
+
+
+def _stringMembers(vset):
+    return [value for value in vset if type(value) is str]
+
+
+def _rangesMask(values, ranges):
+    # the binary search of the multi-interval constraints, over a whole column (see _rangesStep)
+    lows, highs = _intervals(ranges)
+    idx = np.searchsorted(np.asarray(lows), values, side='right') - 1
+    return (idx >= 0) & (values <= np.asarray(highs)[np.maximum(idx, 0)])
+
+
+def _numberColumnMask(column, accepted_arg_type):
+    # vectorized equivalent of CompileNumberCheck, for a column without None values
+    # NOTE : the comparisons are written in the same way as in the CheckRange, CheckMin and CheckMax 
+    #        functions, so as a NaN to be accepted here as well
+    mask = np.ones(len(column), dtype=bool)
+
+    for Key, checkVal in accepted_arg_type.items():
+        if Key == 'range':
+            mask &= ~((column < checkVal[0]) | (column > checkVal[1]))
+
+        elif Key == 'minValue':
+            mask &= ~(column < checkVal)
+
+        elif Key == 'maxValue':
+            mask &= ~(column > checkVal)
+
+        elif Key == 'ranges':
+            mask &= _rangesMask(column, checkVal)
+
+        elif Key == 'set':
+            mask &= np.isin(column, _numberMembers(checkVal))
+
+    return mask
+
+
+def _stringColumnMask(column, accepted_arg_type):
+    # vectorized equivalent of CompileStringCheck, for a column without None values
+    mask = np.ones(len(column), dtype=bool)
+    lengths = None
+
+    for Key, checkVal in accepted_arg_type.items():
+        if Key in ('minLength', 'maxLength', 'rangeLength', 'rangesLength') and lengths is None:
+            lengths = np.char.str_len(column)
+
+        if Key == 'minLength':
+            mask &= ~(lengths < checkVal)
+
+        elif Key == 'maxLength':
+            mask &= ~(lengths > checkVal)
+
+        elif Key == 'rangeLength':
+            mask &= ~((lengths < checkVal[0]) | (lengths > checkVal[1]))
+
+        elif Key == 'rangesLength':
+            mask &= _rangesMask(lengths, checkVal)
+
+        elif Key == 'set':
+            mask &= np.isin(column, _stringMembers(checkVal))
+
+    return mask
+
+
+def _genericColumnMask(column, valueChecker):
+    # the compiled check is applied to each element separately (e.g. mixed types, None values, lists)
+    mask = np.ones(len(column), dtype=bool)
+
+    for row, actual_arg in enumerate(column):
+        try:
+            valueChecker(actual_arg)
+        except (ValueError, ArgumentError): # e.g. the ArgumentTypeError of an 'iterOf' or of a 'schema' specification
+            mask[row] = False
+
+    return mask
+
+
+def ColumnMask(column, accepted_arg_type, valueChecker):
+    """
+    Checks the values of a whole column of arguments (a list, a tuple or a 1D np.ndarray) and returns
+    a boolean mask, where True means that the corresponding value is valid.
+
+    Arguments:
+        column            -- the values of a single argument
+        accepted_arg_type -- the value specification of the argument e.g. {'range': [1, 10]}
+        valueChecker      -- the compiled value check of the argument (see CompileValueCheck), which 
+                             is used for the columns that cannot be vectorized
+    """
+    if accepted_arg_type.get('command') == 'noCheck':
+        return np.ones(len(column), dtype=bool)
+
+    # the items of the iterables and the nested payloads are checked only by the compiled check
+    if _isStreamSpec(accepted_arg_type) or _isSchemaSpec(accepted_arg_type):
+        return _genericColumnMask(column, valueChecker)
+
+    if type(column) is np.ndarray:
+        # a numeric array is treated as a column of python numbers
+        if column.ndim == 1 and column.dtype.kind in 'iuf':
+            return _numberColumnMask(column, accepted_arg_type)
+        elif column.ndim == 1 and column.dtype.kind == 'U':
+            return _stringColumnMask(column, accepted_arg_type)
+        elif column.ndim == 1 and column.dtype.kind == 'b':
+            return np.ones(len(column), dtype=bool) # the booleans are not value checked
+        return _genericColumnMask(column, valueChecker)
+
+    # the types of the elements are collected first, since e.g. the np.asarray([1, 'a']) 
+    # would turn the number 1 into a string
+    types = set(map(type, column))
+    if len(types) > 0 and types <= {int, float}:
+        try:
+            return _numberColumnMask(np.asarray(column), accepted_arg_type)
+        except OverflowError: # integers which do not fit in an int64
+            pass
+    elif types == {str}:
+        return _stringColumnMask(np.asarray(column), accepted_arg_type)
+
+    return _genericColumnMask(column, valueChecker)
+
+
+def validateBatch(validate_function, columns, accepted_arg_types=None, returnIndices=False):
+    """
+    Checks the values of many argument sets of a function at once, without calling the function.
+    
+    Arguments:
+        validate_function  -- a function decorated with acceptedValues (or accepted)
+        columns            -- the columns of the arguments, either as a sequence (one column per 
+                              argument, in the order of the function's arguments) or as a dict 
+                              (argument name -> column). The arguments with default values can be omitted.
+        accepted_arg_types -- the value specifications e.g. ({'range': [1, 10]}, {'set': [1,2,3,4,5]}), 
+                              when <validate_function> is not decorated
+        returnIndices      -- if True, the indices of the invalid rows are returned instead of the mask
+
+    Returns:
+        a boolean np.ndarray where True means that the corresponding argument set (row) is valid, or
+        the indices of the invalid rows (if <returnIndices> is True)
+    
+    NOTE : only the values are checked, the types specifications are ignored
+    """
+    if accepted_arg_types is not None:
+        plan = CompileValidationPlan(validate_function, valueSpecs=accepted_arg_types)
+    else:
+        plan = getattr(validate_function, 'validationPlan', None)
+        if plan is None or plan.valueSpecs is None:
+            raise ValueError('The function {0}() is not decorated with acceptedValues. Use the <accepted_arg_types> argument to give the values specifications.'.format(validate_function.__name__))
+
+    numOfArgs = len(plan.valueSpecs)
+
+    # bind the columns to the arguments positions
+    if isinstance(columns, dict):
+        bound = {}
+        for arg_key, column in columns.items():
+            if arg_key not in plan.positions:
+                raise plan.invalidNumberOfArguments()
+            bound[plan.positions[arg_key]] = column
+    else:
+        if len(columns) > numOfArgs:
+            raise plan.invalidNumberOfArguments()
+        bound = dict(enumerate(columns))
+
+    lengths = set(len(column) for column in bound.values())
+    if len(lengths) > 1:
+        raise ValueError('All the columns of the arguments of {0}() must have the same length.'.format(plan.function.__name__))
+    numOfRows = lengths.pop() if lengths else 0
+
+    mask = np.ones(numOfRows, dtype=bool)
+
+    # the missing arguments get their default values, which are checked only once
+    for arg_num, arg_key, default in plan.defaults:
+        if arg_num not in bound:
+            bound[arg_num] = None
+            try:
+                plan.valueCheckers[arg_num](default)
+            except (ValueError, ArgumentError):
+                mask[:] = False
+
+    if len(bound) != numOfArgs:
+        raise plan.invalidNumberOfArguments()
+
+    # the shared checks (see CompileValidationPlan) raise errors without a function, which is filled by the plan
+    try:
+        for arg_num, column in bound.items():
+            if column is not None and mask.any():
+                mask &= ColumnMask(column, plan.valueSpecs[arg_num], plan.valueCheckers[arg_num])
+    except ArgumentError as error:
+        plan.completeError(error)
+        raise
+
+    if returnIndices:
+        return np.flatnonzero(~mask)
+    return mask
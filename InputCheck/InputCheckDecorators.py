@@ -62,6 +62,7 @@
 #   - minValue (e.g. x belongs in [minValue, Inf) -- continuous)
 #   - maxValue (e.g. x belongs in (-Inf, maxValue] -- continuous)
 #   - range    (e.g. x belongs in [minValue, maxValue] -- continuous)
+#   - ranges   (e.g. x belongs in [1, 5] or in [10, 20] -- continuous)
 #   - set      (e.g. x belongs in [1,2,3,4,5] -- discrete)
 #
 # - string value
@@ -83,21 +84,100 @@
 #       - minLength
 #       - maxLength
 #       - rangeLength
+#   - elements
+#       - elemMin, elemMax, elemRange (e.g. every element belongs in [minValue, maxValue])
+#       - finite    (no NaN or Inf elements)
+#       - noNaN     (no NaN elements)
+#       - monotonic (True, 'increasing', 'decreasing', 'strictlyIncreasing' or 'strictlyDecreasing')
+#       - dtype     (e.g. np.float64 or [np.float32, np.float64])
+#       - parallel  (True: the element-wise checks of large arrays are performed in parallel)
+#   - shape (e.g. ('N', 'C') or (..., 3), where the named dimensions are bound across all the arguments of a call)
+#       - contiguous (True, 'C' or 'F')
+#       - aligned    (True or a number of bytes e.g. 64)
+#
+# - iterable (containers are checked eagerly, iterators lazily, while they are consumed)
+#   - iterOf   (the type and value specification of each item e.g. {'type': float, 'range': [0, 1]})
+#   - maxItems (the maximum number of items)
+#
+# - schema (a nested payload of dicts and lists e.g. {'keys': {'id': {'type': int}}, 'optional': {'tags': {'listOf': {'type': str}}}})
+#   - keys, optional (the required and the optional keys of a dict, with the specification of each one)
+#   - extraKeys      (False: the keys which have not been declared are rejected)
+#   - listOf, dictOf (the specification of each item of a list or tuple and of each value of a dict)
+#   - maxDepth       (the maximum nesting of the payload)
 # ============================
 
 import sys
 sys.path.append('../')
 sys.path.append('../../')
 
-from InputCheck import functools, np
+from InputCheck import functools
+import abc
+import bisect
+import collections
+import collections.abc
+import contextlib
+import copy
 import inspect
+import itertools
+import keyword
+import mmap
+import os
+import random
+import threading
+import time
+import types
+import typing
+import weakref
 
 numberTypes = [int, float]
 stringTypes = [str]
 boolTypes   = [bool]
 objectTypes = [list, tuple, dict]
 noneTypes   = [type(None)]
-arrayType   = [np.ndarray]
+arrayType   = [] # np.ndarray and np.memmap, which are added when NumPy is imported (see _loadNumpy)
+
+
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+# NUMPY
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+# NumPy is imported only when it is needed, i.e. when an array specification is declared or when an argument 
+# arrives after the caller has imported NumPy (no array can exist before that), so as the code which checks 
+# only numbers and strings not to pay for the import of NumPy.
+
+class _LazyNumpy:
+    # stands for the module until its first attribute is requested, which imports NumPy and replaces it
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        return getattr(_loadNumpy(), name)
+
+    def __repr__(self):
+        return '<numpy (not imported yet)>'
+
+
+np = _LazyNumpy()
+_numpyLock = threading.Lock()
+
+
+def _loadNumpy():
+    # imports NumPy (once) and registers its array types
+    global np
+    with _numpyLock:
+        if type(np) is _LazyNumpy:
+            import numpy
+            arrayType.extend((numpy.ndarray, numpy.memmap))
+            np = numpy
+    return np
+
+
+def _numpyAvailable(required=False):
+    # returns whether NumPy is imported, importing it if it is <required> or if the caller has already imported it
+    if type(np) is not _LazyNumpy:
+        return True
+    if required or 'numpy' in sys.modules:
+        _loadNumpy()
+        return True
+    return False
 
 
 def get_default_args(func):
@@ -125,28 +205,709 @@ def getArgumentsNames(func):
     sig = inspect.signature(func)
     return list(sig.parameters.keys()) # argument names (all names: vars and default values)
 
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+# ERRORS
+# ------
+
+# the messages of the errors, where {ord} is the ordinal number of the argument (e.g. 1st), {function} is the 
+# name of the decorated function, {constraint} is the specification that has not been satisfied and {value} 
+# is the offending value
+_messages = {
+    'typeList'        : 'The type of the {ord} argument of function {function}() does not belong in {constraint}',
+    'type'            : 'The {ord} argument of the function {function}() is not a {constraint}',
+    'consistency'     : 'Each element of the {ord} variable must have the same type.',
+    'consistencyType' : 'Each element of the {ord} variable must have the same type. Allowed types: {constraint}.',
+    'range'           : 'The {ord} argument of the function {function}() has {text} out of the accepted range: {constraint}.',
+    'min'             : 'The {ord} argument of the function {function}() has lower {text} than the accepted: {constraint}.',
+    'max'             : 'The {ord} argument of the function {function}() has higher {text} than the accepted: {constraint}.',
+    'ranges'          : 'The {ord} argument of the function {function}() has {text} out of the accepted ranges: {constraint}.',
+    'set'             : 'The {ord} argument of the function {function}() does not belong to the set {constraint}.',
+    'none'            : 'The {ord} argument of the function {function}() must not be <None>.',
+    'dimensions'      : 'The {ord} variable of function {function}() has more than 2 dimensions. Currently only 1D and 2D arrays are supported. If the usage of a high dimensional array is in your intension, then it is suggested to deactivate the value check for this input by using this parameter:' + "{{'noCheck': ''}}",
+    'dtype'           : 'The {ord} argument of the function {function}() has elements of type {value}, which does not belong in {constraint}.',
+    'noNaN'           : 'The {ord} argument of the function {function}() has NaN elements.',
+    'finite'          : 'The {ord} argument of the function {function}() has infinite elements.',
+    'monotonic'       : 'The elements of the {ord} argument of the function {function}() are not {text}.',
+    'shape'           : 'The {ord} argument of the function {function}() has shape {value}, which does not match the shape {constraint}.',
+    'shapeSymbol'     : 'The {ord} argument of the function {function}() has shape {value}, where the dimension {symbol} of {constraint} is not equal to {size}, as it has been bound by the {bound} argument.',
+    'contiguous'      : 'The {ord} argument of the function {function}() is not {text} contiguous.',
+    'aligned'         : 'The {ord} argument of the function {function}() is not aligned{text}.',
+    'iterable'        : 'The {ord} argument of the function {function}() is not iterable.',
+    'maxItems'        : 'The {ord} argument of the function {function}() has more items than the accepted: {constraint}.',
+    'maxYields'       : 'The function {function}() has yielded more items than the accepted: {constraint}.',
+    'missingKey'      : 'The {ord} argument of the function {function}() has no {constraint!r} key.',
+    'unknownKey'      : 'The {ord} argument of the function {function}() has the unexpected key {value!r}, which does not belong in {constraint}.',
+    'maxDepth'        : 'The {ord} argument of the function {function}() is nested deeper than the accepted: {constraint}.',
+    'arguments'       : 'Invalid number of arguments for {function}()',
+}
+
+
+class ArgumentError(Exception):
+    """
+    The base class of the exceptions which are raised when the arguments of a decorated function are not valid. 
+    The exception carries the details of the failure, while its message is rendered only when str() is called 
+    on it. Thus, nothing is formatted unless the message is actually needed.
+
+    Attributes:
+        code       -- identifies the failed check, e.g. 'type', 'consistency', 'range', 'minValue', 'rangeLength', 
+                      'rowsMax', 'set', 'none', 'dtype', 'elemRange', 'finite', 'arguments' (invalid number of arguments)
+        function   -- the decorated function (only its name, if the error has been unpickled)
+        arg_num    -- the position of the argument (starting from 0), or None
+        name       -- the name of the argument, or None
+        constraint -- the specification that has not been satisfied, e.g. [1, 10]
+        value      -- the offending value, e.g. the argument, its length or the offending element
+        details    -- any additional fields e.g. 'item' (the index of the offending item of an iterator), 
+                      'yielded' (True if the item has been yielded by a generator function), 'attribute' 
+                      (the name of a ValidatedAttribute) and 'path' (the offending element of a nested payload, 
+                      e.g. "['users'][3]['age']", see CompileSchemaCheck)
+    """
+
+    def __init__(self, code=None, function=None, arg_num=None, constraint=None, value=None, message=None, **details):
+        Exception.__init__(self, code, arg_num, constraint, value)
+        self.code       = code
+        self.function   = function
+        self.arg_num    = arg_num
+        self.constraint = constraint
+        self.value      = value
+        self.message    = code if message is None else message # the key of the message in _messages
+        self.details    = details
+
+    @property
+    def name(self):
+        if type(self.function) is str: # an unpickled error (see __reduce__)
+            return getattr(self, '_argumentName', None)
+        if self.arg_num is None or self.function is None:
+            return None
+        names = getArgumentsNames(self.function)
+        return names[self.arg_num] if self.arg_num < len(names) else None
+
+    def __reduce__(self):
+        # the function is replaced by its name (and the name of the argument is kept), since the decorated 
+        # function is hidden by its wrapper and it cannot be pickled, e.g. when the error crosses a process pool
+        state = dict(self.__dict__)
+        state['function'] = getattr(self.function, '__name__', self.function)
+        state['_argumentName'] = self.name
+        return (type(self), (self.code, None, self.arg_num, self.constraint, self.value, self.message), state)
+
+    def __str__(self):
+        if self.message not in _messages: # e.g. ArgumentValueError()
+            return '' if self.message is None else str(self.message)
+        fields = dict(self.details)
+        if 'ord' not in fields:
+            fields['ord'] = '' if self.arg_num is None else ordinal(self.arg_num + 1)
+        template = _messages[self.message]
+
+        # the element of a nested payload (see CompileSchemaCheck) is reported instead of the argument itself
+        if 'path' in fields:
+            fields['ord'] = 'element {0} of the {1}'.format(fields['path'], fields['ord'])
+
+        # the item of an iterator (see ValidatingIterator) is reported instead of the argument itself
+        if 'item' in fields:
+            item = ordinal(fields['item'] + 1)
+            if fields.get('yielded'):
+                fields['ord'] = item
+                template = (template.replace('{ord} argument of the function', '{ord} item yielded by the function')
+                                    .replace('{ord} argument of function', '{ord} item yielded by function')
+                                    .replace('{ord} variable', '{ord} item yielded'))
+            else:
+                fields['ord'] = '{0} item of the {1}'.format(item, fields['ord'])
+
+        # the value assigned to a ValidatedAttribute is reported as the attribute itself
+        if 'attribute' in fields:
+            template = (template.replace('{ord} argument of the function {function}()', 'attribute {attribute}')
+                                .replace('{ord} argument of function {function}()', 'attribute {attribute}')
+                                .replace('{ord} variable', 'attribute {attribute}'))
+
+        function = getattr(self.function, '__name__', self.function)
+        return template.format(function=function, constraint=self.constraint, value=self.value, **fields)
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, str(self))
+
+
+class ArgumentTypeError(ArgumentError, TypeError):
+    """
+    Raised when the type of an argument is not valid.
+    """
+
+
+class ArgumentValueError(ArgumentError, ValueError):
+    """
+    Raised when the value of an argument (or the number of the arguments) is not valid.
+    """
+
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+# SPECIFICATIONS
+# --------------
+
+# when True, the dict value specifications are converted to interned ValueSpecs at decoration time and the 
+# compiled checks of identical specifications are shared by all the decorated functions (see CompileValidationPlan)
+internSpecs = True
+
+_sharedChecks = weakref.WeakValueDictionary() # (kind, position, frozen specification) -> compiled check
+
+
+# the values of the specifications which are returned as they are (see ValueSpec.__getitem__)
+_immutableTypes = frozenset([int, float, bool, str, bytes, type(None), type, frozenset])
+
+
+def _freezeSpec(spec, parents=()):
+    """
+    Returns a hashable (and type aware, e.g. 1, 1.0 and True are different) equivalent of a specification, 
+    which is used for interning it. A TypeError is raised if the specification has unhashable parts (e.g. arrays) 
+    or if it contains itself (e.g. a recursive schema). The order of the keys is kept, since it is the order of 
+    the checks (and thus, it decides which error is raised first).
+    """
+    if isinstance(spec, ValueSpec):
+        return spec._key[1]
+    if type(spec) in (dict, list, tuple, set, frozenset) or isinstance(spec, collections.abc.Mapping):
+        if id(spec) in parents:
+            raise TypeError('A recursive specification cannot be frozen.')
+        parents += (id(spec),)
+    if isinstance(spec, collections.abc.Mapping):
+        return (dict, tuple((key, _freezeSpec(value, parents)) for key, value in spec.items()))
+    if type(spec) in (list, tuple):
+        return (type(spec), tuple(_freezeSpec(value, parents) for value in spec))
+    if type(spec) in (set, frozenset):
+        return (frozenset, frozenset(_freezeSpec(value, parents) for value in spec))
+    hash(spec)
+    return (type(spec), spec)
+
+
+class ValueSpec(collections.abc.Mapping):
+    """
+    An immutable value specification, which is used instead of the equivalent dict e.g. 
+    ValueSpec({'range': [0, 1]}) or ValueSpec(range=[0, 1]). The identical specifications are interned, 
+    i.e. they are the same (shared) object, thus, they are stored only once and their compiled checks 
+    are shared by all the decorated functions. The dict specifications are converted to ValueSpecs when 
+    a function is decorated. Two specifications can be merged with |, e.g. Range(0, 1) | {'command': 'allowNone'}.
+    The specifications are equal if their items are equal, type aware (e.g. Range(0, 1) != Range(0.0, 1.0)), 
+    and in the same order. Their items cannot be changed, i.e. a copy of the nested lists, dicts etc. is returned.
+    """
+    __slots__ = ('_items', '_key', '__weakref__')
+    _interned = weakref.WeakValueDictionary()
+
+    def __new__(cls, *args, **kwargs):
+        return cls._intern(cls._specItems(*args, **kwargs))
+
+    @classmethod
+    def _specItems(cls, spec=None, **items):
+        return dict(spec or {}, **items)
+
+    @classmethod
+    def _intern(cls, items):
+        key  = (cls, _freezeSpec(items))
+        spec = ValueSpec._interned.get(key)
+        if spec is None:
+            spec = object.__new__(cls)
+            spec._items = copy.deepcopy(items) # the specification does not share any mutable part with its caller
+            spec._key   = key
+            spec = ValueSpec._interned.setdefault(key, spec)
+        return spec
+
+    def __getitem__(self, key):
+        value = self._items[key]
+        return value if type(value) in _immutableTypes else copy.deepcopy(value)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __hash__(self):
+        return hash(self._key[1])
+
+    def __eq__(self, other):
+        # consistent with __hash__, thus, e.g. the specifications {'set': [1]} and {'set': [True]} are not equal
+        if isinstance(other, ValueSpec):
+            return self._key[1] == other._key[1]
+        if isinstance(other, collections.abc.Mapping):
+            try:
+                return self._key[1] == _freezeSpec(other)
+            except TypeError:
+                return False
+        return NotImplemented
+
+    def __or__(self, other):
+        return ValueSpec(dict(self._items, **other))
+
+    def __reduce__(self):
+        return (_internedSpec, (type(self), self._items))
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, self._items)
+
+    def valueSpec(self):
+        return copy.deepcopy(self._items)
+
+
+def _internedSpec(cls, items):
+    return cls._intern(items)
+
+
+class Range(ValueSpec):
+    """
+    The value specification of an argument which belongs in [low, high] i.e. {'range': [low, high]}.
+    It can be used with typing.Annotated as well e.g. Annotated[float, Range(1, 10)].
+    """
+    __slots__ = ()
+
+    @classmethod
+    def _specItems(cls, low, high):
+        return {'range': [low, high]}
+
+    @property
+    def low(self):
+        return self._items['range'][0]
+
+    @property
+    def high(self):
+        return self._items['range'][1]
+
+    def __repr__(self):
+        return 'Range({0!r}, {1!r})'.format(self.low, self.high)
+
+
+class MinLength(ValueSpec):
+    """
+    The value specification of a string, a list, a tuple or an array with at least <length> elements, 
+    i.e. {'minLength': length}.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def _specItems(cls, length):
+        return {'minLength': length}
+
+    def __repr__(self):
+        return 'MinLength({0!r})'.format(self._items['minLength'])
+
+
+class OneOf(ValueSpec):
+    """
+    The value specification of an argument which belongs to the given values, i.e. {'set': [values]}.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def _specItems(cls, *values):
+        return {'set': list(values)}
+
+    def __repr__(self):
+        return 'OneOf({0})'.format(', '.join(map(repr, self._items['set'])))
+
+
+_arrayKeys = frozenset(['minLength', 'maxLength', 'rangeLength', 'rangesLength', 'rowsMin', 'rowsMax', 'rowsRange', 
+                        'colsMin', 'colsMax', 'colsRange', 'elemMin', 'elemMax', 'elemRange', 'finite', 'noNaN', 
+                        'monotonic', 'dtype', 'parallel', 'shape', 'contiguous', 'aligned', 'command'])
+# the keys which are meaningful only for the arrays (their presence imports NumPy)
+_arrayOnlyKeys = _arrayKeys - {'minLength', 'maxLength', 'rangeLength', 'rangesLength', 'command'}
+
+
+class ArraySpec(ValueSpec):
+    """
+    The value specification of an np.ndarray e.g. ArraySpec(shape=('N', 3), dtype=np.float64, finite=True).
+    Contrary to the dicts, the unknown keys are rejected.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def _specItems(cls, **items):
+        unknown = set(items) - _arrayKeys
+        if unknown:
+            raise ValueError('Unknown keys of an array specification: {0}.'.format(sorted(unknown)))
+        return items
+
+    def __repr__(self):
+        return 'ArraySpec({0})'.format(', '.join('{0}={1!r}'.format(key, value) for key, value in self._items.items()))
+
+
+def _isSpecMapping(spec):
+    return type(spec) is dict or isinstance(spec, ValueSpec)
+
+
+def _internSpec(spec):
+    # converts a dict value specification to the equivalent interned ValueSpec (if it has no unhashable parts)
+    if type(spec) is not dict:
+        return spec
+    try:
+        return ValueSpec._intern(spec)
+    except TypeError:
+        return spec
+
+
+def _sharedCheck(kind, compile, arg_num, spec, validate_function, sampling=None):
+    """
+    Returns the compiled check of the <spec> of the argument at <arg_num>. The checks of the identical 
+    specifications (at the same position) are compiled only once and they are shared by all the decorated 
+    functions. Thus, they raise errors without a function, which is filled by the ValidationPlan.
+    The checks which depend on the function (e.g. the lazy checks of iterators) or on a Sampling are not shared.
+    """
+    if not internSpecs or sampling is not None or (kind == 'value' and _isStreamSpec(spec)):
+        return compile(arg_num, spec, validate_function, sampling)
+    try:
+        key = (kind, arg_num, _freezeSpec(spec))
+    except TypeError:
+        return compile(arg_num, spec, validate_function, sampling)
+
+    check = _sharedChecks.get(key)
+    if check is None:
+        check = _sharedChecks.setdefault(key, compile(arg_num, spec, None, None))
+    return check
+
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+# SAMPLING
+# --------
+
+class Sampling(object):
+    """
+    The configuration and the counters of the statistical validation mode. Instead of checking every 
+    call of a decorated function, only every Nth call (<every>) and/or a call with probability <probability> 
+    is checked. Additionally, the element-wise checks of large lists, tuples and arrays (i.e. the consistency
+    checks and the array element checks) can be performed on a random subset of <elements> elements.
+
+    The counters report the number of calls (calls), the number of the checked calls (checkedCalls) and 
+    the number of the elements that have been scanned by the element-wise checks (checkedElements).
+    """
+    __slots__ = ('every', 'probability', 'elements', 'calls', 'checkedCalls', 'checkedElements', 'seed', 'random', 'npRandom')
+
+    def __init__(self, every=None, probability=None, elements=None, seed=None):
+        if every is not None and every < 1:
+            raise ValueError('The sampleEvery argument must be a positive integer.')
+        if probability is not None and not 0 <= probability <= 1:
+            raise ValueError('The sampleProbability argument must belong in [0, 1].')
+        if elements is not None and elements < 1:
+            raise ValueError('The sampleElements argument must be a positive integer.')
+
+        self.every       = every
+        self.probability = probability
+        self.elements    = elements
+        self.seed        = seed
+        self.random      = random.Random(seed)
+        self.npRandom    = None # created when the first array is sampled
+        self.reset()
+
+    def reset(self):
+        self.calls           = 0
+        self.checkedCalls    = 0
+        self.checkedElements = 0
+
+    def stats(self):
+        return {'calls': self.calls, 'checkedCalls': self.checkedCalls, 'checkedElements': self.checkedElements}
+
+    def shouldCheck(self):
+        # decides whether the current call is going to be checked or not
+        self.calls += 1
+        if self.every is not None and (self.calls - 1) % self.every != 0:
+            return False
+        if self.probability is not None and self.random.random() >= self.probability:
+            return False
+        self.checkedCalls += 1
+        return True
+
+    def sampleSequence(self, actual_arg):
+        # returns a random subset of the elements of a list or tuple (or the list/tuple itself, if it is small)
+        n = len(actual_arg)
+        if self.elements is None or n <= self.elements:
+            self.checkedElements += n
+            return actual_arg
+
+        self.checkedElements += self.elements
+        return [actual_arg[idx] for idx in self.random.sample(range(n), self.elements)]
+
+    def sampleArray(self, actual_arg):
+        # returns a random subset of the elements of an array, in their original (C) order, 
+        # so as the monotonicity checks to remain meaningful (or the array itself, if it is small)
+        n = actual_arg.size
+        if self.elements is None or n <= self.elements:
+            self.checkedElements += n
+            return actual_arg
+
+        self.checkedElements += self.elements
+        if self.npRandom is None:
+            self.npRandom = np.random.default_rng(self.seed)
+        idx = np.sort(self.npRandom.choice(n, self.elements, replace=False))
+        return actual_arg[np.unravel_index(idx, actual_arg.shape)]
+
+
+def _samplingOf(args_dict):
+    # creates the Sampling of a decorator from its additional arguments (or returns None)
+    options = ('sampleEvery', 'sampleProbability', 'sampleElements')
+    if not any(args_dict.get(option) is not None for option in options):
+        return None
+    return Sampling(args_dict.get('sampleEvery'), args_dict.get('sampleProbability'), args_dict.get('sampleElements'), args_dict.get('sampleSeed'))
+
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+# RESULT CACHE
+# ------------
+
+# only the values of these (immutable) types are cached, since a hashable object could still be 
+# mutated after it has been validated. Any other argument (e.g. a list, a dict or an array) bypasses the cache.
+_cacheableTypes = frozenset((int, float, complex, bool, str, bytes, type(None)))
+
+
+class ValidationCache(object):
+    """
+    A bounded LRU cache of the arguments which have already passed the checks of a decorated function. 
+    The cache is keyed on (argument position, type, value), so as e.g. 1, 1.0 and True to be validated 
+    separately. When a repeated value is found in the cache, its checks are skipped. When the cache is 
+    full, the least recently used value is evicted.
+
+    The counters report the number of the cache hits (hits), the number of the validated values (misses) 
+    and the number of the evicted values (evictions).
+    """
+    __slots__ = ('size', 'entries', 'hits', 'misses', 'evictions')
+
+    def __init__(self, size=128):
+        if size < 1:
+            raise ValueError('The cacheSize argument must be a positive integer.')
+
+        self.size    = size
+        self.entries = collections.OrderedDict()
+        self.reset()
+
+    def reset(self):
+        self.hits      = 0
+        self.misses    = 0
+        self.evictions = 0
+
+    def clear(self):
+        # removes all the cached values (the counters are kept, see reset)
+        self.entries.clear()
+
+    def stats(self):
+        return {'size': self.size, 'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def cachedCheck(self, arg_num, checker):
+        # returns a check which runs <checker> only for the values that are not in the cache
+        if checker is _noCheck:
+            return checker
+
+        entries = self.entries
+        cache   = self
+
+        def check(actual_arg):
+            argType = type(actual_arg)
+            if argType not in _cacheableTypes:
+                checker(actual_arg)
+                return
+
+            key = (arg_num, argType, actual_arg)
+            try:
+                entries.move_to_end(key)
+            except KeyError:
+                pass
+            else:
+                cache.hits += 1
+                return
+
+            cache.misses += 1
+            checker(actual_arg)
+            entries[key] = None
+            if len(entries) > cache.size:
+                entries.popitem(last=False)
+                cache.evictions += 1
+        return check
+
+
+def _cacheOf(args_dict):
+    # creates the ValidationCache of a decorator from its additional arguments (or returns None)
+    if args_dict.get('cacheSize') is None:
+        return None
+    return ValidationCache(args_dict['cacheSize'])
+
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+# TELEMETRY
+# ---------
+
+class Telemetry(object):
+    """
+    The counters of a decorated function, which is decorated with telemetry=True. The telemetry reports:
+        calls                -- the number of the calls
+        failures             -- the number of the calls whose arguments have not been valid
+        validationTime       -- the time (in seconds) spent for checking the arguments
+        functionTime         -- the time (in seconds) spent in the decorated function
+        argumentsTime        -- a dictionary which maps the name of an argument to the time spent for checking it
+        failuresByArgument   -- a dictionary which maps the name of an argument to the number of its failures
+        failuresByConstraint -- a dictionary which maps the code of an error (e.g. 'range') to the number of its failures
+
+    The optional <callback> is called after every call as callback(function, event), where <event> is a 
+    dictionary with the 'validationTime', the 'functionTime' (None if the arguments are invalid) and the 
+    'error' (the ArgumentError or None) of the call. Thus, the telemetry can be pushed into a metrics system.
+
+    NOTE : when telemetry is not requested, the wrappers do not measure anything, so as not to add any overhead.
+    """
+    __slots__ = ('callback', 'calls', 'failures', 'validationTime', 'functionTime', 
+                 'argumentsTime', 'failuresByArgument', 'failuresByConstraint')
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.reset()
+
+    def reset(self):
+        self.calls                = 0
+        self.failures             = 0
+        self.validationTime       = 0.0
+        self.functionTime         = 0.0
+        self.argumentsTime        = collections.Counter()
+        self.failuresByArgument   = collections.Counter()
+        self.failuresByConstraint = collections.Counter()
+
+    def stats(self, slowest=5):
+        # the <slowest> arguments are the ones whose checks have taken the most time in total
+        return {
+            'calls'               : self.calls,
+            'failures'            : self.failures,
+            'validationTime'      : self.validationTime,
+            'functionTime'        : self.functionTime,
+            'failuresByArgument'  : dict(self.failuresByArgument),
+            'failuresByConstraint': dict(self.failuresByConstraint),
+            'slowestArguments'    : self.argumentsTime.most_common(slowest),
+        }
+
+    def timedCheck(self, name, checker):
+        # returns a check which adds the time of <checker> to the time of the argument <name>
+        if checker is _noCheck:
+            return checker
+
+        argumentsTime = self.argumentsTime
+        perf_counter  = time.perf_counter
+
+        def check(actual_arg):
+            start = perf_counter()
+            try:
+                checker(actual_arg)
+            finally:
+                argumentsTime[name] += perf_counter() - start
+        return check
+
+    def record(self, function, validationTime, functionTime, error=None):
+        self.calls          += 1
+        self.validationTime += validationTime
+        if error is None:
+            self.functionTime += functionTime
+        else:
+            self.failures += 1
+            self.failuresByArgument[error.name] += 1
+            self.failuresByConstraint[error.code] += 1
+
+        if self.callback is not None:
+            self.callback(function, {'validationTime': validationTime, 'functionTime': functionTime, 'error': error})
+
+
+def _telemetryOf(args_dict):
+    # creates the Telemetry of a decorator from its additional arguments (or returns None)
+    if not args_dict.get('telemetry') and args_dict.get('telemetryCallback') is None:
+        return None
+    return Telemetry(args_dict.get('telemetryCallback'))
+
 # =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
 # TYPE CHECKS
 # ------------
 
+_missing = object() # a marker for the arguments that have not been given
+
+
+def _noCheck(actual_arg):
+    pass
+
+
+def _typeContainer(types):
+    # the membership test of a frozenset is O(1), contrary to the O(n) of a list.
+    # If the user has given something unhashable, then the list itself is used.
+    try:
+        return frozenset(types)
+    except TypeError:
+        return types
+
+
+class _MixedSet(object):
+    """
+    The members of a 'set' specification which has both hashable and unhashable members (e.g. [1, 2, [3]]). 
+    The hashable members are looked up in a frozenset and only the unhashable ones are scanned.
+    """
+    __slots__ = ('hashed', 'others')
+
+    def __init__(self, hashed, others):
+        self.hashed = frozenset(hashed)
+        self.others = tuple(others)
+
+    def __contains__(self, value):
+        try:
+            if value in self.hashed:
+                return True
+        except TypeError: # an unhashable value can only be equal to an unhashable member
+            pass
+        return value in self.others
+
+
+def _setContainer(vset):
+    # the members of a list or tuple 'set' specification are hashed once, so as the membership test to be 
+    # O(1) instead of O(n). Any other container (e.g. a set, a range or a string) is used as it is.
+    if type(vset) not in (list, tuple):
+        return vset
+    try:
+        return frozenset(vset)
+    except TypeError:
+        hashable = [member for member in vset if isinstance(member, collections.abc.Hashable)]
+        try:
+            return _MixedSet(hashable, [member for member in vset if not isinstance(member, collections.abc.Hashable)])
+        except TypeError: # e.g. a tuple with an unhashable element
+            return vset
+
+
+def _intervals(ranges):
+    """
+    Returns the sorted lower and upper bounds of the union of the closed intervals <ranges> 
+    (e.g. [[1, 5], [10, 20]]), where the overlapping intervals are merged.
+    """
+    lows  = []
+    highs = []
+    for low, high in sorted((rng[0], rng[1]) for rng in ranges):
+        if low > high:
+            raise ValueError('The range {0} of a multi-interval constraint is empty.'.format([low, high]))
+        if highs and low <= highs[-1]:
+            highs[-1] = max(highs[-1], high)
+        else:
+            lows.append(low)
+            highs.append(high)
+    return lows, highs
+
+
+def _chainChecks(checks):
+    checks = tuple(check for check in checks if check is not _noCheck)
+
+    if len(checks) == 0:
+        return _noCheck
+    elif len(checks) == 1:
+        return checks[0]
+
+    def check(actual_arg):
+        for step in checks:
+            step(actual_arg)
+    return check
+
+
 # TODO : change the usage of ObjectConsistencyCheck so as to be passed to each separate input (if needed) 
 #        as a command. Stop using it as a generic flag to start/stop consistency checks globaly.
-def CheckTypes(arg_num, actual_arg, accepted_arg_type, validate_function):
+def CompileTypeCheck(arg_num, accepted_arg_type, validate_function, sampling=None):
     """
-    This is the main way for checking the validity of the inputs TYPES of a function.
+    Parses the TYPE specification of a single argument only once and returns a callable, 
+    which accepts the actual argument and raises a TypeError if it is not valid.
     It can handle types like: int, float, str, bool, list, tuple, dict and others
+    A single type or a list of types is compared with the exact type of the argument (e.g. a bool is not 
+    accepted by [int, float]), while a tuple of types (e.g. (int, float)) and the abstract base classes 
+    (e.g. numbers.Real or collections.abc.Sequence) accept the subclasses as well.
+    The optional <sampling> (see Sampling) is used by the consistency checks of large lists and tuples.
     """
     ObjectConsistencyCheck = False
     DisiredConsistencyTypes = None
-    ArgType = type(actual_arg)
-    ord_num = ordinal(arg_num + 1)
-    
-    if type(accepted_arg_type) is list:
-        # here we check for multiple allowed input types (e.g. a number could be integer of real)
-        if ArgType not in accepted_arg_type:            
-            raise TypeError('The type of the {0} argument of function {1}() does not belong in {2}'.format(ord_num, validate_function.__name__, accepted_arg_type))
-    elif type(accepted_arg_type) is dict:
-        Keys = accepted_arg_type.keys()        
+    ConsistencySubclass = False
+    checks = []
+
+    if _isSpecMapping(accepted_arg_type):
+        Keys = accepted_arg_type.keys()
 
         # check for commands first
         if 'command' in Keys:
@@ -158,229 +919,898 @@ def CheckTypes(arg_num, actual_arg, accepted_arg_type, validate_function):
                         if cmd[key] in [True, False]:
                             ObjectConsistencyCheck = cmd[key]
                     elif key == 'consistencyType' and 'checkConsistency' in cmd:
-                        if type(cmd[key]) is not list:
-                            cmd[key] = [cmd[key]]
-                        DisiredConsistencyTypes = cmd[key]
+                        DisiredConsistencyTypes = cmd[key] if type(cmd[key]) is list else [cmd[key]]
+                    elif key == 'consistencySubclass':
+                        ConsistencySubclass = cmd[key] == True
 
         if 'type' in Keys:
-            accepted_Type = accepted_arg_type['type']
-            if type(accepted_Type) is list:
-                if ArgType not in accepted_Type:            
-                    raise TypeError('The type of the {0} argument of function {1}() does not belong in {2}'.format(ord_num, validate_function.__name__, accepted_Type))
-            else: 
-                if ArgType != accepted_Type:            
-                    raise TypeError('The {0} argument of the function {1}() is not a {2}'.format(ord_num, validate_function.__name__, accepted_Type))
-
-    else: 
-        # here we check if an input belongs to a specific allowed type (e.g. we want the input1 to be an integer value)
-        if ArgType != accepted_arg_type:            
-            raise TypeError('The {0} argument of the function {1}() is not a {2}'.format(ord_num, validate_function.__name__, accepted_arg_type))
+            checks.append(_compileTypeCheck(arg_num, accepted_arg_type['type'], validate_function))
+    else:
+        checks.append(_compileTypeCheck(arg_num, accepted_arg_type, validate_function))
 
     # here, and only for list and tuple variables, we can check for an element-wise type consistency
     # e.g. we want to be sure that a list contains only float numbers
     # NOTE: 
     #  - that the <ObjectConsistencyCheck> flag can disable this check (to disable this feature set ObjectConsistencyCheck = False)
-    #  - currently this check can ensure the consistency of lists or tuples with elements that have int or float types
-    #    NOTE : this check needs to be extended to handle more types
-    if ObjectConsistencyCheck and ArgType in [list, tuple]:  
-        tp = []
-        tpa = tp.append                  
-        [tpa(type(item)) for item in actual_arg if type(item) not in tp]
-
-        if len(tp) > 1:
-            raise TypeError('Each element of the {0} variable must have the same type.'.format(ord_num))
-        elif len(tp) == 1:
-            if DisiredConsistencyTypes is not None:
-                if tp[0] not in DisiredConsistencyTypes:
-                    raise TypeError('Each element of the {0} variable must have the same type. Allowed types: {1}.'.format(ord_num, DisiredConsistencyTypes))            
+    if ObjectConsistencyCheck:
+        checks.append(CompileConsistencyCheck(arg_num, validate_function, DisiredConsistencyTypes, ConsistencySubclass, sampling))
+
+    return _chainChecks(checks)
+
+
+def _elementsTypes(actual_arg):
+    """
+    Returns the set of the types of the elements of a list or tuple, but stops as soon as a second type is found.
+    The elements are scanned in blocks (of increasing size) with set(map(type, ...)), which runs at C speed.
+    """
+    elements = iter(actual_arg)
+    types = set()
+    blockSize = 16
+
+    while True:
+        block = set(map(type, itertools.islice(elements, blockSize)))
+        if len(block) == 0:
+            return types
+
+        types |= block
+        if len(types) > 1:
+            return types
+        blockSize = min(blockSize * 4, 4096)
+
+
+def CompileConsistencyCheck(arg_num, validate_function, DisiredConsistencyTypes=None, ConsistencySubclass=False, sampling=None):
+    """
+    Returns a callable, which checks that all the elements of a list or tuple have the same type 
+    and, optionally, that this type belongs in the <DisiredConsistencyTypes>.
+    If <ConsistencySubclass> is True, or if any of the desired types is abstract (e.g. numbers.Real or 
+    collections.abc.Sequence), then the subclasses of the desired types are accepted as well.
+    The decision for each type of elements is computed once and then it is kept in a cache.
+    If a <sampling> (see Sampling) is given, then only a random subset of the elements of large lists is checked.
+    """
+    acceptsType = None
+
+    if DisiredConsistencyTypes is not None:
+        desired = tuple(DisiredConsistencyTypes)
+        exact   = _typeContainer(desired)
+        subclass = ConsistencySubclass or any(_isAbstract(tp) for tp in desired)
+        decisions = {}
+
+        def cachedDecision(tp):
+            decision = decisions.get(tp)
+            if decision is None:
+                decision = decisions[tp] = issubclass(tp, desired) if subclass else tp in exact
+            return decision
+        acceptsType = cachedDecision
+
+    def consistencyCheck(actual_arg):
+        ArgType = type(actual_arg)
+        if ArgType is list or ArgType is tuple:
+            tp = _elementsTypes(actual_arg if sampling is None else sampling.sampleSequence(actual_arg))
+
+            if len(tp) > 1:
+                raise ArgumentTypeError('consistency', validate_function, arg_num, DisiredConsistencyTypes, tp)
+            elif len(tp) == 1 and acceptsType is not None:
+                ElementType = tp.pop()
+                if not acceptsType(ElementType):
+                    raise ArgumentTypeError('consistencyType', validate_function, arg_num, DisiredConsistencyTypes, ElementType)
+    return consistencyCheck
+
+
+def _isAbstract(tp):
+    # the abstract base classes (e.g. numbers.Real or collections.abc.Sequence) accept their (virtual) subclasses
+    return isinstance(tp, abc.ABCMeta)
+
+
+def _acceptsSubclasses(accepted_Type):
+    # a tuple of types accepts the subclasses of its types (as isinstance does), while a list 
+    # accepts the exact types of its members, apart from the abstract base classes
+    if type(accepted_Type) is tuple:
+        return True
+    if type(accepted_Type) is list:
+        return any(_isAbstract(tp) for tp in accepted_Type)
+    return _isAbstract(accepted_Type)
+
+
+def _compileSubclassCheck(arg_num, accepted_Type, validate_function):
+    # the decision for each type of argument is computed once (the issubclass of an ABC is 
+    # relatively expensive) and then it is kept in a cache, which is owned by the decorated function
+    if type(accepted_Type) is tuple:
+        exact    = frozenset()
+        desired  = accepted_Type
+        message  = 'typeList'
+    elif type(accepted_Type) is list:
+        exact    = frozenset(tp for tp in accepted_Type if not _isAbstract(tp))
+        desired  = tuple(tp for tp in accepted_Type if _isAbstract(tp))
+        message  = 'typeList'
+    else:
+        exact    = frozenset()
+        desired  = accepted_Type
+        message  = 'type'
+    decisions = {}
+
+    def typeCheck(actual_arg):
+        ArgType = type(actual_arg)
+        decision = decisions.get(ArgType)
+        if decision is None:
+            if len(decisions) >= 1024: # e.g. classes that are created dynamically
+                decisions.clear()
+            decision = decisions[ArgType] = ArgType in exact or issubclass(ArgType, desired)
+        if not decision:
+            raise ArgumentTypeError('type', validate_function, arg_num, accepted_Type, actual_arg, message)
+    typeCheck.decisions = decisions
+    return typeCheck
+
+
+def _compileTypeCheck(arg_num, accepted_Type, validate_function):
+    if _acceptsSubclasses(accepted_Type):
+        return _compileSubclassCheck(arg_num, accepted_Type, validate_function)
+
+    if type(accepted_Type) is list:
+        # here we check for multiple allowed input types (e.g. a number could be integer of real)
+        accepted = _typeContainer(accepted_Type)
+
+        def typeCheck(actual_arg):
+            if type(actual_arg) not in accepted:
+                raise ArgumentTypeError('type', validate_function, arg_num, accepted_Type, actual_arg, 'typeList')
+    else: 
+        # here we check if an input belongs to a specific allowed type (e.g. we want the input1 to be an integer value)
+        def typeCheck(actual_arg):
+            if type(actual_arg) != accepted_Type:
+                raise ArgumentTypeError('type', validate_function, arg_num, accepted_Type, actual_arg)
+    return typeCheck
+
+
+def CheckTypes(arg_num, actual_arg, accepted_arg_type, validate_function):
+    """
+    This is the main way for checking the validity of the inputs TYPES of a function.
+    It can handle types like: int, float, str, bool, list, tuple, dict and others
+    """
+    CompileTypeCheck(arg_num, accepted_arg_type, validate_function)(actual_arg)
 
 # =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
 # VALUE CHECKS
 # ------------
 
+# NOTE : the <ord_num> of the following functions is the ordinal number of the argument as a string (e.g. '1st')
+
 def CheckRange(ord_num, value, rng, validate_function, textTemplate):
     if value < rng[0] or value > rng[1]:            
-        raise ValueError('The {0} argument of the function {1}() has {2} out of the accepted range: {3}.'.format(ord_num, validate_function.__name__, textTemplate, rng))
+        raise ArgumentValueError('range', validate_function, None, rng, value, ord=ord_num, text=textTemplate)
 
 
 def CheckMin(ord_num, value, minval, validate_function, textTemplate):
     if value < minval:            
-        raise ValueError('The {0} argument of the function {1}() has lower {2} than the accepted: {3}.'.format(ord_num, validate_function.__name__, textTemplate, minval))
+        raise ArgumentValueError('min', validate_function, None, minval, value, ord=ord_num, text=textTemplate)
 
 
 def CheckMax(ord_num, value, maxval, validate_function, textTemplate):
     if value > maxval:            
-        raise ValueError('The {0} argument of the function {1}() has higher {2} than the accepted: {3}.'.format(ord_num, validate_function.__name__, textTemplate, maxval))
+        raise ArgumentValueError('max', validate_function, None, maxval, value, ord=ord_num, text=textTemplate)
 
 
 def CheckValueInSet(ord_num, value, vset, validate_function):
     if value not in vset:            
-        raise ValueError('The {0} argument of the function {1}() does not belong to the set {2}.'.format(ord_num, validate_function.__name__, vset))
+        raise ArgumentValueError('set', validate_function, None, vset, value, ord=ord_num)
 
 
 def CheckValueNone(ord_num, value, validate_function):
     if value is None:            
-        raise ValueError('The {0} argument of the function {1}() must not be <None>.'.format(ord_num, validate_function.__name__))
+        raise ArgumentValueError('none', validate_function, None, None, value, ord=ord_num)
 
+# the following functions bind a single check (e.g. a range) together with its bounds, once, at decoration time.
+# The <measure> is applied to the actual argument before the check (e.g. len) or, if None, the argument itself is checked.
+# The <Key> of the specification (e.g. 'rangeLength') becomes the code of the raised ArgumentValueError.
+
+def _rangeStep(arg_num, Key, rng, validate_function, textTemplate, measure=None):
+    low, high = rng[0], rng[1]
+
+    if measure is None:
+        def step(value):
+            if value < low or value > high:
+                raise ArgumentValueError(Key, validate_function, arg_num, rng, value, 'range', text=textTemplate)
+    else:
+        def step(actual_arg):
+            value = measure(actual_arg)
+            if value < low or value > high:
+                raise ArgumentValueError(Key, validate_function, arg_num, rng, value, 'range', text=textTemplate)
+    return step
+
+
+def _minStep(arg_num, Key, minval, validate_function, textTemplate, measure=None):
+    if measure is None:
+        def step(value):
+            if value < minval:
+                raise ArgumentValueError(Key, validate_function, arg_num, minval, value, 'min', text=textTemplate)
+    else:
+        def step(actual_arg):
+            value = measure(actual_arg)
+            if value < minval:
+                raise ArgumentValueError(Key, validate_function, arg_num, minval, value, 'min', text=textTemplate)
+    return step
+
+
+def _maxStep(arg_num, Key, maxval, validate_function, textTemplate, measure=None):
+    if measure is None:
+        def step(value):
+            if value > maxval:
+                raise ArgumentValueError(Key, validate_function, arg_num, maxval, value, 'max', text=textTemplate)
+    else:
+        def step(actual_arg):
+            value = measure(actual_arg)
+            if value > maxval:
+                raise ArgumentValueError(Key, validate_function, arg_num, maxval, value, 'max', text=textTemplate)
+    return step
+
+
+def _setStep(arg_num, vset, validate_function):
+    members = _setContainer(vset)
+
+    def step(value):
+        if value not in members:
+            raise ArgumentValueError('set', validate_function, arg_num, vset, value)
+    return step
+
+
+def _rangesStep(arg_num, Key, ranges, validate_function, textTemplate, measure=None):
+    lows, highs = _intervals(ranges)
+
+    def step(actual_arg):
+        value = actual_arg if measure is None else measure(actual_arg)
+        # the last interval which starts before (or at) the value is the only one which could contain it
+        idx = bisect.bisect_right(lows, value) - 1
+        if idx < 0 or value > highs[idx] or value != value: # NOTE : value != value for NaN
+            raise ArgumentValueError(Key, validate_function, arg_num, ranges, value, 'ranges', text=textTemplate)
+    return step
+
+
+# the measures of the arrays are taken from their (normalized) shapes, see CompileArrayCheck
+def _rows(arg_shape):
+    return arg_shape[0]
+
+
+def _cols(arg_shape):
+    return arg_shape[1]
 
-def CheckNumber(arg_num, actual_arg, accepted_arg_types, validate_function):
-    accepted_arg_type = accepted_arg_types[arg_num]
-    Keys = accepted_arg_type.keys()
-    ord_num = ordinal(arg_num + 1)
 
+def _compileCommands(arg_num, accepted_arg_type, validate_function, steps):
     # check for commands first
-    if 'command' in Keys:
-        cmd = accepted_arg_type['command']
-        if cmd == 'noCheck':
-            return
-        elif cmd == 'allowNone':
-            if actual_arg is None:
+    cmd = accepted_arg_type.get('command')
+    if cmd == 'noCheck':
+        return _noCheck
+
+    allowNone = cmd == 'allowNone'
+    steps = tuple(steps)
+
+    def check(actual_arg):
+        if actual_arg is None:
+            if allowNone:
                 return
+            raise ArgumentValueError('none', validate_function, arg_num)
 
-    CheckValueNone(ord_num, actual_arg, validate_function)
-    
-    for Key in Keys:
-        checkVal = accepted_arg_type[Key]
+        for step in steps:
+            step(actual_arg)
+    return check
 
+
+def CompileNumberCheck(arg_num, accepted_arg_type, validate_function):
+    steps = []
+
+    for Key, checkVal in accepted_arg_type.items():
         if Key == 'range':
-            CheckRange(ord_num, actual_arg, checkVal, validate_function, 'value')
+            steps.append(_rangeStep(arg_num, Key, checkVal, validate_function, 'value'))
 
         elif Key == 'minValue':
-            CheckMin(ord_num, actual_arg, checkVal, validate_function, 'value')
+            steps.append(_minStep(arg_num, Key, checkVal, validate_function, 'value'))
 
         elif Key == 'maxValue':
-            CheckMax(ord_num, actual_arg, checkVal, validate_function, 'value')
-
-        elif Key == 'set':
-            CheckValueInSet(ord_num, actual_arg, checkVal, validate_function)
+            steps.append(_maxStep(arg_num, Key, checkVal, validate_function, 'value'))
 
+        elif Key == 'ranges':
+            steps.append(_rangesStep(arg_num, Key, checkVal, validate_function, 'value'))
 
-def CheckString(arg_num, actual_arg, accepted_arg_types, validate_function):
-    accepted_arg_type = accepted_arg_types[arg_num]
-    Keys = accepted_arg_type.keys()
-    ord_num = ordinal(arg_num + 1)
+        elif Key == 'set':
+            steps.append(_setStep(arg_num, checkVal, validate_function))
 
-    # check for commands first
-    if 'command' in Keys:
-        cmd = accepted_arg_type['command']
-        if cmd == 'noCheck':
-            return
-        elif cmd == 'allowNone':
-            if actual_arg is None:
-                return
+    return _compileCommands(arg_num, accepted_arg_type, validate_function, steps)
 
-    CheckValueNone(ord_num, actual_arg, validate_function)
 
-    for Key in Keys:
-        checkVal = accepted_arg_type[Key]
+def CompileStringCheck(arg_num, accepted_arg_type, validate_function):
+    steps = []
 
+    for Key, checkVal in accepted_arg_type.items():
         if Key == 'minLength':
-            CheckMin(ord_num, len(actual_arg), checkVal, validate_function, 'length')
+            steps.append(_minStep(arg_num, Key, checkVal, validate_function, 'length', len))
 
         elif Key == 'maxLength':
-            CheckMax(ord_num, len(actual_arg), checkVal, validate_function, 'length')
+            steps.append(_maxStep(arg_num, Key, checkVal, validate_function, 'length', len))
 
         elif Key == 'rangeLength':
-            CheckRange(ord_num, len(actual_arg), checkVal, validate_function, 'length')
+            steps.append(_rangeStep(arg_num, Key, checkVal, validate_function, 'length', len))
+
+        elif Key == 'rangesLength':
+            steps.append(_rangesStep(arg_num, Key, checkVal, validate_function, 'length', len))
         
         elif Key == 'set':
-            CheckValueInSet(ord_num, actual_arg, checkVal, validate_function)
+            steps.append(_setStep(arg_num, checkVal, validate_function))
 
+    return _compileCommands(arg_num, accepted_arg_type, validate_function, steps)
 
-def CheckObject(arg_num, actual_arg, accepted_arg_types, validate_function):
-    accepted_arg_type = accepted_arg_types[arg_num]
-    Keys = accepted_arg_type.keys()
-    ord_num = ordinal(arg_num + 1)
 
-    # check for commands first
-    if 'command' in Keys:
-        cmd = accepted_arg_type['command']
-        if cmd == 'noCheck':
-            return
-        elif cmd == 'allowNone':
-            if actual_arg is None:
-                return
-
-    CheckValueNone(ord_num, actual_arg, validate_function)
-    
-    for Key in Keys:
-        checkVal = accepted_arg_type[Key]
+def CompileObjectCheck(arg_num, accepted_arg_type, validate_function):
+    steps = []
 
+    for Key, checkVal in accepted_arg_type.items():
         if Key == 'minLength':
-            CheckMin(ord_num, len(actual_arg), checkVal, validate_function, 'length')
+            steps.append(_minStep(arg_num, Key, checkVal, validate_function, 'length', len))
 
         elif Key == 'maxLength':
-            CheckMax(ord_num, len(actual_arg), checkVal, validate_function, 'length')
+            steps.append(_maxStep(arg_num, Key, checkVal, validate_function, 'length', len))
 
         elif Key == 'rangeLength':
-            CheckRange(ord_num, len(actual_arg), checkVal, validate_function, 'length')
+            steps.append(_rangeStep(arg_num, Key, checkVal, validate_function, 'length', len))
+
+        elif Key == 'rangesLength':
+            steps.append(_rangesStep(arg_num, Key, checkVal, validate_function, 'length', len))
+
+    return _compileCommands(arg_num, accepted_arg_type, validate_function, steps)
+
+
+# the number of elements of an array that are checked at once by the element-wise checks (e.g. elemRange)
+arrayChunkSize = 2 ** 16
+
+
+# the memory-mapped arrays (np.memmap) are scanned through separate mappings of their files, of at most 
+# <memmapWindowSize> bytes each, which are released as soon as they have been checked. Thus, the pages of 
+# a multi-gigabyte file are not kept in memory by the checks. The verdicts of the element-wise checks of the 
+# read only memmaps are cached (up to <memmapVerdictsSize> per argument), keyed on the file (path, modification 
+# time and size) and the position of the array in it (offset, shape and dtype), so as passing the same 
+# mapping again to be checked with a single os.stat. The files which have been modified during the last 
+# <memmapRecentInterval> seconds are not cached, since the modification time has a coarse resolution and 
+# it may be the same before and after a write.
+memmapWindowSize      = 2 ** 26
+memmapVerdictsSize    = 128
+memmapRecentInterval  = 2.0
+
+
+def _memmapSource(actual_arg):
+    # returns the (path, offset) of a memmap, if its elements can be read through separate windows, or None.
+    # Only the memmaps which have been created by np.memmap (not their views) know their offset in the file, 
+    # while the private changes of a copy-on-write memmap (mode 'c') are not visible to other mappings.
+    if type(actual_arg) is not np.memmap or not isinstance(actual_arg.base, mmap.mmap):
+        return None
+    if actual_arg.filename is None or actual_arg.mode == 'c' or not actual_arg.flags.c_contiguous:
+        return None
+    return actual_arg.filename, actual_arg.offset
+
+
+def _memmapWindows(actual_arg, source):
+    # yields consecutive windows of the elements of a memmap (in C order), each one mapped separately
+    filename, offset = source
+    itemsize = actual_arg.itemsize
+    step = max(1, memmapWindowSize // itemsize)
+
+    for start in range(0, actual_arg.size, step):
+        count = min(step, actual_arg.size - start)
+        yield np.memmap(filename, dtype=actual_arg.dtype, mode='r', offset=offset + start * itemsize, shape=(count,))
+
+
+def _memmapKey(actual_arg, source):
+    # the key of the verdicts cache, or None if the file cannot be examined (or if it has been modified recently)
+    filename, offset = source
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    if time.time_ns() - stat.st_mtime_ns < memmapRecentInterval * 1e9:
+        return None
+    return (filename, offset, actual_arg.shape, actual_arg.dtype.str, stat.st_mtime_ns, stat.st_size)
+
+
+def _arrayChunks(actual_arg, chunkSize):
+    # yields views of consecutive parts of the array (in C order), of at most <chunkSize> elements
+    source = _memmapSource(actual_arg)
+    if source is not None:
+        for window in _memmapWindows(actual_arg, source):
+            for start in range(0, window.size, chunkSize):
+                yield window[start:start + chunkSize]
+            del window # the window is unmapped as soon as its last chunk is released
+        return
+
+    if actual_arg.ndim <= 1 or actual_arg.flags.c_contiguous:
+        flat = actual_arg.reshape(-1)
+        for start in range(0, flat.size, chunkSize):
+            yield flat[start:start + chunkSize]
+    else:
+        # a non contiguous array cannot be flattened without a copy, thus, it is split into blocks of rows
+        rowSize = max(1, actual_arg[0].size)
+        rows = max(1, chunkSize // rowSize)
+        for start in range(0, actual_arg.shape[0], rows):
+            yield actual_arg[start:start + rows]
+
+
+# the parallel mode of the element-wise checks (see the 'parallel' key of the array specifications). 
+# An array is split into (at most) <parallelWorkers> parts, of at least <parallelMinChunkSize> elements, 
+# which are checked by a shared thread pool (numpy releases the GIL during the reductions).
+# The arrays with less than 2 * parallelMinChunkSize elements are always checked by the calling thread.
+parallelWorkers      = os.cpu_count() or 1
+parallelMinChunkSize = 2 ** 20
+
+_parallelLock = threading.RLock()
+_parallelPool = (None, 0) # (executor, number of workers)
+
+
+def _parallelExecutor():
+    # returns the shared thread pool, which is (re)created if the <parallelWorkers> has changed. The previous 
+    # thread pool is shut down while the lock is held, thus, the callers which submit their tasks while holding 
+    # the lock as well (see _runParallel) never submit to a shut down pool, while their already submitted tasks 
+    # are still completed (the shutdown does not cancel them)
+    global _parallelPool
+    import concurrent.futures # imported here, as asyncio as well, since most of the programs never need it
+
+    with _parallelLock:
+        executor, workers = _parallelPool
+        if executor is None or workers != parallelWorkers:
+            if executor is not None:
+                executor.shutdown(wait=False)
+            executor = concurrent.futures.ThreadPoolExecutor(parallelWorkers, thread_name_prefix='InputCheck')
+            _parallelPool = (executor, parallelWorkers)
+        return executor
+
+
+def _parallelParts(actual_arg):
+    # returns the parts of an array which are checked in parallel, or None if the array is too small
+    workers = parallelWorkers
+    if workers < 2 or actual_arg.size < 2 * parallelMinChunkSize or _memmapSource(actual_arg) is not None:
+        return None
+    partSize = max(parallelMinChunkSize, -(-actual_arg.size // workers))
+    return list(_arrayChunks(actual_arg, partSize))
+
+
+def _runParallel(scan, parts):
+    """
+    Runs scan(part, cancelled) for each part on the shared thread pool. As soon as a part fails, the parts 
+    which have not started yet are cancelled and the running ones stop at their next chunk (<cancelled> 
+    is a threading.Event). The exception of the first (in order) failed part is raised.
+    """
+    import concurrent.futures
+    cancelled = threading.Event()
+    with _parallelLock:
+        executor = _parallelExecutor()
+        futures  = [executor.submit(scan, part, cancelled) for part in parts]
 
+    done, pending = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+    if pending:
+        cancelled.set()
+        for future in pending:
+            future.cancel()
+        concurrent.futures.wait(pending)
 
-def CheckArray(arg_num, actual_arg, accepted_arg_types, validate_function):
-    accepted_arg_type = accepted_arg_types[arg_num]
-    Keys = accepted_arg_type.keys()
-    ord_num = ordinal(arg_num + 1)
+    for future in futures:
+        if not future.cancelled() and future.exception() is not None:
+            raise future.exception()
 
-    # check for commands first
-    if 'command' in Keys:
-        cmd = accepted_arg_type['command']
-        if cmd == 'noCheck':
-            return
-        elif cmd == 'allowNone':
-            if actual_arg is None: # the None values are allowed here: if None then do no checks
+
+def _compileDtypeCheck(arg_num, accepted_arg_type, validate_function):
+    if 'dtype' not in accepted_arg_type:
+        return None
+
+    accepted_dtypes = accepted_arg_type['dtype']
+    if type(accepted_dtypes) is not list:
+        accepted_dtypes = [accepted_dtypes]
+    dtypes = frozenset(np.dtype(dtype) for dtype in accepted_dtypes)
+
+    def dtypeCheck(actual_arg):
+        if actual_arg.dtype not in dtypes:
+            raise ArgumentValueError('dtype', validate_function, arg_num, accepted_dtypes, actual_arg.dtype)
+    return dtypeCheck
+
+
+def _isShapeSymbol(item):
+    return type(item) is str and item not in ('*', '...')
+
+
+def _compileShapeMatch(pattern):
+    """
+    Parses a shape pattern only once and returns a callable, which accepts the shape of an array and 
+    returns the list of (item, size) pairs of the pattern's dimensions (excluding the wildcards), or 
+    None if the number of dimensions of the array does not match the pattern. The items of a pattern can be:
+        an int      -- the exact size of a dimension
+        a str       -- a named (symbolic) dimension e.g. 'N', which is bound to the size of the dimension
+        None or '*' -- a dimension of any size
+        ... or '...' -- any number of dimensions (at most once per pattern)
+    """
+    items = tuple('...' if item is Ellipsis else item for item in pattern)
+    for item in items:
+        if not (item is None or type(item) is int or type(item) is str):
+            raise ValueError('Invalid item {0!r} in the shape pattern {1}.'.format(item, pattern))
+    if items.count('...') > 1:
+        raise ValueError('The shape pattern {0} has more than one ellipsis.'.format(pattern))
+
+    def pairs(part, offset):
+        return tuple((axis + offset, item) for axis, item in enumerate(part) if item is not None and item != '*')
+
+    if '...' in items:
+        split = items.index('...')
+        head  = pairs(items[:split], 0)
+        tail  = items[split + 1:]
+        minDims = len(items) - 1
+
+        def match(arg_shape):
+            ndims = len(arg_shape)
+            if ndims < minDims:
+                return None
+            return [(item, arg_shape[axis]) for axis, item in head + pairs(tail, ndims - len(tail))]
+    else:
+        fixed = pairs(items, 0)
+        ndims = len(items)
+
+        def match(arg_shape):
+            if len(arg_shape) != ndims:
+                return None
+            return [(item, arg_shape[axis]) for axis, item in fixed]
+    return match
+
+
+def _compileShapeCheck(arg_num, accepted_arg_type, validate_function):
+    # checks the number of dimensions, the exact sizes and the symbols which are repeated within 
+    # the same argument (e.g. ('N', 'N')), while the symbols of different arguments are bound by the plan
+    if 'shape' not in accepted_arg_type:
+        return None
+
+    pattern = accepted_arg_type['shape']
+    match   = _compileShapeMatch(pattern)
+
+    def shapeCheck(actual_arg):
+        arg_shape = actual_arg.shape
+        dims = match(arg_shape)
+        if dims is None:
+            raise ArgumentValueError('shape', validate_function, arg_num, pattern, arg_shape)
+
+        symbols = None
+        for item, size in dims:
+            if type(item) is int:
+                if size != item:
+                    raise ArgumentValueError('shape', validate_function, arg_num, pattern, arg_shape)
+            else:
+                if symbols is None:
+                    symbols = {}
+                if symbols.setdefault(item, size) != size:
+                    raise ArgumentValueError('shape', validate_function, arg_num, pattern, arg_shape)
+    return shapeCheck
+
+
+def _compileLayoutCheck(arg_num, accepted_arg_type, validate_function):
+    # the memory layout of an array: the contiguity and the alignment of its data
+    contiguous = accepted_arg_type.get('contiguous', False)
+    aligned    = accepted_arg_type.get('aligned', False)
+    if contiguous not in (False, True, 'C', 'F'):
+        raise ValueError("The 'contiguous' check accepts the values: True, 'C' and 'F'.")
+    if contiguous == False and aligned == False:
+        return None
+
+    if aligned == True:
+        alignText = ''
+    elif aligned != False:
+        alignText = ' to {0} bytes'.format(aligned)
+    contiguousText = 'C or F' if contiguous is True else contiguous
+
+    def layoutCheck(actual_arg):
+        flags = actual_arg.flags
+        if contiguous is not False:
+            if not (flags.c_contiguous if contiguous == 'C' else flags.f_contiguous if contiguous == 'F' else flags.c_contiguous or flags.f_contiguous):
+                raise ArgumentValueError('contiguous', validate_function, arg_num, contiguous, None, text=contiguousText)
+        if aligned is True:
+            if not flags.aligned:
+                raise ArgumentValueError('aligned', validate_function, arg_num, aligned, None, text=alignText)
+        elif aligned is not False:
+            address = actual_arg.__array_interface__['data'][0]
+            if address % aligned != 0:
+                raise ArgumentValueError('aligned', validate_function, arg_num, aligned, address, text=alignText)
+    return layoutCheck
+
+
+def CompileShapeBindings(valueSpecs, validate_function):
+    """
+    Returns a callable, which binds the named dimensions of the 'shape' patterns of all the arguments of a 
+    call in a single pass (e.g. x: ('N', 'C') and w: ('C',)) and raises a ValueError if a dimension has 
+    different sizes in different arguments. The callable accepts the actual arguments, indexed by their 
+    positions. If no named dimension is shared by two or more arguments, then None is returned.
+    """
+    patterns = []
+    users = collections.Counter()
+    for arg_num, accepted_arg_type in enumerate(valueSpecs):
+        if not _isSpecMapping(accepted_arg_type) or 'shape' not in accepted_arg_type or accepted_arg_type.get('command') == 'noCheck':
+            continue
+        pattern = accepted_arg_type['shape']
+        symbols = set(item for item in pattern if _isShapeSymbol(item))
+        if symbols:
+            patterns.append((arg_num, pattern, _compileShapeMatch(pattern)))
+            users.update(symbols)
+
+    if not any(count > 1 for count in users.values()):
+        return None
+    patterns = tuple(patterns)
+    _numpyAvailable(required=True)
+    arrays   = tuple(arrayType)
+
+    def bindShapes(actual_args):
+        bound = {}
+        for arg_num, pattern, match in patterns:
+            actual_arg = actual_args[arg_num]
+            if not isinstance(actual_arg, arrays):
+                continue
+            dims = match(actual_arg.shape)
+            if dims is None: # e.g. the checks of the argument have been skipped
+                continue
+            for item, size in dims:
+                if type(item) is int:
+                    continue
+                previous = bound.setdefault(item, (size, arg_num))
+                if previous[0] != size:
+                    raise ArgumentValueError('shapeSymbol', validate_function, arg_num, pattern, actual_arg.shape, 
+                                             symbol=item, size=previous[0], bound=ordinal(previous[1] + 1))
+    return bindShapes
+
+
+_monotonicComparisons = {
+    True                 : ('greater_equal', 'monotonically increasing'),
+    'increasing'         : ('greater_equal', 'monotonically increasing'),
+    'decreasing'         : ('less_equal',    'monotonically decreasing'),
+    'strictlyIncreasing' : ('greater',       'strictly increasing'),
+    'strictlyDecreasing' : ('less',          'strictly decreasing'),
+}
+
+
+def _compileElementsCheck(arg_num, accepted_arg_type, validate_function, sampling=None):
+    """
+    Compiles the element-wise checks of an array (elemRange, elemMin, elemMax, finite, noNaN and monotonic). 
+    All the checks are performed in a single pass over chunks of the array (see arrayChunkSize), using only 
+    reductions (e.g. np.minimum.reduce) which do not allocate temporary arrays, and stop at the first invalid chunk.
+    If the specification has 'parallel': True, then the large arrays are checked in parallel (see parallelWorkers).
+    """
+    rng    = accepted_arg_type.get('elemRange')
+    minval = accepted_arg_type.get('elemMin')
+    maxval = accepted_arg_type.get('elemMax')
+    finite = accepted_arg_type.get('finite') == True
+    noNaN  = accepted_arg_type.get('noNaN') == True or finite
+    monotonic = accepted_arg_type.get('monotonic', False)
+    parallel  = accepted_arg_type.get('parallel') == True
+
+    if monotonic not in _monotonicComparisons and monotonic != False:
+        raise ValueError("The 'monotonic' check accepts the values: {0}.".format(list(_monotonicComparisons)))
+    compare, monotonicText = _monotonicComparisons.get(monotonic, (None, None))
+    if compare is not None:
+        compare = getattr(np, compare)
+
+    low  = [value for value in (minval, None if rng is None else rng[0]) if value is not None]
+    high = [value for value in (maxval, None if rng is None else rng[1]) if value is not None]
+    needMin = len(low) > 0 or noNaN
+    needMax = len(high) > 0 or finite
+
+    if not (needMin or needMax or compare is not None):
+        return None
+
+    def scan(actual_arg, isVector, cancelled=None):
+        canBeNaN = actual_arg.dtype.kind in 'fcO'
+        previous = None
+
+        for chunk in _arrayChunks(actual_arg, arrayChunkSize):
+            if chunk.size == 0:
+                continue
+            if cancelled is not None and cancelled.is_set(): # another part has already failed
                 return
 
-    # if the value is None then raise an ValueError exception
-    CheckValueNone(ord_num, actual_arg, validate_function)
-
-    arg_shape = actual_arg.shape
-    ndims = len(arg_shape)
-    if ndims > 2: # currently only arrays up to 2 dimensions are supported
-        raise ValueError(f"""The {ord_num} variable of function {validate_function.__name__}() has more than 2 dimensions. Currently only 1D and 2D arrays are supported. If the usage of a high dimensional array is in your intension, then it is suggested to deactivate the value check for this input by using this parameter:""" + "{'noCheck': ''}")                     
-    elif ndims == 2:
-        # if 2D array has shape (1, N) or (N, 1) then turn it to a column vector (N, 1)
-        if 1 in arg_shape:
-            ndims = 1
-            L = np.max(arg_shape)
-            actual_arg.resize((L, 1))
-            arg_shape = actual_arg.shape
-    
-    for Key in Keys:
-        # the minLength, maxLength and rangeLength params can deal only with vector like arrays of shape: (N, 1), (1, N) & (N,)
-        checkVal = accepted_arg_type[Key]
+            if needMin:
+                mn = np.minimum.reduce(chunk, axis=None) # NaN if any of the elements is NaN
+                if canBeNaN and mn != mn:
+                    if noNaN:
+                        raise ArgumentValueError('noNaN', validate_function, arg_num, True, np.nan)
+                    mn = np.fmin.reduce(chunk, axis=None) # ignores the NaN elements
+                if finite and mn == -np.inf:
+                    raise ArgumentValueError('finite', validate_function, arg_num, True, mn)
+                if minval is not None and mn < minval:
+                    raise ArgumentValueError('elemMin', validate_function, arg_num, minval, mn, 'min', text='elements')
+                if rng is not None and mn < rng[0]:
+                    raise ArgumentValueError('elemRange', validate_function, arg_num, rng, mn, 'range', text='elements')
+
+            if needMax:
+                mx = np.fmax.reduce(chunk, axis=None) if canBeNaN else np.maximum.reduce(chunk, axis=None)
+                if finite and mx == np.inf:
+                    raise ArgumentValueError('finite', validate_function, arg_num, True, mx)
+                if maxval is not None and mx > maxval:
+                    raise ArgumentValueError('elemMax', validate_function, arg_num, maxval, mx, 'max', text='elements')
+                if rng is not None and mx > rng[1]:
+                    raise ArgumentValueError('elemRange', validate_function, arg_num, rng, mx, 'range', text='elements')
+
+            # the monotonicity can be checked only for vector like arrays of shape: (N, 1), (1, N) & (N,)
+            if compare is not None and isVector:
+                chunk = chunk.reshape(-1)
+                if (previous is not None and not compare(chunk[0], previous)) or not compare(chunk[1:], chunk[:-1]).all():
+                    raise ArgumentValueError('monotonic', validate_function, arg_num, monotonic, None, text=monotonicText)
+                previous = chunk[-1]
+
+    verdicts = collections.OrderedDict() # the already checked read only memmaps
+    verdictsLock = threading.Lock() # the check may be shared by many functions (see _sharedCheck) and threads
+
+    def elementsCheck(actual_arg, isVector):
+        if sampling is not None:
+            actual_arg = sampling.sampleArray(actual_arg)
+        elif type(actual_arg) is np.memmap and actual_arg.mode == 'r':
+            source = _memmapSource(actual_arg)
+            key = None if source is None else _memmapKey(actual_arg, source)
+            if key is not None:
+                with verdictsLock:
+                    if key in verdicts:
+                        verdicts.move_to_end(key)
+                        return
+                scan(actual_arg, isVector) # without the lock, since it may take long
+                with verdictsLock:
+                    verdicts[key] = True
+                    verdicts.move_to_end(key)
+                    if len(verdicts) > memmapVerdictsSize:
+                        verdicts.popitem(last=False)
+                return
 
-        if ndims == 1:
-            if Key == 'minLength':
-                CheckMin(ord_num, len(actual_arg), checkVal, validate_function, 'length')
+        parts = _parallelParts(actual_arg) if parallel else None
+        if parts is None:
+            scan(actual_arg, isVector)
+            return
+
+        _runParallel(lambda part, cancelled: scan(part, isVector, cancelled), parts)
+
+        # the monotonicity between the consecutive parts
+        if compare is not None and isVector:
+            for previous, part in zip(parts, parts[1:]):
+                if part.size > 0 and previous.size > 0 and not compare(part.reshape(-1)[0], previous.reshape(-1)[-1]):
+                    raise ArgumentValueError('monotonic', validate_function, arg_num, monotonic, None, text=monotonicText)
+
+    elementsCheck.verdicts = verdicts
+    return elementsCheck
 
-            elif Key == 'maxLength':
-                CheckMax(ord_num, len(actual_arg), checkVal, validate_function, 'length')
 
-            elif Key == 'rangeLength':
-                CheckRange(ord_num, len(actual_arg), checkVal, validate_function, 'length')
+def CompileArrayCheck(arg_num, accepted_arg_type, validate_function, sampling=None):
+    lengthSteps = [] # the minLength, maxLength and rangeLength params can deal only with vector like arrays of shape: (N, 1), (1, N) & (N,)
+    shapeSteps  = []
+
+    for Key, checkVal in accepted_arg_type.items():
+        if Key == 'minLength':
+            lengthSteps.append(_minStep(arg_num, Key, checkVal, validate_function, 'length', _rows))
+
+        elif Key == 'maxLength':
+            lengthSteps.append(_maxStep(arg_num, Key, checkVal, validate_function, 'length', _rows))
+
+        elif Key == 'rangeLength':
+            lengthSteps.append(_rangeStep(arg_num, Key, checkVal, validate_function, 'length', _rows))
+
+        elif Key == 'rangesLength':
+            lengthSteps.append(_rangesStep(arg_num, Key, checkVal, validate_function, 'length', _rows))
+
+        elif Key == 'rowsMin':
+            shapeSteps.append(_minStep(arg_num, Key, checkVal, validate_function, 'number of rows', _rows))
+
+        elif Key == 'rowsMax':
+            shapeSteps.append(_maxStep(arg_num, Key, checkVal, validate_function, 'number of rows', _rows))
+
+        elif Key == 'rowsRange':
+            shapeSteps.append(_rangeStep(arg_num, Key, checkVal, validate_function, 'number of rows', _rows))
+
+        elif Key == 'colsMin':
+            shapeSteps.append(_minStep(arg_num, Key, checkVal, validate_function, 'number of columns', _cols))
+
+        elif Key == 'colsMax':
+            shapeSteps.append(_maxStep(arg_num, Key, checkVal, validate_function, 'number of columns', _cols))
+
+        elif Key == 'colsRange':
+            shapeSteps.append(_rangeStep(arg_num, Key, checkVal, validate_function, 'number of columns', _cols))
+
+    lengthSteps   = tuple(lengthSteps)
+    shapeSteps    = tuple(shapeSteps)
+    dtypeStep     = _compileDtypeCheck(arg_num, accepted_arg_type, validate_function)
+    shapeStep     = _compileShapeCheck(arg_num, accepted_arg_type, validate_function)
+    layoutStep    = _compileLayoutCheck(arg_num, accepted_arg_type, validate_function)
+    elementsCheck = _compileElementsCheck(arg_num, accepted_arg_type, validate_function, sampling)
+
+    def arrayCheck(actual_arg):
+        arg_shape = actual_arg.shape
+        ndims = len(arg_shape)
+        if shapeStep is not None: # a shape pattern accepts arrays of any number of dimensions
+            shapeStep(actual_arg)
+        elif ndims > 2: # currently only arrays up to 2 dimensions are supported, unless a shape pattern is given
+            raise ArgumentValueError('dimensions', validate_function, arg_num, 2, ndims)
+        elif ndims == 2:
+            # if 2D array has shape (1, N) or (N, 1) then it is measured as a column vector (N, 1)
+            # NOTE : only the shape is normalized, the argument itself is never reshaped, copied or resized
+            if 1 in arg_shape:
+                ndims = 1
+                arg_shape = (max(arg_shape), 1)
+
+        if ndims == 1:
+            for step in lengthSteps:
+                step(arg_shape)
 
         if ndims == 1 or ndims == 2:
-            if Key == 'rowsMin':
-                CheckMin(ord_num, actual_arg.shape[0], checkVal, validate_function, 'number of rows')
+            for step in shapeSteps:
+                step(arg_shape)
 
-            elif Key == 'rowsMax':
-                CheckMax(ord_num, actual_arg.shape[0], checkVal, validate_function, 'number of rows')
+        if dtypeStep is not None:
+            dtypeStep(actual_arg)
 
-            elif Key == 'rowsRange':
-                CheckRange(ord_num, actual_arg.shape[0], checkVal, validate_function, 'number of rows')
+        if layoutStep is not None:
+            layoutStep(actual_arg)
 
-            elif Key == 'colsMin':
-                CheckMin(ord_num, actual_arg.shape[1], checkVal, validate_function, 'number of columns')
+        if elementsCheck is not None:
+            elementsCheck(actual_arg, ndims == 1)
 
-            elif Key == 'colsMax':
-                CheckMax(ord_num, actual_arg.shape[1], checkVal, validate_function, 'number of columns')
+    return _compileCommands(arg_num, accepted_arg_type, validate_function, [arrayCheck])
 
-            elif Key == 'colsRange':
-                CheckRange(ord_num, actual_arg.shape[1], checkVal, validate_function, 'number of columns')
 
-    # this case has been managed earlier
-    # elif ndims > 2:
-    #     pass
+def CompileValueCheck(arg_num, accepted_arg_type, validate_function, sampling=None):
+    """
+    Parses the VALUE specification of a single argument only once and returns a callable, 
+    which accepts the actual argument and raises a ValueError if it is not valid.
+    The type of the actual argument selects which of the compiled number, string, object
+    or array checks is going to be applied.
+    The optional <sampling> (see Sampling) is used by the element-wise checks of large arrays.
+    An 'iterOf' or a 'maxItems' specification is checked by CompileStreamCheck and a 'schema' by CompileSchemaCheck.
+    """
+    if _isSchemaSpec(accepted_arg_type):
+        return CompileSchemaCheck(arg_num, accepted_arg_type, validate_function, sampling)
+    if _isStreamSpec(accepted_arg_type):
+        return CompileStreamCheck(arg_num, accepted_arg_type, validate_function, sampling)
+
+    number = CompileNumberCheck(arg_num, accepted_arg_type, validate_function)
+    string = CompileStringCheck(arg_num, accepted_arg_type, validate_function)
+    obj    = CompileObjectCheck(arg_num, accepted_arg_type, validate_function)
+    array  = CompileArrayCheck(arg_num, accepted_arg_type, validate_function, sampling)
+
+    # the arrays are dispatched as soon as NumPy is imported (see _numpyAvailable)
+    arraysPending = array is not _noCheck and not _numpyAvailable(required=not _arrayOnlyKeys.isdisjoint(accepted_arg_type))
+
+    dispatch = {}
+    if not arraysPending:
+        for tp in arrayType:
+            dispatch[tp] = array
+    for tp in objectTypes:
+        dispatch[tp] = obj
+    for tp in stringTypes:
+        dispatch[tp] = string
+    for tp in numberTypes + noneTypes:
+        dispatch[tp] = number
+
+    # there is no need to keep the types that are not going to be checked
+    dispatch = {tp: check for tp, check in dispatch.items() if check is not _noCheck}
+    if len(dispatch) == 0 and not arraysPending:
+        return _noCheck
+
+    getCheck = dispatch.get
+
+    def check(actual_arg):
+        nonlocal arraysPending
+        valueCheck = getCheck(type(actual_arg))
+        if valueCheck is not None:
+            valueCheck(actual_arg)
+        elif arraysPending and _numpyAvailable():
+            for tp in arrayType:
+                dispatch[tp] = array
+            arraysPending = False
+            check(actual_arg)
+    return check
+
+
+def CheckNumber(arg_num, actual_arg, accepted_arg_types, validate_function):
+    CompileNumberCheck(arg_num, accepted_arg_types[arg_num], validate_function)(actual_arg)
+
+
+def CheckString(arg_num, actual_arg, accepted_arg_types, validate_function):
+    CompileStringCheck(arg_num, accepted_arg_types[arg_num], validate_function)(actual_arg)
+
+
+def CheckObject(arg_num, actual_arg, accepted_arg_types, validate_function):
+    CompileObjectCheck(arg_num, accepted_arg_types[arg_num], validate_function)(actual_arg)
+
+
+def CheckArray(arg_num, actual_arg, accepted_arg_types, validate_function):
+    CompileArrayCheck(arg_num, accepted_arg_types[arg_num], validate_function)(actual_arg)
 
 
 def CheckValues(arg_num, actual_arg, accepted_arg_types, validate_function):
@@ -390,26 +1820,1544 @@ def CheckValues(arg_num, actual_arg, accepted_arg_types, validate_function):
     whether a string, list or tuple length is higher/lower than a predefined threshold or even    
     if a number or string belongs to set of allowed values.
     """
+    CompileValueCheck(arg_num, accepted_arg_types[arg_num], validate_function)(actual_arg)
+
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+# STREAMS
+# -------
+
+def _isStreamSpec(accepted_arg_type):
+    return _isSpecMapping(accepted_arg_type) and ('iterOf' in accepted_arg_type or 'maxItems' in accepted_arg_type)
+
+
+class ValidatingIterator(object):
+    """
+    Wraps an iterator (e.g. a generator given as an argument, or the generator of a decorated generator 
+    function) and checks each item when it is produced. Thus, the items are never materialized and the 
+    memory used by the checks is O(1). The send(), throw() and close() of a generator are passed through.
+    """
+    __slots__ = ('source', 'check', 'maxItems', 'count', 'validate_function', 'arg_num', 'yielded')
+
+    def __init__(self, source, check, maxItems, validate_function, arg_num=None, yielded=False):
+        self.source   = source
+        self.check    = check
+        self.maxItems = maxItems
+        self.count    = 0
+        self.validate_function = validate_function
+        self.arg_num  = arg_num
+        self.yielded  = yielded
+
+    def __iter__(self):
+        return self
+
+    def _checked(self, item):
+        index = self.count
+        self.count += 1
+
+        if self.maxItems is not None and self.count > self.maxItems:
+            raise ArgumentValueError('maxItems', self.validate_function, self.arg_num, self.maxItems, self.count, 
+                                     'maxYields' if self.yielded else None)
+        try:
+            self.check(item)
+        except ArgumentError as error:
+            error.details['item'] = index
+            if self.yielded:
+                error.details['yielded'] = True
+            raise
+        return item
+
+    def __next__(self):
+        return self._checked(next(self.source))
+
+    def send(self, value):
+        return self._checked(self.source.send(value))
+
+    def throw(self, *args):
+        return self._checked(self.source.throw(*args))
+
+    def close(self):
+        close = getattr(self.source, 'close', None)
+        if close is not None:
+            close()
+
+
+def _compileItemCheck(arg_num, accepted_arg_type, validate_function):
+    # the 'iterOf' specification of the items has the format of the value specifications, 
+    # plus an optional 'type' (e.g. {'type': float, 'range': [0, 1]})
+    itemSpec = accepted_arg_type.get('iterOf')
+    if itemSpec is None:
+        return _noCheck
+    return _chainChecks([CompileTypeCheck(arg_num, itemSpec, validate_function), CompileValueCheck(arg_num, itemSpec, validate_function)])
+
+
+def CompileStreamWrapper(arg_num, accepted_arg_type, validate_function, yielded=False):
+    """
+    Parses an 'iterOf' / 'maxItems' specification only once and returns a callable, which wraps 
+    an iterator into a ValidatingIterator. If <yielded> is True, then the items are the ones yielded by 
+    the decorated generator function.
+    """
+    itemCheck = _compileItemCheck(arg_num, accepted_arg_type, validate_function)
+    maxItems  = accepted_arg_type.get('maxItems')
+
+    def wrap(source):
+        return ValidatingIterator(source, itemCheck, maxItems, validate_function, arg_num, yielded)
+    return wrap
+
+
+def CompileStreamCheck(arg_num, accepted_arg_type, validate_function, sampling=None):
+    """
+    Returns a callable which checks an argument with an 'iterOf' (the specification of each item) and/or 
+    a 'maxItems' (the maximum number of items) specification. A container (e.g. a list, a tuple or a set) 
+    is checked eagerly, while an iterator (e.g. a generator) is not consumed here, since it is wrapped 
+    into a ValidatingIterator (see the streams of the ValidationPlan), which checks each item when the 
+    decorated function asks for it.
+    """
+    cmd = accepted_arg_type.get('command')
+    if cmd == 'noCheck':
+        return _noCheck
+
+    allowNone  = cmd == 'allowNone'
+    others     = {Key: checkVal for Key, checkVal in accepted_arg_type.items() if Key not in ('iterOf', 'maxItems', 'command')}
+    valueCheck = CompileValueCheck(arg_num, others, validate_function, sampling)
+    wrap       = CompileStreamWrapper(arg_num, accepted_arg_type, validate_function)
+    Iterator   = collections.abc.Iterator
+
+    def streamCheck(actual_arg):
+        if actual_arg is None:
+            if allowNone:
+                return
+            raise ArgumentValueError('none', validate_function, arg_num)
+
+        valueCheck(actual_arg)
+        if isinstance(actual_arg, Iterator):
+            return # it is checked lazily
+
+        try:
+            items = iter(actual_arg)
+        except TypeError:
+            raise ArgumentTypeError('iterable', validate_function, arg_num, None, actual_arg) from None
+        for _ in wrap(items):
+            pass
+    return streamCheck
+
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+# SCHEMAS
+# -------
+
+# A 'schema' specification describes a nested payload (dicts and lists), e.g. 
+#   {'schema': {'keys'     : {'id': {'type': int, 'minValue': 1}, 'tags': {'type': list, 'listOf': {'type': str}}}, 
+#               'optional' : {'owner': {'type': dict, 'keys': {'name': {'type': str, 'minLength': 1}}}}}}
+# where each node has the format of the 'iterOf' specifications (an optional 'type' and the value specifications), 
+# plus the following keys:
+#   - keys      : the required keys of a dict and the specification of each one
+#   - optional  : the optional keys of a dict and the specification of each one
+#   - extraKeys : False if the keys which are not declared are rejected (True by default)
+#   - listOf    : the specification of each item of a list or tuple
+#   - dictOf    : the specification of each value of a dict
+# A node may contain itself (e.g. the children of a tree). The payloads are checked without recursion, up to 
+# <schemaMaxDepth> levels of nesting, which can be changed per argument by a 'maxDepth' next to the 'schema'.
+schemaMaxDepth = 64
+
+_schemaKeys = frozenset(['keys', 'optional', 'extraKeys', 'listOf', 'dictOf'])
+
+
+def _isSchemaSpec(accepted_arg_type):
+    return _isSpecMapping(accepted_arg_type) and 'schema' in accepted_arg_type
+
+
+def _typedCheck(arg_num, node, validate_function):
+    """
+    Returns (types, check) for a node with exact types (e.g. {'type': str, 'minLength': 1}), where the values 
+    of one of the <types> need only the value <check> of their kind (None if there is nothing to check), 
+    or (None, None) if the full check of the node has to be called for every value.
+    """
+    accepted_Type = node.get('type')
+    if accepted_Type is None or _acceptsSubclasses(accepted_Type) or type(node.get('command')) is dict or _isStreamSpec(node) or _isSchemaSpec(node):
+        return None, None
+    types = frozenset(accepted_Type if type(accepted_Type) is list else [accepted_Type])
+    if type(None) in types or not types.isdisjoint(arrayType):
+        return None, None
+
+    # the value checks are selected by the type of the value, as in CompileValueCheck
+    kinds = set()
+    for tp in types:
+        for compile, kindTypes in ((CompileNumberCheck, numberTypes), (CompileStringCheck, stringTypes), (CompileObjectCheck, objectTypes)):
+            if tp in kindTypes:
+                kinds.add(compile)
+    if len(kinds) > 1:
+        return None, None
+    if not kinds or set(node) <= {'type', 'command'}: # the None is the only value checked by the commands
+        return types, None
+    check = kinds.pop()(arg_num, node, validate_function)
+    return types, None if check is _noCheck else check
+
+
+def _compileSchemaNodes(arg_num, schema, validate_function):
+    """
+    Compiles the nodes of a schema into a table of tuples: (check, types, typedCheck, required, optional, known, listOf, 
+    dictOf, isDict), where the keys and the items refer to the positions of their nodes in the table, so as a node which 
+    is met more than once (e.g. a recursive one) to be compiled only once. The nodes without any keys or items (leaves) 
+    are checked directly by their parents, instead of being pushed into the stack of CompileSchemaCheck. A value which 
+    has one of the exact <types> of its node is checked only by the <typedCheck> (if any), see _typedCheck.
+    """
+    specs   = []
+    indices = {} # id(node) -> position in the table
+
+    def index(node):
+        if not _isSpecMapping(node):
+            raise ValueError('Each node of a schema must be a dict, not: {0!r}.'.format(node))
+        if id(node) not in indices:
+            indices[id(node)] = len(specs)
+            specs.append(node)
+        return indices[id(node)]
+
+    index(schema)
+    compiled = []
+    position = 0
+    while position < len(specs): # the table grows, while the new nodes are found
+        node  = specs[position]
+        own   = {Key: checkVal for Key, checkVal in node.items() if Key not in _schemaKeys}
+        check = _chainChecks([CompileTypeCheck(arg_num, own, validate_function), CompileValueCheck(arg_num, own, validate_function)])
+
+        required = tuple((key, index(child)) for key, child in node.get('keys', {}).items())
+        optional = tuple((key, index(child)) for key, child in node.get('optional', {}).items())
+        known    = None if node.get('extraKeys', True) else frozenset(key for key, _ in required + optional)
+        listOf   = index(node['listOf']) if 'listOf' in node else None
+        dictOf   = index(node['dictOf']) if 'dictOf' in node else None
+        isDict   = bool(required or optional) or known is not None or dictOf is not None
+        compiled.append((check,) + _typedCheck(arg_num, own, validate_function) + (required, optional, known, listOf, dictOf, isDict))
+        position += 1
+
+    def child(position):
+        # (position, check, types, typedCheck), where the checks and the types are given only for the leaves
+        check, types, typedCheck, required, optional, known, listOf, dictOf, isDict = compiled[position]
+        if isDict or listOf is not None:
+            return (position, None, None, None)
+        return (position, check, types, typedCheck)
+
+    return tuple((check, types, typedCheck, tuple((key,) + child(position) for key, position in required), 
+                  tuple((key,) + child(position) for key, position in optional), known, 
+                  None if listOf is None else child(listOf), None if dictOf is None else child(dictOf), isDict) 
+                 for check, types, typedCheck, required, optional, known, listOf, dictOf, isDict in compiled)
+
+
+def _schemaPath(entry, key):
+    # the path of an element e.g. "['users'][3]['age']", where <entry> is the entry of its container in the 
+    # stack of CompileSchemaCheck, i.e. (value, node, depth, parent entry, key in the parent), or of the element itself
+    keys = [] if key is None else [key]
+    while entry[3] is not None:
+        keys.append(entry[4])
+        entry = entry[3]
+    return ''.join('[{0!r}]'.format(key) for key in reversed(keys))
+
+
+def CompileSchemaCheck(arg_num, accepted_arg_type, validate_function, sampling=None):
+    """
+    Parses a 'schema' specification only once and returns a callable, which checks a nested payload. The 
+    payload is traversed with an explicit stack (i.e. without recursion) and the check stops at the first 
+    invalid element, whose path (e.g. ['users'][3]['age']) is computed only then and it is added to the 
+    details of the raised error. The rest of the keys of the specification (e.g. 'minLength') are applied 
+    to the argument itself.
+    """
+    cmd = accepted_arg_type.get('command')
+    if cmd == 'noCheck':
+        return _noCheck
+
+    allowNone  = cmd == 'allowNone'
+    others     = {Key: checkVal for Key, checkVal in accepted_arg_type.items() if Key not in ('schema', 'maxDepth', 'command')}
+    valueCheck = CompileValueCheck(arg_num, others, validate_function, sampling)
+    nodes      = _compileSchemaNodes(arg_num, accepted_arg_type['schema'], validate_function)
+    maxDepth   = accepted_arg_type.get('maxDepth', schemaMaxDepth)
+
+    def schemaCheck(actual_arg):
+        if actual_arg is None:
+            if allowNone:
+                return
+            raise ArgumentValueError('none', validate_function, arg_num)
+        valueCheck(actual_arg)
+
+        stack = [(actual_arg, 0, 0, None, None)] # (value, node, depth, parent entry, key in the parent)
+        pop   = stack.pop
+        push  = stack.append
+        key   = None # the key of the leaf which is being checked (if any)
+        try:
+            while stack:
+                entry = pop()
+                value, node, depth = entry[0], entry[1], entry[2]
+                check, types, typedCheck, required, optional, known, listOf, dictOf, isDict = nodes[node]
+                if types is None or type(value) not in types:
+                    check(value)
+                elif typedCheck is not None:
+                    typedCheck(value)
+                if value is None: # accepted by an 'allowNone' command
+                    continue
+
+                if isDict:
+                    if not isinstance(value, dict):
+                        raise ArgumentTypeError('type', validate_function, arg_num, dict, value)
+                    if depth >= maxDepth and len(value) > 0:
+                        raise ArgumentValueError('maxDepth', validate_function, arg_num, maxDepth, depth + 1)
+                    if known is not None and not known.issuperset(value):
+                        raise ArgumentValueError('unknownKey', validate_function, arg_num, sorted(known, key=repr), 
+                                                 next(name for name in value if name not in known))
+                    for name, position, leafCheck, leafTypes, typedLeafCheck in required:
+                        if name not in value:
+                            key = None # the dict itself is reported
+                            raise ArgumentValueError('missingKey', validate_function, arg_num, name)
+                        key  = name
+                        item = value[name]
+                        if leafCheck is None:
+                            push((item, position, depth + 1, entry, name))
+                        elif leafTypes is None or type(item) not in leafTypes:
+                            leafCheck(item)
+                        elif typedLeafCheck is not None:
+                            typedLeafCheck(item)
+                    for name, position, leafCheck, leafTypes, typedLeafCheck in optional:
+                        if name in value:
+                            key  = name
+                            item = value[name]
+                            if leafCheck is None:
+                                push((item, position, depth + 1, entry, name))
+                            elif leafTypes is None or type(item) not in leafTypes:
+                                leafCheck(item)
+                            elif typedLeafCheck is not None:
+                                typedLeafCheck(item)
+                    key = None
+                    if dictOf is not None:
+                        position, leafCheck, leafTypes, typedLeafCheck = dictOf
+                        if leafTypes is not None and typedLeafCheck is None and leafTypes.issuperset(map(type, value.values())):
+                            pass
+                        elif leafCheck is not None:
+                            for key, item in value.items():
+                                leafCheck(item)
+                        else:
+                            for key, item in value.items():
+                                push((item, position, depth + 1, entry, key))
+                        key = None
+
+                elif listOf is not None:
+                    if type(value) is not list and type(value) is not tuple:
+                        raise ArgumentTypeError('type', validate_function, arg_num, [list, tuple], value, 'typeList')
+                    if depth >= maxDepth and len(value) > 0:
+                        raise ArgumentValueError('maxDepth', validate_function, arg_num, maxDepth, depth + 1)
+                    position, leafCheck, leafTypes, typedLeafCheck = listOf
+                    if leafTypes is not None and typedLeafCheck is None and leafTypes.issuperset(map(type, value)):
+                        pass
+                    elif leafCheck is not None:
+                        for key, item in enumerate(value):
+                            leafCheck(item)
+                    else:
+                        for key, item in enumerate(value):
+                            push((item, position, depth + 1, entry, key))
+                    key = None
+        except ArgumentError as error:
+            # the path of a nested schema (if any) is appended to the path of its own element
+            error.details['path'] = _schemaPath(entry, key) + error.details.get('path', '')
+            if not error.details['path']:
+                del error.details['path']
+            raise
+    return schemaCheck
+
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+# VALIDATION PLANS
+# ----------------
+
+class ValidationPlan(collections.namedtuple('ValidationPlan', ['function', 'names', 'positions', 'defaults', 'checkers', 
+                                                               'typeSpecs', 'typeCheckers', 'valueSpecs', 'valueCheckers', 'sampling', 'cache', 
+                                                               'telemetry', 'varArgs', 'varKeywords', 'streams', 'yields', 'shapes'])):
+    """
+    An immutable description of how the arguments of a decorated function are checked.
+    It is built only once, at decoration time, and holds:
+        function      -- the decorated function
+        names         -- the names of all the function's arguments
+        positions     -- a dictionary which maps the name of an argument to its position
+        defaults      -- a tuple of (position, name, default value) for the arguments that have default values
+        checkers      -- a tuple with the compiled check of each argument (one per position), where the 
+                         type check of an argument is followed by its value check
+        typeSpecs     -- the specifications given to acceptedTypes (or None)
+        typeCheckers  -- the compiled type checks (or None)
+        valueSpecs    -- the specifications given to acceptedValues (or None)
+        valueCheckers -- the compiled value checks (or None)
+        sampling      -- the Sampling of the statistical validation mode (or None)
+        cache         -- the ValidationCache of the already validated values (or None)
+        telemetry     -- the Telemetry of the decorated function (or None)
+        varArgs       -- True if the checked arguments are followed by a *args argument, whose values are not checked
+        varKeywords   -- True if the function has a **kwargs argument, whose values are not checked
+        streams       -- a tuple of (position, name, wrap) for the arguments whose items are checked lazily, 
+                         where wrap(argument) returns a ValidatingIterator (or None, if there are no such arguments)
+        yields        -- a callable which wraps the generator of a generator function, so as its items to be 
+                         checked lazily (or None)
+        shapes        -- a callable which binds the named dimensions of the arrays across the arguments of a call 
+                         (see CompileShapeBindings), or None
+    """
+    __slots__ = ()
+
+    def invalidNumberOfArguments(self):
+        return ArgumentValueError('arguments', self.function, None, len(self.checkers))
+
+    def check(self, function_args, function_args_dict):
+        """
+        Binds the actual arguments to their positions and runs the compiled checks.
+        """
+        try:
+            checkers = self.checkers
+            nargs    = len(function_args)
+
+            # the most common case: all the arguments have been given by position
+            if nargs == len(checkers) and not function_args_dict:
+                for checker, actual_arg in zip(checkers, function_args):
+                    checker(actual_arg)
+                if self.shapes is not None:
+                    self.shapes(function_args)
+                return
+
+            if nargs > len(checkers):
+                if not self.varArgs:
+                    raise self.invalidNumberOfArguments()
+                nargs = len(checkers)
+
+            pending   = list(zip(range(nargs), function_args))
+            positions = self.positions
+            for arg_key, actual_arg in function_args_dict.items():
+                arg_num = positions.get(arg_key, -1)
+                if arg_num < nargs: # either unknown or already given by position
+                    if arg_num < 0 and (self.varKeywords or arg_key in self.names): # i.e. an argument which is not checked
+                        continue
+                    raise self.invalidNumberOfArguments()
+                pending.append((arg_num, actual_arg))
+
+            # the missing arguments get their default values
+            if len(pending) != len(checkers):
+                for arg_num, arg_key, default in self.defaults:
+                    if arg_num >= nargs and arg_key not in function_args_dict:
+                        pending.append((arg_num, default))
+
+                if len(pending) != len(checkers):
+                    raise self.invalidNumberOfArguments()
+
+            for arg_num, actual_arg in pending:
+                checkers[arg_num](actual_arg)
+            if self.shapes is not None:
+                self.shapes(dict(pending))
+        except ArgumentError as error:
+            self.completeError(error)
+            raise
+
+    def completeError(self, error):
+        # the shared checks (see _sharedCheck) raise errors without a function
+        if error.function is None:
+            error.function = self.function
+
+
+def CompileValidationPlan(validate_function, typeSpecs=None, valueSpecs=None, sampling=None, cache=None, telemetry=None, yields=None):
+    """
+    Builds the ValidationPlan of <validate_function>. The <typeSpecs> are the specifications of 
+    acceptedTypes and the <valueSpecs> are the specifications of acceptedValues. Any of them can be None,
+    but if both are given, then they must have the same length. The optional <sampling> enables the 
+    statistical validation mode (see Sampling), the optional <cache> skips the checks of the 
+    already validated values (see ValidationCache) and the optional <telemetry> measures the time 
+    spent for checking each argument (see Telemetry). The optional <yields> is the specification of 
+    the items of a generator function e.g. {'iterOf': {'type': float, 'range': [0, 1]}}.
+    """
+    if typeSpecs is not None and valueSpecs is not None and len(typeSpecs) != len(valueSpecs):
+        raise ValueError('The number of the types specifications ({0}) is different from the number of the values specifications ({1}) of {2}()'.format(len(typeSpecs), len(valueSpecs), validate_function.__name__))
+
+    sig = inspect.signature(validate_function)
+    numOfArgs = len(typeSpecs if typeSpecs is not None else valueSpecs)
+    names     = tuple(sig.parameters.keys()) # argument names (all names: vars and default values)
+    positions = {}
+    defaults  = []
+    varArgs     = False
+    varKeywords = False
+
+    for arg_num, param in enumerate(sig.parameters.values()):
+        if param.kind is param.VAR_POSITIONAL:
+            varArgs = arg_num == numOfArgs
+        elif param.kind is param.VAR_KEYWORD:
+            varKeywords = True
+        if arg_num >= numOfArgs or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+
+        positions[param.name] = arg_num
+        if param.default is not inspect.Parameter.empty:
+            defaults.append((arg_num, param.name, param.default))
+
+    typeCheckers  = None
+    valueCheckers = None
+    # the checks of the identical specifications are compiled once and shared by all the functions (see _sharedCheck)
+    if typeSpecs is not None:
+        typeSpecs    = tuple(typeSpecs)
+        typeCheckers = tuple(_sharedCheck('type', CompileTypeCheck, arg_num, accepted_arg_type, validate_function, sampling) 
+                             for arg_num, accepted_arg_type in enumerate(typeSpecs))
+    if valueSpecs is not None:
+        valueSpecs    = tuple(_internSpec(accepted_arg_type) for accepted_arg_type in valueSpecs) if internSpecs else tuple(valueSpecs)
+        valueCheckers = tuple(_sharedCheck('value', CompileValueCheck, arg_num, accepted_arg_type, validate_function, sampling) 
+                              for arg_num, accepted_arg_type in enumerate(valueSpecs))
+
+    # the type and the value checks of each argument are interleaved, so as the arguments to be walked only once
+    checkers = tuple(_chainChecks(checks) for checks in zip(*(checkers for checkers in (typeCheckers, valueCheckers) if checkers is not None)))
+    if cache is not None:
+        checkers = tuple(cache.cachedCheck(arg_num, checker) for arg_num, checker in enumerate(checkers))
+    if telemetry is not None:
+        checkers = tuple(telemetry.timedCheck(name, checker) for name, checker in zip(names, checkers))
+
+    # the iterators of the arguments with an 'iterOf' or a 'maxItems' specification are checked lazily
+    streams = ()
+    if valueSpecs is not None:
+        streams = tuple((arg_num, names[arg_num], CompileStreamWrapper(arg_num, accepted_arg_type, validate_function)) 
+                        for arg_num, accepted_arg_type in enumerate(valueSpecs) if _isStreamSpec(accepted_arg_type))
+
+    yieldsWrapper = None
+    if yields is not None:
+        if not inspect.isgeneratorfunction(validate_function):
+            raise ValueError('The yields of {0}() can be checked only if it is a generator function.'.format(validate_function.__name__))
+        yieldsWrapper = CompileStreamWrapper(None, yields, validate_function, yielded=True)
+
+    return ValidationPlan(validate_function, names, positions, tuple(defaults), checkers, typeSpecs, typeCheckers, valueSpecs, valueCheckers, sampling, cache, telemetry, varArgs, varKeywords, 
+                          streams or None, yieldsWrapper, None if valueSpecs is None else CompileShapeBindings(valueSpecs, validate_function))
+
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+# CODE GENERATION
+# ---------------
+# The 'codegen' backend generates the source of a wrapper which has the real parameter list of 
+# the decorated function and the checks written inline (e.g. "type(input1) is not int" or 
+# "input1 < 1 or input1 > 10"). Only when an inline check fails, the compiled check of the argument 
+# is called, in order to raise the usual exception. Specifications which cannot be written inline 
+# (e.g. consistency checks or arrays) are delegated to the compiled checks.
+#
+# NOTE : 
+#  - a missing argument raises the usual ValueError, but an unknown keyword argument or too many 
+#    positional arguments raise a TypeError (python itself binds the arguments)
+#  - the per-call <removeChecks> argument is not supported by this backend
+#  - functions with *args or **kwargs are decorated using the default backend
+
+_PREFIX = '_IC_'
+
+
+class _SourceConstants(object):
+    """
+    Collects the objects that are referenced by the generated source and gives them a name.
+    """
+    def __init__(self):
+        self.names  = []
+        self.values = []
+
+    def add(self, value):
+        for name, val in zip(self.names, self.values):
+            if val is value:
+                return name
+        name = '{0}c{1}'.format(_PREFIX, len(self.names))
+        self.names.append(name)
+        self.values.append(value)
+        return name
+
+    def literal(self, value):
+        # numbers are written as literals, as long as their representation can be evaluated back
+        if type(value) in (int, float, bool) and repr(value) not in ('inf', '-inf', 'nan'):
+            return repr(value)
+        return self.add(value)
+
+    def typeName(self, tp):
+        # even the builtin types (and functions e.g. len) are referenced through constants, since a 
+        # parameter of the function (e.g. def func(type, len)) would hide their builtin names
+        return self.add(tp)
+
+
+def _typeGuardSource(name, accepted_arg_type, consts):
+    """
+    Returns the condition under which the type of the argument <name> is NOT accepted, 
+    or None if the specification cannot be written inline.
+    """
+    if _isSpecMapping(accepted_arg_type):
+        cmd = accepted_arg_type.get('command')
+        if type(cmd) is dict and cmd.get('checkConsistency') == True:
+            return None
+        if 'type' not in accepted_arg_type:
+            return 'False'
+        accepted_arg_type = accepted_arg_type['type']
+
+    if _acceptsSubclasses(accepted_arg_type):
+        return None
+
+    if type(accepted_arg_type) is list:
+        if len(accepted_arg_type) <= 4:
+            if len(accepted_arg_type) == 0:
+                return 'True'
+            return ' and '.join('{0}type is not {1}'.format(_PREFIX, consts.typeName(tp)) for tp in accepted_arg_type)
+        return '{0}type not in {1}'.format(_PREFIX, consts.add(_typeContainer(accepted_arg_type)))
+
+    return '{0}type is not {1}'.format(_PREFIX, consts.typeName(accepted_arg_type))
+
+
+def _valueGuardsSource(name, accepted_arg_type, consts):
+    """
+    Returns the conditions under which the value of a number and of a string argument <name> is NOT accepted.
+    """
+    number = []
+    string = []
+
+    for Key, checkVal in accepted_arg_type.items():
+        if Key == 'range':
+            number.append('{0} < {1} or {0} > {2}'.format(name, consts.literal(checkVal[0]), consts.literal(checkVal[1])))
+        elif Key == 'minValue':
+            number.append('{0} < {1}'.format(name, consts.literal(checkVal)))
+        elif Key == 'maxValue':
+            number.append('{0} > {1}'.format(name, consts.literal(checkVal)))
+        elif Key == 'minLength':
+            string.append('{0}({1}) < {2}'.format(consts.typeName(len), name, consts.literal(checkVal)))
+        elif Key == 'maxLength':
+            string.append('{0}({1}) > {2}'.format(consts.typeName(len), name, consts.literal(checkVal)))
+        elif Key == 'rangeLength':
+            string.append('{3}({0}) < {1} or {3}({0}) > {2}'.format(name, consts.literal(checkVal[0]), consts.literal(checkVal[1]), consts.typeName(len)))
+        elif Key == 'ranges':
+            number.append('True') # the binary search is performed by the compiled check
+        elif Key == 'rangesLength':
+            string.append('True')
+        elif Key == 'schema':
+            number.append('True') # the root of the schema is checked by the compiled check
+            string.append('True')
+
+        if Key == 'set':
+            cond = '{0} not in {1}'.format(name, consts.add(_setContainer(checkVal)))
+            number.append(cond)
+            string.append(cond)
+
+    return number, string
+
+
+def _argumentSource(arg_num, name, typeSpec, typeChecker, valueSpec, valueChecker, consts):
+    lines = []
+
+    if typeChecker is not None and typeChecker is not _noCheck:
+        checker = consts.add(typeChecker)
+        guard = _typeGuardSource(name, typeSpec, consts)
+        if guard is None:
+            lines.append('{0}({1})'.format(checker, name))
+        elif guard != 'False':
+            lines.append('if {0}:'.format(guard))
+            lines.append('    {0}({1})'.format(checker, name))
+
+    if valueChecker is not None and valueChecker is not _noCheck:
+        checker = consts.add(valueChecker)
+        number, string = _valueGuardsSource(name, valueSpec, consts)
+        lines.append('if {0}type is {1} or {0}type is {2}:'.format(_PREFIX, consts.typeName(int), consts.typeName(float)))
+        lines.append('    if {0}:'.format(' or '.join('({0})'.format(cond) for cond in number)) if number else '    pass')
+        if number:
+            lines.append('        {0}({1})'.format(checker, name))
+        lines.append('elif {0}type is {1}:'.format(_PREFIX, consts.typeName(str)))
+        lines.append('    if {0}:'.format(' or '.join('({0})'.format(cond) for cond in string)) if string else '    pass')
+        if string:
+            lines.append('        {0}({1})'.format(checker, name))
+        lines.append('else:')
+        lines.append('    {0}({1})'.format(checker, name))
+
+    if any(_PREFIX + 'type' in line for line in lines):
+        lines.insert(0, '{0}type = {1}({2})'.format(_PREFIX, consts.typeName(type), name))
+    return lines
+
+
+def GenerateWrapperSource(plan):
+    """
+    Generates the source of a specialized wrapper for the function of the <plan>. 
+    Returns a tuple (source, constants) or None, if the function cannot be handled by the 'codegen' backend.
+    """
+    validate_function = plan.function
+    params = list(inspect.signature(validate_function).parameters.values())
+
+    if len(params) != len(plan.checkers):
+        return None
+    for param in params:
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD) or param.name.startswith(_PREFIX):
+            return None
+
+    consts  = _SourceConstants()
+    missing = consts.add(_missing)
+    invalid = consts.add(plan.invalidNumberOfArguments)
+    function = consts.add(validate_function)
+
+    signature = []
+    call      = []
+    body      = []
+    kind      = None
+    for arg_num, param in enumerate(params):
+        if kind is param.POSITIONAL_ONLY and param.kind is not param.POSITIONAL_ONLY:
+            signature.append('/')
+        if param.kind is param.KEYWORD_ONLY and kind is not param.KEYWORD_ONLY:
+            signature.append('*')
+        kind = param.kind
+
+        if param.default is inspect.Parameter.empty:
+            signature.append('{0}={1}'.format(param.name, missing))
+            body.append('if {0} is {1}:'.format(param.name, missing))
+            body.append('    raise {0}()'.format(invalid))
+        else:
+            signature.append('{0}={1}'.format(param.name, consts.add(param.default)))
+
+        if param.kind is param.KEYWORD_ONLY:
+            call.append('{0}={0}'.format(param.name))
+        else:
+            call.append(param.name)
+
+        body.extend(_argumentSource(
+            arg_num, 
+            param.name, 
+            None if plan.typeSpecs is None else plan.typeSpecs[arg_num], 
+            None if plan.typeCheckers is None else plan.typeCheckers[arg_num], 
+            None if plan.valueSpecs is None else plan.valueSpecs[arg_num], 
+            None if plan.valueCheckers is None else plan.valueCheckers[arg_num], 
+            consts
+        ))
+
+    if kind is inspect.Parameter.POSITIONAL_ONLY:
+        signature.append('/')
+
+    # the shared checks (see _sharedCheck) raise errors without a function, which is filled here
+    if body:
+        body = ['try:'] + ['    ' + line for line in body] + [
+                'except {0} as {1}error:'.format(consts.add(ArgumentError), _PREFIX), 
+                '    {0}({1}error)'.format(consts.add(plan.completeError), _PREFIX), 
+                '    raise']
+    body.append('return {0}({1})'.format(function, ', '.join(call)))
+
+    # the passthrough wrapper has the same signature, but it does no checks (see setChecksEnabled). Both wrappers
+    # declare all the constants as nonlocal, in order to have the same free variables (see PassthroughFunction).
+    allConstants = 'nonlocal {0}'.format(', '.join(consts.names))
+    fname = validate_function.__name__
+    if not fname.isidentifier() or keyword.iskeyword(fname): # e.g. a lambda
+        fname = _PREFIX + 'function'
+
+    lines = ['def {0}factory({1}):'.format(_PREFIX, ', '.join(consts.names))]
+    lines.append('    def {0}({1}):'.format(fname, ', '.join(signature)))
+    lines.append('        ' + allConstants)
+    lines.extend('        ' + line for line in body)
+    lines.append('    {0}checked = {1}'.format(_PREFIX, fname))
+    lines.append('    def {0}({1}):'.format(fname, ', '.join(signature)))
+    lines.append('        ' + allConstants)
+    lines.append('        return {0}({1})'.format(function, ', '.join(call)))
+    lines.append('    return {0}checked, {1}'.format(_PREFIX, fname))
+
+    return '\n'.join(lines) + '\n', consts.values
+
+
+def CompileSpecializedWrapper(plan, dumpSource=False):
+    """
+    Generates, compiles and returns the specialized wrapper of the function of the <plan>, or None if 
+    the function cannot be handled by the 'codegen' backend. The generated source is kept in the 
+    <generatedSource> attribute of the wrapper and, if <dumpSource> is True, it is also written to stderr.
+    """
+    generated = GenerateWrapperSource(plan)
+    if generated is None:
+        return None
+    source, values = generated
+
+    if dumpSource:
+        print(source, file=sys.stderr)
+
+    namespace = {}
+    filename = '<InputCheck codegen {0}>'.format(plan.function.__qualname__)
+    exec(compile(source, filename, 'exec'), namespace)
+    wrapper, passthrough = namespace[_PREFIX + 'factory'](*values)
+
+    wrapper = functools.wraps(plan.function)(wrapper)
+    wrapper.validationPlan  = plan
+    wrapper.generatedSource = source
+    RegisterWrapper(wrapper, passthrough)
+    return wrapper
+
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+# RUNTIME SWITCH
+# --------------
+# Every wrapper created by the decorators is kept in a (weak) registry, together with the code of an 
+# equivalent passthrough wrapper, which just calls the decorated function. When the checks of a wrapper 
+# are disabled, its code is replaced by the code of the passthrough wrapper and vice versa. Thus, the 
+# checks can be turned off or on at runtime, without re-importing the modules and without any per-call 
+# cost for reading a flag. The checks can be enabled/disabled:
+#  - for the whole process (see also the INPUTCHECK_DISABLED environment variable)
+#  - for all the decorated functions of a module
+#  - for a single decorated function
+# where the setting of a function overrides the setting of its module, which overrides the process setting.
+#
+# The INPUTCHECK_DISABLED environment variable is read once, at import time. The values '1', 'true', 'yes' 
+# and 'all' disable the checks of the whole process, while any other value is treated as a comma separated 
+# list of modules names, whose checks are disabled.
+
+class _Switch(object):
+    __slots__ = ('checkedCode', 'passthroughCode', 'module', 'enabled')
+
+    def __init__(self, checkedCode, passthroughCode, module):
+        self.checkedCode     = checkedCode
+        self.passthroughCode = passthroughCode
+        self.module          = module
+        self.enabled         = None # i.e. the setting of the module (or of the process) is used
+
+
+_switches       = weakref.WeakKeyDictionary()
+_modulesEnabled = {}
+_processEnabled = True
+
+_disabledFromEnv = os.environ.get('INPUTCHECK_DISABLED', '').strip()
+if _disabledFromEnv.lower() in ('1', 'true', 'yes', 'all'):
+    _processEnabled = False
+elif _disabledFromEnv:
+    for module in _disabledFromEnv.split(','):
+        _modulesEnabled[module.strip()] = False
+
+
+def _isEnabled(switch):
+    if switch.enabled is not None:
+        return switch.enabled
+    return _modulesEnabled.get(switch.module, _processEnabled)
+
+
+def _applySwitch(wrapper, switch):
+    wrapper.__code__ = switch.checkedCode if _isEnabled(switch) else switch.passthroughCode
+
+
+# The code of a passthrough replaces the code of its wrapper, which keeps its own closure. Thus, the passthrough must 
+# have exactly the same free variables (in the same order) as its wrapper. Instead of being written by hand, the 
+# passthroughs of the decorators are compiled from the free variables of their wrapper, which are declared by a 
+# nonlocal statement. The compiled codes are shared by all the wrappers with the same free variables.
+_passthroughBodies = {
+    'function'  : ('def', ['return validate_function(*function_args, **function_args_dict)']), 
+    'coroutine' : ('async def', ['return await validate_function(*function_args, **function_args_dict)']), 
+    'asyncgen'  : ('async def', [
+        'generator = validate_function(*function_args, **function_args_dict)', 
+        'try:', 
+        '    item = await generator.__anext__()', 
+        '    while True:', 
+        '        try:', 
+        '            sent = yield item', 
+        '        except GeneratorExit:', 
+        '            raise', 
+        '        except BaseException as error:', 
+        '            item = await generator.athrow(error)', 
+        '        else:', 
+        '            item = await generator.asend(sent)', 
+        'except StopAsyncIteration:', 
+        '    return', 
+        'finally:', 
+        '    await generator.aclose()', 
+    ]), 
+}
+_passthroughCodes = {} # (kind, free variables) -> code
+
+
+def PassthroughFunction(wrapper, kind='function'):
+    """
+    Returns the passthrough of a <wrapper> (see RegisterWrapper), which only calls the decorated function 
+    (the free variable 'validate_function' of the wrapper) and has the same free variables as the wrapper.
+    The <kind> is 'function', 'coroutine' or 'asyncgen' (an async generator function).
+    """
+    freevars = wrapper.__code__.co_freevars
+    if 'validate_function' not in freevars:
+        raise ValueError('The wrapper {0}() does not refer to the validate_function.'.format(wrapper.__name__))
+
+    key  = (kind, freevars)
+    code = _passthroughCodes.get(key)
+    if code is None:
+        define, body = _passthroughBodies[kind]
+        lines = ['def {0}factory({1}):'.format(_PREFIX, ', '.join(freevars)), 
+                 '    {0} passthrough(*function_args, **function_args_dict):'.format(define), 
+                 '        nonlocal {0}'.format(', '.join(freevars))]
+        lines.extend('        ' + line for line in body)
+        lines.append('    return passthrough')
+        namespace = {}
+        exec(compile('\n'.join(lines) + '\n', '<InputCheck passthrough>', 'exec'), namespace)
+        code = _passthroughCodes.setdefault(key, namespace[_PREFIX + 'factory'](*freevars).__code__)
+    return types.FunctionType(code, wrapper.__globals__, 'passthrough', None, wrapper.__closure__)
+
+
+def RegisterWrapper(wrapper, passthrough):
+    """
+    Registers a wrapper created by the decorators, so as its checks to be enabled/disabled at runtime.
+    The <passthrough> must be a function with the same free variables as the <wrapper>, which only calls
+    the decorated function (see PassthroughFunction).
+    """
+    if wrapper.__code__.co_freevars != passthrough.__code__.co_freevars:
+        raise ValueError('The passthrough of {0}() must have the same free variables as its wrapper.'.format(wrapper.__name__))
+
+    switch = _Switch(wrapper.__code__, passthrough.__code__, wrapper.__module__)
+    _switches[wrapper] = switch
+    _applySwitch(wrapper, switch)
+
+
+def _scopeOf(scope):
+    # returns the registered wrapper or the module name that corresponds to a scope
+    if scope is None or type(scope) is str:
+        return scope
+    if type(scope) is types.ModuleType:
+        return scope.__name__
+    if scope in _switches:
+        return scope
+    raise ValueError('The {0} is neither a module nor a function decorated by InputCheck.'.format(scope))
+
+
+def getChecksEnabled(scope=None):
+    """
+    Returns whether the checks are enabled for the whole process (if <scope> is None), for a module 
+    (if <scope> is a module or a module name) or for a decorated function.
+    """
+    scope = _scopeOf(scope)
+    if scope is None:
+        return _processEnabled
+    if type(scope) is str:
+        return _modulesEnabled.get(scope, _processEnabled)
+    return _isEnabled(_switches[scope])
+
+
+def setChecksEnabled(enabled, scope=None):
+    """
+    Enables (<enabled> is True) or disables (<enabled> is False) the checks at runtime, for the whole process 
+    (if <scope> is None), for all the decorated functions of a module (if <scope> is a module or a module name) 
+    or for a single decorated function. If <enabled> is None, then the setting of a module or of a function is 
+    removed and the setting of the process (or of the module) applies again.
+    """
+    global _processEnabled
+
+    scope = _scopeOf(scope)
+    if scope is None:
+        _processEnabled = True if enabled is None else bool(enabled)
+    elif type(scope) is str:
+        if enabled is None:
+            _modulesEnabled.pop(scope, None)
+        else:
+            _modulesEnabled[scope] = bool(enabled)
+    else:
+        _switches[scope].enabled = None if enabled is None else bool(enabled)
+
+    for wrapper, switch in list(_switches.items()):
+        _applySwitch(wrapper, switch)
+
+
+def _previousSetting(scope):
+    scope = _scopeOf(scope)
+    if scope is None:
+        return _processEnabled
+    if type(scope) is str:
+        return _modulesEnabled.get(scope)
+    return _switches[scope].enabled
+
+
+@contextlib.contextmanager
+def checksDisabled(scope=None):
+    """
+    A context manager which disables the checks (see setChecksEnabled) and restores the previous setting on exit.
+    e.g. 
+        with checksDisabled():
+            Func1(0)
+    """
+    previous = _previousSetting(scope)
+    setChecksEnabled(False, scope)
+    try:
+        yield
+    finally:
+        setChecksEnabled(previous, scope)
+
+
+@contextlib.contextmanager
+def checksEnabled(scope=None):
+    """
+    A context manager which enables the checks (see setChecksEnabled) and restores the previous setting on exit.
+    """
+    previous = _previousSetting(scope)
+    setChecksEnabled(True, scope)
+    try:
+        yield
+    finally:
+        setChecksEnabled(previous, scope)
+
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+# ANNOTATIONS
+# -----------
+# The type hints of a function are turned into the specifications of acceptedTypes and acceptedValues, 
+# once, at decoration time (see AnnotationSpecs). The hints are mapped as follows:
+#  - int, str, np.ndarray, ...         --> the exact type (as in acceptedTypes)
+#  - float, complex                    --> float also accepts int and complex also accepts float and int (see PEP 484)
+#  - numbers.Real, typing.Sequence,... --> the abstract base class, which accepts the subclasses as well
+#  - X | Y, typing.Union[X, Y]         --> [X, Y]
+#  - X | None, typing.Optional[X]      --> [X, NoneType] and the value checks allow None
+#  - list[X], tuple[X, ...]            --> a list (or tuple) whose elements have the same type X
+#  - typing.Literal['a', 'b']          --> the types of the literals and the set ['a', 'b']
+#  - typing.Annotated[X, spec, ...]    --> the checks of X and the value specifications (e.g. Range(1, 10) or dicts)
+#  - typing.Any, type variables and missing hints are not checked
+#
+# NOTE : only the arguments before a *args or a **kwargs argument are checked
+
+_NoneType = type(None)
+
+_numericTower = {
+    float   : [float, int],
+    complex : [complex, float, int],
+}
+
+
+def _unionMembers(hint):
+    if typing.get_origin(hint) in (typing.Union, getattr(types, 'UnionType', None)):
+        return list(typing.get_args(hint))
+    return [hint]
+
+
+def _hintTypes(hint):
+    # returns the list of the types that correspond to a hint (or None, if the hint is not checked)
+    if hint is typing.Any or isinstance(hint, typing.TypeVar):
+        return None
+    if hint is None:
+        return [_NoneType]
+
+    origin = typing.get_origin(hint)
+    if origin is not None:
+        hint = origin
+    if hint in _numericTower:
+        return list(_numericTower[hint])
+    if isinstance(hint, type):
+        return [hint]
+    return None
+
+
+def _elementsHint(hint):
+    # returns the hint of the elements of e.g. list[X] or tuple[X, ...] (or None)
+    args = typing.get_args(hint)
+    if typing.get_origin(hint) is tuple:
+        return args[0] if len(args) == 2 and args[1] is Ellipsis else None
+    return args[0] if len(args) == 1 else None
+
+
+def _annotatedHint(hint, valueSpec):
+    # returns the hint X of Annotated[X, spec, ...] (or the <hint> itself), after adding the specs to the <valueSpec>
+    if typing.get_origin(hint) is not typing.Annotated:
+        return hint
+
+    hint, *metadata = typing.get_args(hint)
+    for spec in metadata:
+        if type(spec) is dict:
+            valueSpec.update(spec)
+        elif hasattr(spec, 'valueSpec'): # e.g. Range(1, 10)
+            valueSpec.update(spec.valueSpec())
+    return hint
+
+
+def AnnotationSpec(hint):
+    """
+    Returns the (type specification, value specification) of an argument, whose type hint is <hint>.
+    """
+    valueSpec = {}
+    hint      = _annotatedHint(hint, valueSpec)
+    members   = [_annotatedHint(member, valueSpec) for member in _unionMembers(hint)]
+    allowNone = len(members) > 1 and any(member is None or member is _NoneType for member in members)
+    if allowNone:
+        members = [member for member in members if member is not None and member is not _NoneType]
+
+    typeList = []
+    for member in members:
+        if typing.get_origin(member) is typing.Literal:
+            literals = typing.get_args(member)
+            typeList.extend(type(literal) for literal in literals)
+            if len(members) == 1:
+                valueSpec['set'] = list(literals)
+            continue
+
+        memberTypes = _hintTypes(member)
+        if memberTypes is None:
+            typeList = None
+            break
+        typeList.extend(memberTypes)
+
+    if typeList is None:
+        typeSpec = {} # i.e. no type check
+    else:
+        if allowNone:
+            typeList.append(_NoneType)
+        typeList = list(dict.fromkeys(typeList)) # the duplicates are removed, but the order is kept
+        typeSpec = typeList[0] if len(typeList) == 1 else typeList
+
+        # the elements of e.g. list[float] must have the same type, which is one of the types of the elements' hint
+        elements = _elementsHint(members[0]) if len(members) == 1 else None
+        elementsTypes = None if elements is None else _hintTypes(elements)
+        if elementsTypes is not None:
+            typeSpec = {'type': typeSpec, 'command': {'checkConsistency': True, 'consistencyType': elementsTypes}}
+
+    if not valueSpec:
+        valueSpec = {'command': 'noCheck'}
+    elif allowNone:
+        valueSpec['command'] = 'allowNone'
+    return typeSpec, valueSpec
+
+
+def _resolveHints(validate_function, names, localns=None):
+    # resolves the hints of the arguments <names> only, since the rest of the hints (e.g. 'return': 'C' in a method 
+    # of the class C) may refer to names which are not defined yet, when the function is decorated
+    annotations = getattr(validate_function, '__annotations__', {})
+    hinted = {name: annotations[name] for name in names if name in annotations}
+    if not hinted:
+        return {}
+    function = inspect.unwrap(validate_function)
+    return typing.get_type_hints(types.SimpleNamespace(__annotations__=hinted, __globals__=getattr(function, '__globals__', {})), 
+                                 localns=localns, include_extras=True)
+
+
+def _deferredFunction(validate_function, decorate):
+    """
+    Returns a wrapper which decorates the <validate_function> by calling <decorate>() on its first call, i.e. 
+    when its hints refer to names which are defined later (e.g. the class of a method, while the body of the 
+    class is executed, or any name under "from __future__ import annotations").
+    """
+    decorated = None
 
-    if type(actual_arg) in numberTypes + noneTypes:
-        CheckNumber(arg_num, actual_arg, accepted_arg_types, validate_function)
+    def resolved():
+        nonlocal decorated
+        if decorated is None:
+            decorated = decorate()
+        return decorated
 
-    elif type(actual_arg) in stringTypes + noneTypes:
-        CheckString(arg_num, actual_arg, accepted_arg_types, validate_function)
+    if inspect.iscoroutinefunction(validate_function):
+        @functools.wraps(validate_function)
+        async def wrapper(*args, **kwargs):
+            return await resolved()(*args, **kwargs)
+    else:
+        @functools.wraps(validate_function)
+        def wrapper(*args, **kwargs):
+            return resolved()(*args, **kwargs)
+    return wrapper
 
-    elif type(actual_arg) in objectTypes + noneTypes:
-        CheckObject(arg_num, actual_arg, accepted_arg_types, validate_function)
 
-    elif type(actual_arg) in arrayType + noneTypes:        
-        CheckArray(arg_num, actual_arg, accepted_arg_types, validate_function)
+def AnnotationSpecs(validate_function, specsCache=None, localns=None):
+    """
+    Returns the types specifications and the values specifications of the arguments of <validate_function>, 
+    as they are given by its type hints. The hints (even the string ones) are resolved only once.
+    The optional <specsCache> is a dict (hint -> specifications), which is shared by the methods of a class, 
+    so as each distinct hint to be parsed only once, while <localns> is used for resolving the string hints.
+    Only the hints of the checked arguments are resolved (e.g. not the 'return' hint) and a NameError is 
+    raised, if any of them refers to a name which is not defined yet.
+    """
+    params = []
+    for param in inspect.signature(validate_function).parameters.values():
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            break
+        params.append(param)
+
+    hints = _resolveHints(validate_function, [param.name for param in params], localns)
+    typeSpecs  = []
+    valueSpecs = []
+
+    for param in params:
+        hint = hints.get(param.name, typing.Any)
+        if specsCache is None:
+            typeSpec, valueSpec = AnnotationSpec(hint)
+        else:
+            try:
+                typeSpec, valueSpec = specsCache[hint]
+            except KeyError:
+                typeSpec, valueSpec = specsCache[hint] = AnnotationSpec(hint)
+            except TypeError: # an unhashable hint e.g. Annotated[float, {'range': [0, 1]}]
+                typeSpec, valueSpec = AnnotationSpec(hint)
+        typeSpecs.append(typeSpec)
+        valueSpecs.append(valueSpec)
+    return tuple(typeSpecs), tuple(valueSpecs)
+
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+# ATTRIBUTES
+# ----------
+
+class ValidatedAttribute(object):
+    """
+    A data descriptor, whose assignments are checked against a type and/or a value specification, e.g.
+        class Signal(object):
+            __slots__ = ('_rate',)
+            rate = ValidatedAttribute(types=[int, float], values={'range': [1, 96000]})
+    The checks are compiled only once, when the descriptor is assigned to its class. The value is stored 
+    in the slot '_<name>' of the instance (if the class declares it in its __slots__), or else in the 
+    __dict__ of the instance.
+
+    Arguments:
+        types   -- a type specification, as the ones of acceptedTypes (or None)
+        values  -- a value specification, as the ones of acceptedValues (or None)
+        default -- the value which is returned when the attribute has not been assigned
+    """
+    __slots__ = ('types', 'values', 'default', 'name', 'attribute', 'check', 'slot')
+
+    def __init__(self, types=None, values=None, default=_missing):
+        self.types     = types
+        self.values    = values
+        self.default   = default
+        self.name      = None
+        self.attribute = None
+        self.check     = _noCheck
+        self.slot      = None
+
+    def __set_name__(self, owner, name):
+        self.name      = name
+        self.attribute = '{0}.{1}'.format(owner.__name__, name)
+        self.check     = _chainChecks([_noCheck if self.types is None else CompileTypeCheck(None, self.types, owner), 
+                                       _noCheck if self.values is None else CompileValueCheck(None, self.values, owner)])
+
+        slot = getattr(owner, '_' + name, None)
+        if type(slot) is types.MemberDescriptorType:
+            self.slot = slot
+        elif owner.__dictoffset__ == 0:
+            raise TypeError("The class {0} has neither a __dict__ nor the slot '_{1}' for the attribute {2}.".format(owner.__name__, name, self.attribute))
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            if self.slot is not None:
+                return self.slot.__get__(instance, owner)
+            return instance.__dict__[self.name]
+        except (AttributeError, KeyError):
+            if self.default is _missing:
+                raise AttributeError("'{0}' object has no attribute '{1}'".format(type(instance).__name__, self.name)) from None
+            return self.default
+
+    def __set__(self, instance, value):
+        try:
+            self.check(value)
+        except ArgumentError as error:
+            error.details['attribute'] = self.attribute
+            raise
+        if self.slot is not None:
+            self.slot.__set__(instance, value)
+        else:
+            instance.__dict__[self.name] = value
+
+    def __delete__(self, instance):
+        try:
+            if self.slot is not None:
+                self.slot.__delete__(instance)
+            else:
+                del instance.__dict__[self.name]
+        except (AttributeError, KeyError):
+            raise AttributeError(self.name) from None
 
 # =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
 # DECORATORS
 # ----------
 
+def _isMethod(validate_function, numOfSpecs):
+    # a function which is defined in a class body, whose first argument is self (or cls) and which has 
+    # one specification less than its arguments, is a method whose specifications skip the first argument
+    parts = getattr(validate_function, '__qualname__', '').split('.')
+    if len(parts) < 2 or parts[-2] == '<locals>':
+        return False
+
+    params = [param for param in inspect.signature(validate_function).parameters.values() 
+              if param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)]
+    return len(params) > 0 and params[0].name in ('self', 'cls') and numOfSpecs == len(params) - 1
+
+
+def _methodSpecs(validate_function, specs, args_dict, skipped):
+    # the specifications of a method are given without a (dummy) specification for self (or cls), thus, 
+    # the <skipped> specification is prepended to them. The 'method' argument overrides the detection.
+    if specs is None:
+        return None
+    method = args_dict.get('method')
+    if method is None:
+        method = _isMethod(validate_function, len(specs))
+    return (skipped,) + tuple(specs) if method else specs
+
+
+def _memberDecorator(accept_decorator):
+    # the classmethods, the staticmethods and the properties are decorated through their functions 
+    # (the setter of a property), so as the decorators to be applied above or below @classmethod etc.
+    def member_decorator(validate_function):
+        if isinstance(validate_function, (classmethod, staticmethod)):
+            return type(validate_function)(accept_decorator(validate_function.__func__))
+        if isinstance(validate_function, property):
+            if validate_function.fset is None:
+                raise ValueError('Only the values of the properties with a setter can be checked.')
+            return validate_function.setter(accept_decorator(validate_function.fset))
+        return accept_decorator(validate_function)
+    return member_decorator
+
+
+def _checkedFunction(validate_function, plan):
+    check = plan.check
+    target = validate_function if plan.streams is None and plan.yields is None else _streamingFunction(validate_function, plan)
+    shouldCheck = None if plan.sampling is None else plan.sampling.shouldCheck
+    telemetry = plan.telemetry
+
+    if telemetry is not None:
+        # the telemetry is measured by a separate wrapper, so as the other wrappers not to pay for it
+        perf_counter = time.perf_counter
+        record = telemetry.record
+
+        @functools.wraps(validate_function)
+        def decorator_wrapper(*function_args, **function_args_dict):   
+            if 'removeChecks' in function_args_dict:
+                if function_args_dict['removeChecks'] == True:
+                    return validate_function(*function_args, **function_args_dict)            
+
+            start = perf_counter()
+            try:
+                if shouldCheck is None or shouldCheck():
+                    check(function_args, function_args_dict)
+            except ArgumentError as error:
+                record(validate_function, perf_counter() - start, None, error)
+                raise
+            validated = perf_counter()
+
+            try:
+                return target(*function_args, **function_args_dict)
+            finally:
+                record(validate_function, validated - start, perf_counter() - validated)
+    elif shouldCheck is None:
+        @functools.wraps(validate_function)
+        def decorator_wrapper(*function_args, **function_args_dict):   
+            if 'removeChecks' in function_args_dict:
+                if function_args_dict['removeChecks'] == True:
+                    return validate_function(*function_args, **function_args_dict)            
+
+            check(function_args, function_args_dict)
+
+            return target(*function_args, **function_args_dict)
+    else:
+
+        @functools.wraps(validate_function)
+        def decorator_wrapper(*function_args, **function_args_dict):   
+            if 'removeChecks' in function_args_dict:
+                if function_args_dict['removeChecks'] == True:
+                    return validate_function(*function_args, **function_args_dict)            
+
+            if shouldCheck():
+                check(function_args, function_args_dict)
+            else:
+                return validate_function(*function_args, **function_args_dict)
+
+            return target(*function_args, **function_args_dict)
+
+    decorator_wrapper.validationPlan = plan
+    decorator_wrapper.sampling = plan.sampling
+    decorator_wrapper.validationCache = plan.cache
+    decorator_wrapper.telemetry = plan.telemetry
+    RegisterWrapper(decorator_wrapper, PassthroughFunction(decorator_wrapper))
+    return decorator_wrapper
+
+
+def _streamingFunction(validate_function, plan):
+    # returns a function which calls <validate_function> with its iterator arguments wrapped into 
+    # ValidatingIterators and which wraps the generator returned by a generator function
+    streams = plan.streams or ()
+    yields = plan.yields
+    Iterator = collections.abc.Iterator
+
+    @functools.wraps(validate_function)
+    def streaming(*function_args, **function_args_dict):
+        if streams:
+            function_args = list(function_args)
+            for arg_num, arg_key, wrap in streams:
+                if arg_num < len(function_args):
+                    if isinstance(function_args[arg_num], Iterator):
+                        function_args[arg_num] = wrap(function_args[arg_num])
+                elif isinstance(function_args_dict.get(arg_key), Iterator):
+                    function_args_dict[arg_key] = wrap(function_args_dict[arg_key])
+
+        result = validate_function(*function_args, **function_args_dict)
+        return result if yields is None else yields(result)
+    return streaming
+
+
+# the total number of the elements that the checks of a call of a coroutine function (or of an async generator 
+# function) walk, above which the arguments are checked in a thread pool, instead of the event loop. It can be 
+# changed per decorated function with the 'offloadThreshold' argument of the decorators.
+asyncOffloadThreshold = 100000
+
+# the keys of the value specifications which walk the elements of an array (see _compileElementsCheck)
+_elementKeys = frozenset(['elemRange', 'elemMin', 'elemMax', 'finite', 'noNaN', 'monotonic'])
+
+
+def _sequenceSize(actual_arg):
+    # the number of the elements walked by a consistency check (see CompileConsistencyCheck)
+    ArgType = type(actual_arg)
+    return len(actual_arg) if ArgType is list or ArgType is tuple else 0
+
+
+def _arraySize(actual_arg):
+    # the number of the elements walked by the element-wise checks of an array (see _compileElementsCheck)
+    return actual_arg.size if type(actual_arg) in arrayType else 0
+
+
+def _payloadSize(actual_arg):
+    # the number of the elements walked by a schema check (see CompileSchemaCheck), estimated from the 
+    # first two levels of the payload, so as the estimation not to walk the whole payload itself
+    if type(actual_arg) not in (dict, list, tuple):
+        return 0
+    size = len(actual_arg)
+    for item in (actual_arg.values() if type(actual_arg) is dict else actual_arg):
+        if type(item) in (dict, list, tuple):
+            size += len(item)
+    return size
+
+
+def _scannedArguments(plan):
+    """
+    Returns a tuple of (position, name, size) for the arguments of the <plan> whose checks walk their 
+    elements, where size(argument) is the number of the walked elements. The checks of the rest of the 
+    arguments (e.g. a minLength) take the same time for any number of elements, thus, they are not counted.
+    """
+    scanned = []
+    for arg_num, name in enumerate(plan.names[:len(plan.checkers)]):
+        typeSpec  = None if plan.typeSpecs is None else plan.typeSpecs[arg_num]
+        valueSpec = None if plan.valueSpecs is None else plan.valueSpecs[arg_num]
+
+        if _isSpecMapping(typeSpec) and type(typeSpec.get('command')) is dict and typeSpec['command'].get('checkConsistency') == True:
+            scanned.append((arg_num, name, _sequenceSize))
+        if _isSchemaSpec(valueSpec):
+            scanned.append((arg_num, name, _payloadSize))
+        elif _isSpecMapping(valueSpec) and not _isStreamSpec(valueSpec) and not _elementKeys.isdisjoint(valueSpec):
+            scanned.append((arg_num, name, _arraySize))
+    return tuple(scanned)
+
+
+def _argumentsCost(scanned, function_args, function_args_dict):
+    # an estimation of the cost of the checks of a call (i.e. the number of elements that are walked)
+    cost = 0
+    nargs = len(function_args)
+    for arg_num, name, size in scanned:
+        if arg_num < nargs:
+            cost += size(function_args[arg_num])
+        elif name in function_args_dict:
+            cost += size(function_args_dict[name])
+    return cost
+
+
+def _asyncCheckedFunction(validate_function, plan, offloadThreshold, executor):
+    # the wrappers of the coroutine functions and of the async generator functions. The arguments of 
+    # the calls whose cost (see _argumentsCost) reaches the <offloadThreshold> are checked in the 
+    # <executor> (None means the default executor of the event loop), so as not to block the event loop, 
+    # while the rest of the calls are checked directly.
+    # NOTE : 
+    #  - the arguments of an async generator are checked when its first item is requested
+    #  - the functionTime of the telemetry is not measured, since it would include the time of other tasks
+    check = plan.check
+    target = validate_function if plan.streams is None else _streamingFunction(validate_function, plan)
+    shouldCheck = None if plan.sampling is None else plan.sampling.shouldCheck
+    record = None if plan.telemetry is None else plan.telemetry.record
+    perf_counter = time.perf_counter
+    scanned = _scannedArguments(plan) if offloadThreshold is not None else ()
+
+    async def validate(function_args, function_args_dict):
+        if shouldCheck is not None and not shouldCheck():
+            return
+
+        start = perf_counter()
+        try:
+            if scanned and _argumentsCost(scanned, function_args, function_args_dict) >= offloadThreshold:
+                import asyncio # already imported, since an event loop runs this coroutine
+                await asyncio.get_running_loop().run_in_executor(executor, check, function_args, function_args_dict)
+            else:
+                check(function_args, function_args_dict)
+        except ArgumentError as error:
+            if record is not None:
+                record(validate_function, perf_counter() - start, None, error)
+            raise
+        if record is not None:
+            record(validate_function, perf_counter() - start, 0.0)
+
+    if inspect.isasyncgenfunction(validate_function):
+
+        @functools.wraps(validate_function)
+        async def decorator_wrapper(*function_args, **function_args_dict):
+            if 'removeChecks' not in function_args_dict or function_args_dict['removeChecks'] != True:
+                await validate(function_args, function_args_dict)
+                generator = target(*function_args, **function_args_dict)
+            else:
+                generator = validate_function(*function_args, **function_args_dict)
+
+            # the items, the sent values and the thrown exceptions are passed through
+            try:
+                item = await generator.__anext__()
+                while True:
+                    try:
+                        sent = yield item
+                    except GeneratorExit:
+                        raise
+                    except BaseException as error:
+                        item = await generator.athrow(error)
+                    else:
+                        item = await generator.asend(sent)
+            except StopAsyncIteration:
+                return
+            finally:
+                await generator.aclose()
+
+        kind = 'asyncgen'
+    else:
+
+        @functools.wraps(validate_function)
+        async def decorator_wrapper(*function_args, **function_args_dict):
+            if 'removeChecks' not in function_args_dict or function_args_dict['removeChecks'] != True:
+                await validate(function_args, function_args_dict)
+                return await target(*function_args, **function_args_dict)
+
+            return await validate_function(*function_args, **function_args_dict)
+        kind = 'coroutine'
+
+    decorator_wrapper.validationPlan = plan
+    decorator_wrapper.sampling = plan.sampling
+    decorator_wrapper.validationCache = plan.cache
+    decorator_wrapper.telemetry = plan.telemetry
+    RegisterWrapper(decorator_wrapper, PassthroughFunction(decorator_wrapper, kind))
+    return decorator_wrapper
+
+
+# the arguments of the decorators which are kept by the wrappers (see _decorate), so as a decorator which 
+# is stacked over another one and fused with it (see _stackedPlan) to use them as well
+_stackedOptions = ('backend', 'dumpSource', 'method', 'offloadThreshold', 'executor')
+
+
+def _decorate(validate_function, plan, args_dict):
+    wrapper = _createWrapper(validate_function, plan, args_dict)
+    wrapper.decoratorOptions = {key: args_dict[key] for key in _stackedOptions if key in args_dict}
+    return wrapper
+
+
+def _createWrapper(validate_function, plan, args_dict):
+    # selects the backend which is going to create the wrapper of the decorated function
+    backend = args_dict.get('backend', 'default')
+
+    if backend not in ('default', 'codegen'):
+        raise ValueError("Unknown backend '{0}'. The supported backends are: 'default' and 'codegen'.".format(backend))
+
+    # the coroutine functions and the async generator functions get async wrappers (for any backend)
+    if inspect.iscoroutinefunction(validate_function) or inspect.isasyncgenfunction(validate_function):
+        offloadThreshold = args_dict['offloadThreshold'] if 'offloadThreshold' in args_dict else asyncOffloadThreshold
+        return _asyncCheckedFunction(validate_function, plan, offloadThreshold, args_dict.get('executor'))
+
+    # NOTE : the statistical validation mode, the result cache, the telemetry, the streams and the named dimensions 
+    #        of the arrays are supported only by the default backend
+    if backend == 'codegen' and plan.sampling is None and plan.cache is None and plan.telemetry is None and plan.streams is None and plan.yields is None and plan.shapes is None:
+        wrapper = CompileSpecializedWrapper(plan, dumpSource=args_dict.get('dumpSource', False))
+        if wrapper is not None:
+            return wrapper
+
+    return _checkedFunction(validate_function, plan)
+
+
+def _stackedPlan(validate_function, accepted_arg_types, otherSpecs):
+    # returns the plan of <validate_function>, if it is the wrapper created directly by the other 
+    # decorator (<otherSpecs> is 'typeSpecs' or 'valueSpecs') and the two decorators can be fused
+    plan = getattr(validate_function, 'validationPlan', None)
+    if plan is None or getattr(validate_function, '__wrapped__', None) is not plan.function:
+        return None
+
+    ownSpecs = 'valueSpecs' if otherSpecs == 'typeSpecs' else 'typeSpecs'
+    if getattr(plan, ownSpecs) is not None or len(plan.checkers) != len(accepted_arg_types):
+        return None
+    return plan
+
+
+def _stackedArgs(validate_function, args_dict):
+    # the fused wrapper keeps the options of the other decorator (see _stackedOptions), e.g. the 'codegen' 
+    # backend or the 'offloadThreshold', unless they are given to this decorator as well
+    options = getattr(validate_function, 'decoratorOptions', None)
+    if not options or getattr(validate_function, 'validationPlan', None) is None:
+        return args_dict
+    return dict(options, **args_dict)
+
+
 def acceptedTypes(*accepted_arg_types, **args_dict):
     """
     A decorator which is used to check a function's inputs types.
+    The specifications are parsed only once, when the function is decorated (see ValidationPlan).
     
     Arguments:
         *accepted_arg_types -- a tuple of types e.g. (<type 'list'>, <type 'str'>)
@@ -417,6 +3365,19 @@ def acceptedTypes(*accepted_arg_types, **args_dict):
                                decorators functionality e.g. {'typesCheckEnabled': False}
                                currently, the supported dictionary fields are:
                                {'typesCheckEnabled': <bool>} --> this field enables/disables the type checks
+                               {'backend': 'codegen'}        --> generates a specialized wrapper (see GenerateWrapperSource)
+                               {'dumpSource': <bool>}        --> prints the source of the generated wrapper (debugging)
+                               {'sampleEvery': <int>}        --> only every Nth call is checked (see Sampling)
+                               {'sampleProbability': <float>}--> each call is checked with this probability
+                               {'sampleElements': <int>}     --> the elements of large lists/arrays are checked on a random subset
+                               {'sampleSeed': <int>}         --> the seed of the random sampling
+                               {'cacheSize': <int>}          --> caches up to N already validated values (see ValidationCache)
+                               {'telemetry': <bool>}         --> measures the calls, the times and the failures (see Telemetry)
+                               {'telemetryCallback': <func>} --> is called after every call with the telemetry of the call
+                               {'offloadThreshold': <int>}   --> (async functions) the arguments with more elements are checked in a thread pool
+                               {'executor': <Executor>}      --> (async functions) the thread pool (the default one of the event loop if None)
+                               {'yields': <dict>}            --> (generator functions) the specification of the yielded items e.g. 
+                                                                 {'iterOf': {'type': float, 'range': [0, 1]}, 'maxItems': 100}
     """
      
     def accept_decorator(validate_function):
@@ -425,51 +3386,32 @@ def acceptedTypes(*accepted_arg_types, **args_dict):
             if args_dict['typesCheckEnabled'] == False:
                 return validate_function
 
+        # the specifications of a method do not include self (or cls)
+        typeSpecs = _methodSpecs(validate_function, accepted_arg_types, _stackedArgs(validate_function, args_dict), {})
+
         ObjectConsistencyCheck = True    
         if 'ObjectConsistencyCheck' in args_dict:
             ObjectConsistencyCheck = args_dict['ObjectConsistencyCheck']
 
-        @functools.wraps(validate_function)
-        def decorator_wrapper(*function_args, **function_args_dict):   
-            function_args_default = get_default_args(validate_function)
-            argNms = getArgumentsNames(validate_function)
-
-            if 'removeChecks' in function_args_dict:
-                if function_args_dict['removeChecks'] == True:
-                    return validate_function(*function_args, **function_args_dict)            
+        # when stacked over acceptedValues, a single wrapper which checks both the types and the values is created
+        stacked = _stackedPlan(validate_function, typeSpecs, 'valueSpecs')
+        if stacked is not None:
+            plan = CompileValidationPlan(stacked.function, typeSpecs, stacked.valueSpecs, _samplingOf(args_dict) or stacked.sampling, _cacheOf(args_dict) or stacked.cache, 
+                                         _telemetryOf(args_dict) or stacked.telemetry, args_dict.get('yields'))
+            if plan.yields is None:
+                plan = plan._replace(yields=stacked.yields)
+            return _decorate(stacked.function, plan, _stackedArgs(validate_function, args_dict))
 
-            # checks the number of the given types
-            if len(accepted_arg_types) != len(function_args)+len(function_args_dict):
-                K = function_args_dict.keys()
-                for key in function_args_default.keys():
-                    if key not in K:
-                        function_args_dict.update({key: function_args_default[key]})
-
-            if len(accepted_arg_types) != len(function_args)+len(function_args_dict):
-                raise ValueError('Invalid number of arguments for {0}()'.format(validate_function.__name__))  
-                         
-            # checks the validity of the examined function's types
-            for arg_num, actual_arg in enumerate(function_args):
-                accepted_arg_type = accepted_arg_types[arg_num]            
-                
-                CheckTypes(arg_num, actual_arg, accepted_arg_type, validate_function) #, ObjectConsistencyCheck)
-
-
-            for idx, arg_key in enumerate(function_args_dict):                
-                arg_num           = argNms.index(arg_key) 
-                accepted_arg_type = accepted_arg_types[arg_num]
-                actual_arg        = function_args_dict[arg_key]
-
-                CheckTypes(arg_num, actual_arg, accepted_arg_type, validate_function) #, ObjectConsistencyCheck)
- 
-            return validate_function(*function_args, **function_args_dict)
-        return decorator_wrapper
-    return accept_decorator
+        plan = CompileValidationPlan(validate_function, typeSpecs=typeSpecs, sampling=_samplingOf(args_dict), cache=_cacheOf(args_dict), 
+                                     telemetry=_telemetryOf(args_dict), yields=args_dict.get('yields'))
+        return _decorate(validate_function, plan, args_dict)
+    return _memberDecorator(accept_decorator)
 
 
 def acceptedValues(*accepted_arg_types, **args_dict):
     """
     A decorator which is used to check a function's inputs values.
+    The specifications are parsed only once, when the function is decorated (see ValidationPlan).
     
     Arguments:
         *accepted_arg_types -- a tuple of dicts e.g. ({'range': [1, 10]}, {'set': [1,2,3,4,5]})
@@ -477,70 +3419,153 @@ def acceptedValues(*accepted_arg_types, **args_dict):
                                decorators functionality e.g. {'valueCheckEnabled': False}
                                currently, the supported dictionary fields are:
                                {'valueCheckEnabled': <bool>} --> this field enables/disables the type checks
+                               {'backend': 'codegen'}        --> generates a specialized wrapper (see GenerateWrapperSource)
+                               {'dumpSource': <bool>}        --> prints the source of the generated wrapper (debugging)
+                               {'sampleEvery': <int>}        --> only every Nth call is checked (see Sampling)
+                               {'sampleProbability': <float>}--> each call is checked with this probability
+                               {'sampleElements': <int>}     --> the elements of large lists/arrays are checked on a random subset
+                               {'sampleSeed': <int>}         --> the seed of the random sampling
+                               {'cacheSize': <int>}          --> caches up to N already validated values (see ValidationCache)
+                               {'telemetry': <bool>}         --> measures the calls, the times and the failures (see Telemetry)
+                               {'telemetryCallback': <func>} --> is called after every call with the telemetry of the call
+                               {'offloadThreshold': <int>}   --> (async functions) the arguments with more elements are checked in a thread pool
+                               {'executor': <Executor>}      --> (async functions) the thread pool (the default one of the event loop if None)
+                               {'yields': <dict>}            --> (generator functions) the specification of the yielded items e.g. 
+                                                                 {'iterOf': {'type': float, 'range': [0, 1]}, 'maxItems': 100}
     """
 
     def accept_decorator(validate_function):
         # check whether to apply the decoration functionality or not
-        if len(args_dict) > 0:  
+        if 'valueCheckEnabled' in args_dict:
             if args_dict['valueCheckEnabled'] == False:
                 return validate_function
-                
-        @functools.wraps(validate_function)
-        def decorator_wrapper(*function_args, **function_args_dict):
-            function_args_default = get_default_args(validate_function)
-            argNms = getArgumentsNames(validate_function)
 
-            # =========== 1st WAY ===================================
-            # sig = inspect.signature(validate_function)
-            # ba = sig.bind(*function_args, **function_args_dict)
-            # for param in sig.parameters.values():
-            #     if param.name not in ba.arguments:
-            #         ba.arguments[param.name] = param.default
-            # BA = ba.arguments
+        # the specifications of a method do not include self (or cls)
+        valueSpecs = _methodSpecs(validate_function, accepted_arg_types, _stackedArgs(validate_function, args_dict), {'command': 'noCheck'})
 
-            # if 'removeChecks' in function_args_dict:
-            #     if function_args_dict['removeChecks'] == True:
-            #         return validate_function(*function_args, **function_args_dict)
+        # when stacked over acceptedTypes, a single wrapper which checks both the types and the values is created
+        stacked = _stackedPlan(validate_function, valueSpecs, 'typeSpecs')
+        if stacked is not None:
+            plan = CompileValidationPlan(stacked.function, stacked.typeSpecs, valueSpecs, _samplingOf(args_dict) or stacked.sampling, _cacheOf(args_dict) or stacked.cache, 
+                                         _telemetryOf(args_dict) or stacked.telemetry, args_dict.get('yields'))
+            if plan.yields is None:
+                plan = plan._replace(yields=stacked.yields)
+            return _decorate(stacked.function, plan, _stackedArgs(validate_function, args_dict))
 
-            # if len(accepted_arg_types) != len(BA): 
-            #     raise ValueError('Invalid number of arguments for {0}()'.format(validate_function.__name__))  
+        plan = CompileValidationPlan(validate_function, valueSpecs=valueSpecs, sampling=_samplingOf(args_dict), cache=_cacheOf(args_dict), 
+                                     telemetry=_telemetryOf(args_dict), yields=args_dict.get('yields'))
+        return _decorate(validate_function, plan, args_dict)
+    return _memberDecorator(accept_decorator)
 
-            # for idx, arg_key in enumerate(BA.keys()):                
-            #     arg_num = argNms.index(arg_key) # find the correct index
-            #     actual_arg = BA[arg_key]
 
-            #     CheckValues(arg_num, actual_arg, accepted_arg_types, validate_function)
-            # =========== END OF 1st WAY =============================
+def accepted(types=None, values=None, **args_dict):
+    """
+    A decorator which is used to check both a function's inputs types and values. It is equivalent to 
+    stacking acceptedTypes over acceptedValues, but the arguments are bound only once and the type 
+    and the value check of each argument run one after the other, through a single wrapper.
+    
+    Arguments:
+        types       -- a tuple of types, the same as the *accepted_arg_types of acceptedTypes
+        values      -- a tuple of dicts, the same as the *accepted_arg_types of acceptedValues
+        **args_dict -- a dictionary with additional arguments used mainly for activate/deactivate the
+                       decorators functionality, currently, the supported dictionary fields are:
+                       {'typesCheckEnabled': <bool>} --> this field enables/disables the type checks
+                       {'valueCheckEnabled': <bool>} --> this field enables/disables the value checks
+                       {'backend': 'codegen'}        --> generates a specialized wrapper (see GenerateWrapperSource)
+                       {'dumpSource': <bool>}        --> prints the source of the generated wrapper (debugging)
+                       {'sampleEvery': <int>}, {'sampleProbability': <float>}, {'sampleElements': <int>}, 
+                       {'sampleSeed': <int>}         --> the statistical validation mode (see acceptedTypes)
+                       {'cacheSize': <int>}          --> caches up to N already validated values (see ValidationCache)
+                       {'telemetry': <bool>}, {'telemetryCallback': <func>} --> the telemetry (see Telemetry)
+                       {'offloadThreshold': <int>}, {'executor': <Executor>} --> the checks of async functions (see acceptedTypes)
+                       {'yields': <dict>}            --> the specification of the items yielded by a generator function (see acceptedTypes)
+    """
 
+    def accept_decorator(validate_function):
+        typeSpecs  = types
+        valueSpecs = values
 
+        # check whether to apply the decoration functionality or not
+        if 'typesCheckEnabled' in args_dict:
+            if args_dict['typesCheckEnabled'] == False:
+                typeSpecs = None
+        if 'valueCheckEnabled' in args_dict:
+            if args_dict['valueCheckEnabled'] == False:
+                valueSpecs = None
 
-            # =========== 2nd WAY ===================================
-            if 'removeChecks' in function_args_dict:
-                if function_args_dict['removeChecks'] == True:
-                    return validate_function(*function_args, **function_args_dict)
+        if typeSpecs is None and valueSpecs is None:
+            return validate_function
 
-            # checks the number of the given types
-            if len(accepted_arg_types) != len(function_args)+len(function_args_dict):
-                K = function_args_dict.keys()
-                for key in function_args_default.keys():
-                    if key not in K:
-                        function_args_dict.update({key: function_args_default[key]})
+        # the specifications of a method do not include self (or cls)
+        typeSpecs  = _methodSpecs(validate_function, typeSpecs, args_dict, {})
+        valueSpecs = _methodSpecs(validate_function, valueSpecs, args_dict, {'command': 'noCheck'})
 
-            if len(accepted_arg_types) != len(function_args)+len(function_args_dict):
-                raise ValueError('Invalid number of arguments for {0}()'.format(validate_function.__name__))  
+        plan = CompileValidationPlan(validate_function, typeSpecs, valueSpecs, _samplingOf(args_dict), _cacheOf(args_dict), _telemetryOf(args_dict), 
+                                     args_dict.get('yields'))
+        return _decorate(validate_function, plan, args_dict)
+    return _memberDecorator(accept_decorator)
 
-            # checks the validity of the examined function's values
-            for arg_num, actual_arg in enumerate(function_args):
-                CheckValues(arg_num, actual_arg, accepted_arg_types, validate_function)                    
 
+def acceptedAnnotations(validate_function=None, **args_dict):
+    """
+    A decorator which is used to check both a function's inputs types and values, as they are declared by 
+    its type hints (see AnnotationSpecs), e.g.
+        @acceptedAnnotations
+        def Func1(input1: Annotated[float, Range(1, 10)], input2: list[int] | None = None): 
+            pass
+    The hints are read only once, when the function is decorated (or on its first call, if a hint refers to 
+    a name which is not defined yet), and the checks are the same as the checks of the accepted decorator.
+    When a class is decorated, then all its public methods (plus __init__ and __call__), classmethods, 
+    staticmethods and property setters which have type hints are decorated at once, while each distinct 
+    hint is parsed only once for the whole class.
+    
+    Arguments:
+        validate_function -- the decorated function or class (when the decorator is used without arguments)
+        **args_dict       -- the same additional arguments as the ones of the accepted decorator
+    """
 
-            for idx, arg_key in enumerate(function_args_dict):                
-                arg_num = argNms.index(arg_key)
-                actual_arg = function_args_dict[arg_key]
+    def accept_function(validate_function, specsCache=None, localns=None):
+        try:
+            typeSpecs, valueSpecs = AnnotationSpecs(validate_function, specsCache, localns)
+        except NameError: # a forward reference, which is resolved on the first call
+            return _deferredFunction(validate_function, lambda: accept_specs(validate_function, *AnnotationSpecs(validate_function, specsCache, localns)))
+        return accept_specs(validate_function, typeSpecs, valueSpecs)
 
-                CheckValues(arg_num, actual_arg, accepted_arg_types, validate_function)  
-            # =========== END OF 2nd WAY =============================          
+    def accept_specs(validate_function, typeSpecs, valueSpecs):
+        # check whether to apply the decoration functionality or not
+        if 'typesCheckEnabled' in args_dict:
+            if args_dict['typesCheckEnabled'] == False:
+                typeSpecs = None
+        if 'valueCheckEnabled' in args_dict:
+            if args_dict['valueCheckEnabled'] == False:
+                valueSpecs = None
+
+        if typeSpecs is None and valueSpecs is None or len(typeSpecs or valueSpecs) == 0:
+            return validate_function
+
+        plan = CompileValidationPlan(validate_function, typeSpecs, valueSpecs, _samplingOf(args_dict), _cacheOf(args_dict), _telemetryOf(args_dict), 
+                                     args_dict.get('yields'))
+        return _decorate(validate_function, plan, args_dict)
+
+    def accept_class(cls):
+        specsCache = {}
+        localns    = {cls.__name__: cls} # e.g. the hints of the methods which return the class itself
+        accept_member = _memberDecorator(lambda function: accept_function(function, specsCache, localns))
+
+        for name, member in list(vars(cls).items()):
+            if name.startswith('_') and name not in ('__init__', '__call__'):
+                continue
+            function = member.fset if isinstance(member, property) else getattr(member, '__func__', member)
+            if not isinstance(function, types.FunctionType) or not set(function.__annotations__) - {'return'} or hasattr(function, 'validationPlan'):
+                continue
+            setattr(cls, name, accept_member(member))
+        return cls
+
+    def accept_decorator(validate_function):
+        if inspect.isclass(validate_function):
+            return accept_class(validate_function)
+        return _memberDecorator(accept_function)(validate_function)
 
-            return validate_function(*function_args, **function_args_dict)
-        return decorator_wrapper
+    if validate_function is not None:
+        return accept_decorator(validate_function)
     return accept_decorator
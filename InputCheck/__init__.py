@@ -22,5 +22,13 @@
 #
 #  ==================================================================================
 
-import numpy as np
-import functools
\ No newline at end of file
+import functools
+
+
+def __getattr__(name):
+    # NumPy is imported on its first use (see InputCheckDecorators._loadNumpy), 
+    # so as the code which checks only numbers and strings to start fast
+    if name == 'np':
+        from InputCheck.InputCheckDecorators import _loadNumpy
+        return _loadNumpy()
+    raise AttributeError("module 'InputCheck' has no attribute '{0}'".format(name))
@@ -0,0 +1,229 @@
+#  ==================================================================================
+#  
+#  Copyright (c) 2018, Evangelos G. Karakasis 
+#  
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#  
+#  ==================================================================================
+
+# ----------
+# Measures the per-call overhead of the decorators. Each case times a decorated function against 
+# the same, undecorated, function, for positional, keyword and defaulted arguments, for numbers, 
+# strings, lists and arrays of different sizes, as well as for the disabled and the removeChecks paths.
+#
+# The results are written to a JSON file. When a baseline JSON file is given, the cases which have 
+# become slower than the baseline by more than a threshold are reported as regressions.
+#
+# Usage:
+#   > $ python bench_decorators.py --output results.json
+#   > $ python bench_decorators.py --output new.json --baseline results.json --threshold 0.25
+#   > $ python -m InputCheck.benchmarks.bench_decorators --output results.json (from the root folder)
+# ----------
+
+import sys
+sys.path.append('../')
+sys.path.append('../../')
+
+from InputCheck.InputCheckDecorators import acceptedTypes, acceptedValues, accepted, checksDisabled
+from InputCheck import np
+import argparse
+import json
+import platform
+import timeit
+
+
+def _function(default, withRemoveChecks=False):
+    # NOTE : the removeChecks argument is passed to the decorated function as well
+    if withRemoveChecks:
+        def func(input1, input2, input3=default, removeChecks=False):
+            return input1
+    else:
+        def func(input1, input2, input3=default):
+            return input1
+    return func
+
+
+# the arguments and the specifications of each kind of data.
+# Each entry is: (arguments, types specifications, values specifications)
+def _datasets():
+    consistentList = {'type': list, 'command': {'checkConsistency': True}}
+    datasets = {
+        'int' : ((1, 2, 3), (int, [int, float], int), ({'range': [0, 10]}, {'minValue': 0}, {'set': {1, 2, 3}})),
+        'str' : (('ab', 'cd', 'ef'), (str, str, str), ({'rangeLength': [1, 5]}, {'minLength': 1}, {'set': {'ab', 'cd', 'ef'}})),
+    }
+    for size in (10, 1000, 100000):
+        value = list(range(size))
+        datasets['list{0}'.format(size)] = ((value, value, value), (consistentList,) * 3, ({'minLength': 1},) * 3)
+    for size in (10, 1000, 1000000):
+        value = np.linspace(0, 1, size)
+        datasets['ndarray{0}'.format(size)] = ((value, value, value), (np.ndarray,) * 3, ({'rowsMin': 1, 'elemRange': [0, 1]},) * 3)
+    record = {'type': dict, 'keys': {'id': {'type': int, 'minValue': 1}, 'name': {'type': str, 'minLength': 1}, 'tags': {'type': list, 'listOf': {'type': str}}}}
+    schema = {'schema': {'type': dict, 'keys': {'records': {'type': list, 'listOf': record}}}}
+    for size in (10, 1000):
+        value = {'records': [{'id': idx + 1, 'name': 'name', 'tags': ['a', 'b']} for idx in range(size)]}
+        datasets['payload{0}'.format(size)] = ((value, value, value), (dict,) * 3, (schema,) * 3)
+    return datasets
+
+
+# the statements which call the function, where a, b and c are the three arguments
+_calls = {
+    'positional' : 'func(a, b, c)',
+    'keyword'    : 'func(input1=a, input2=b, input3=c)',
+    'defaulted'  : 'func(a, b)',
+}
+
+
+def _decorated(variant, args, typeSpecs, valueSpecs, withRemoveChecks=False):
+    # returns the function of a variant, where the default value of the 3rd argument is the 3rd of the <args>
+    func = _function(args[2], withRemoveChecks)
+    if variant == 'undecorated':
+        return func
+    elif variant == 'acceptedTypes':
+        return acceptedTypes(*typeSpecs)(func)
+    elif variant == 'acceptedValues':
+        return acceptedValues(*valueSpecs)(func)
+    elif variant == 'stacked':
+        return acceptedTypes(*typeSpecs)(acceptedValues(*valueSpecs)(func))
+    elif variant == 'accepted':
+        return accepted(types=typeSpecs, values=valueSpecs)(func)
+    elif variant == 'codegen':
+        return accepted(types=typeSpecs, values=valueSpecs, backend='codegen')(func)
+    raise ValueError('Unknown variant {0}.'.format(variant))
+
+
+_variants = ('undecorated', 'acceptedTypes', 'acceptedValues', 'stacked', 'accepted', 'codegen')
+
+
+def buildCases(filterText=None):
+    """
+    Returns a list of (name, baseline name, statement, namespace, context) tuples, where the <baseline name> 
+    is the name of the undecorated case which the case is compared to and the <context> is a context manager 
+    factory (or None) that is entered while the case is timed.
+    """
+    cases = []
+    for dataName, (args, typeSpecs, valueSpecs) in _datasets().items():
+        callKinds = _calls if dataName in ('int', 'str') else {'positional': _calls['positional']}
+        for callName, statement in callKinds.items():
+            baseName = '{0}/{1}/undecorated'.format(dataName, callName)
+            for variant in _variants:
+                namespace = {'func': _decorated(variant, args, typeSpecs, valueSpecs), 'a': args[0], 'b': args[1], 'c': args[2]}
+                cases.append(('{0}/{1}/{2}'.format(dataName, callName, variant), baseName, statement, namespace, None))
+
+        # the paths which skip the checks
+        baseName  = '{0}/positional/undecorated'.format(dataName)
+        namespace = {'func': _decorated('stacked', args, typeSpecs, valueSpecs), 'a': args[0], 'b': args[1], 'c': args[2]}
+        cases.append(('{0}/positional/disabled'.format(dataName), baseName, _calls['positional'], namespace, checksDisabled))
+        namespace = {'func': _decorated('stacked', args, typeSpecs, valueSpecs, True), 'a': args[0], 'b': args[1], 'c': args[2]}
+        cases.append(('{0}/removeChecks/stacked'.format(dataName), baseName, 'func(a, b, c, removeChecks=True)', namespace, None))
+
+    if filterText:
+        cases = [case for case in cases if filterText in case[0]]
+    return cases
+
+
+def timeCase(statement, namespace, repeat=5, minTime=0.05):
+    """
+    Returns the best time (in seconds) of a single execution of the <statement>, out of <repeat> measurements.
+    """
+    timer = timeit.Timer(statement, globals=namespace)
+    number, elapsed = timer.autorange()
+    while elapsed < minTime:
+        number *= 2
+        elapsed = timer.timeit(number)
+    return min(timer.repeat(repeat, number)) / number
+
+
+def runBenchmarks(filterText=None, repeat=5, minTime=0.05, verbose=True):
+    """
+    Runs the benchmarks and returns a dictionary with the environment and the results, where each 
+    result holds the time per call (perCall) and the overhead over the undecorated function (overhead), 
+    both in seconds.
+    """
+    results = {}
+    cases   = buildCases(filterText)
+    for name, baseName, statement, namespace, context in cases:
+        if context is None:
+            perCall = timeCase(statement, namespace, repeat, minTime)
+        else:
+            with context():
+                perCall = timeCase(statement, namespace, repeat, minTime)
+        results[name] = {'perCall': perCall}
+
+    for name, baseName, statement, namespace, context in cases:
+        if baseName in results:
+            results[name]['overhead'] = results[name]['perCall'] - results[baseName]['perCall']
+        if verbose:
+            print('{0:45s} {1:12.3f} us {2:>12s}'.format(name, results[name]['perCall'] * 1e6, 
+                  '' if 'overhead' not in results[name] else '{0:+.3f} us'.format(results[name]['overhead'] * 1e6)))
+
+    return {
+        'python'  : platform.python_version(),
+        'numpy'   : np.__version__,
+        'platform': platform.platform(),
+        'results' : results,
+    }
+
+
+def compareResults(current, baseline, threshold=0.25):
+    """
+    Compares the <current> results with the <baseline> results and returns a list of 
+    (name, baseline time, current time, ratio) for the cases whose time per call has 
+    increased by more than <threshold> (e.g. 0.25 means 25%).
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        previous = baseline['results'].get(name)
+        if previous is None or previous['perCall'] <= 0:
+            continue
+
+        ratio = result['perCall'] / previous['perCall']
+        if ratio > 1 + threshold:
+            regressions.append((name, previous['perCall'], result['perCall'], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measures the per-call overhead of the InputCheck decorators.')
+    parser.add_argument('--output',    default='bench_results.json', help='the JSON file where the results are written')
+    parser.add_argument('--baseline',  default=None, help='a JSON file with previous results to compare with')
+    parser.add_argument('--threshold', default=0.25, type=float, help='the relative slowdown which is reported as a regression')
+    parser.add_argument('--filter',    default=None, help='runs only the cases whose name contains this text')
+    parser.add_argument('--repeat',    default=5, type=int, help='the number of the measurements of each case')
+    args = parser.parse_args(argv)
+
+    current = runBenchmarks(args.filter, args.repeat)
+    with open(args.output, 'w') as file:
+        json.dump(current, file, indent=2, sort_keys=True)
+
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+
+    regressions = compareResults(current, baseline, args.threshold)
+    for name, previous, perCall, ratio in regressions:
+        print('REGRESSION {0}: {1:.3f} us -> {2:.3f} us (x{3:.2f})'.format(name, previous * 1e6, perCall * 1e6, ratio))
+    if not regressions:
+        print('No regressions (threshold: {0:.0%}).'.format(args.threshold))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
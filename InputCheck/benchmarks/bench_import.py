@@ -0,0 +1,116 @@
+#  ==================================================================================
+#
+#  Copyright (c) 2018, Evangelos G. Karakasis
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+#  ==================================================================================
+
+# ----------
+# Measures the import time of InputCheck (with python -X importtime, in a new interpreter for each run) 
+# and checks it against a budget, so as the code which checks only numbers and strings not to pay for 
+# the import of NumPy (or of any other heavy module) again. The run fails (exit status 1) if the median 
+# import time exceeds the budget or if any of the forbidden modules has been imported.
+#
+# The import time depends on the machine, so the budget is better set relative to a baseline, i.e. the 
+# JSON file of a previous run on the same machine: the budget is then the baseline import time increased 
+# by the threshold. Without a baseline, the (absolute) default budget is loose enough for a clean import 
+# (37 ms on an idle reference machine and up to 78 ms on a loaded one, where NumPy alone adds about 80 ms).
+#
+# NOTE : run the benchmark once before measuring, so as the bytecode (.pyc) of the modules to be cached.
+#
+# Usage:
+#   > $ python bench_import.py --output import.json
+#   > $ python bench_import.py --baseline import.json --threshold 0.25
+#   > $ python -m InputCheck.benchmarks.bench_import (from the root folder)
+# ----------
+
+import sys
+sys.path.append('../')
+sys.path.append('../../')
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+
+
+# the modules that must not be imported by "import InputCheck.InputCheckDecorators"
+_forbidden = ('numpy', 'asyncio', 'concurrent.futures')
+
+# the budget (in milliseconds) when no baseline is given
+_defaultBudget = 120.0
+
+
+def measureImport(module='InputCheck.InputCheckDecorators', runs=10):
+    """
+    Returns the median import time (in milliseconds) of the <module> and the set of the modules it imports.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env  = dict(os.environ, PYTHONPATH=root)
+    times, imported = [], set()
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + module], 
+                                env=env, capture_output=True, text=True, check=True)
+        # each line is: "import time: <self us> | <cumulative us> | <indented module name>"
+        for line in output.stderr.splitlines():
+            if not line.startswith('import time:') or line.endswith('imported package'):
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            if not cumulative.strip().isdigit():
+                continue
+            name = name.strip()
+            imported.add(name)
+            if name == module:
+                times.append(int(cumulative) / 1000)
+    return statistics.median(times), imported
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measures the import time of InputCheck against a budget.')
+    parser.add_argument('--budget',    default=None, type=float, help='the maximum import time, in milliseconds (default: {0:g})'.format(_defaultBudget))
+    parser.add_argument('--baseline',  default=None, help='a JSON file of a previous run, whose import time increased by the threshold is the budget')
+    parser.add_argument('--threshold', default=0.25, type=float, help='the relative slowdown over the baseline which is allowed')
+    parser.add_argument('--runs',      default=10, type=int, help='the number of the measured imports')
+    parser.add_argument('--output',    default=None, help='the JSON file where the results are written')
+    args = parser.parse_args(argv)
+
+    if args.budget is not None and args.baseline is not None:
+        parser.error('the --budget and --baseline arguments cannot be combined')
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            args.budget = json.load(file)['importTime'] * (1 + args.threshold)
+    elif args.budget is None:
+        args.budget = _defaultBudget
+
+    importTime, imported = measureImport(runs=args.runs)
+    forbidden = sorted(name for name in _forbidden if name in imported)
+    print('import time: {0:.1f} ms (budget {1:.1f} ms)'.format(importTime, args.budget))
+    if forbidden:
+        print('forbidden modules imported: {0}'.format(', '.join(forbidden)))
+
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump({'importTime': importTime, 'budget': args.budget, 'forbidden': forbidden}, file, indent=2, sort_keys=True)
+    return 1 if importTime > args.budget or forbidden else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#  ==================================================================================
+#
+#  Copyright (c) 2018, Evangelos G. Karakasis
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#
+#  ==================================================================================
+
+# ----------
+# Measures the memory footprint of each decorated function, when many functions share a few common
+# specifications (e.g. probabilities in [0, 1], positive ints and non empty strings). Each case is
+# measured twice: with the specifications copied and compiled per function (internSpecs = False) and
+# with the interned specifications and the shared compiled checks (internSpecs = True).
+#
+# Usage:
+#   > $ python bench_memory.py --functions 2000 --output memory.json
+#   > $ python -m InputCheck.benchmarks.bench_memory --functions 2000 (from the root folder)
+# ----------
+
+import sys
+sys.path.append('../')
+sys.path.append('../../')
+
+from InputCheck import InputCheckDecorators
+from InputCheck.InputCheckDecorators import acceptedValues, accepted, Range, MinLength
+import argparse
+import gc
+import json
+import tracemalloc
+
+
+def _function():
+    # a new function object for each decoration, as in a real code base
+    def func(input1, input2, input3):
+        return input1
+    return func
+
+
+# the decorators of each case, which are applied to every function
+_cases = {
+    'values_dicts' : lambda: acceptedValues({'range': [0, 1]}, {'minLength': 1}, {'minValue': 1}),
+    'values_specs' : lambda: acceptedValues(Range(0, 1), MinLength(1), {'minValue': 1}),
+    'accepted'     : lambda: accepted(types=(float, str, int), values=({'range': [0, 1]}, {'minLength': 1}, {'minValue': 1})),
+    'arrays'       : lambda: acceptedValues({'rowsMin': 1, 'elemRange': [0, 1], 'finite': True}, {'set': ['fast', 'slow']}, {'range': [1, 96000]}),
+}
+
+
+def measureCase(decorator, functions=2000, intern=True):
+    """
+    Returns the memory (in bytes) allocated per decorated function, for <functions> functions.
+    """
+    previous = InputCheckDecorators.internSpecs
+    InputCheckDecorators.internSpecs = intern
+    try:
+        undecorated = [_function() for _ in range(functions)]
+        gc.collect()
+        tracemalloc.start()
+        decorated = [decorator()(func) for func in undecorated]
+        gc.collect()
+        allocated, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        InputCheckDecorators.internSpecs = previous
+
+    del decorated
+    return allocated / functions
+
+
+def runBenchmarks(functions=2000, verbose=True):
+    results = {}
+    for name, decorator in _cases.items():
+        before = measureCase(decorator, functions, intern=False)
+        after  = measureCase(decorator, functions, intern=True)
+        results[name] = {'bytesPerFunction': after, 'bytesPerFunctionWithoutInterning': before}
+        if verbose:
+            print('{0:<14} {1:>9.0f} B -> {2:>9.0f} B per function (x{3:.1f} smaller)'.format(name, before, after, before / after))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measures the memory footprint of the functions decorated by InputCheck.')
+    parser.add_argument('--output',    default='memory_results.json', help='the JSON file where the results are written')
+    parser.add_argument('--functions', default=2000, type=int, help='the number of the decorated functions of each case')
+    args = parser.parse_args(argv)
+
+    results = runBenchmarks(args.functions)
+    with open(args.output, 'w') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+#  ==================================================================================
+#  
+#  Copyright (c) 2018, Evangelos G. Karakasis 
+#  
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#  
+#  The above copyright notice and this permission notice shall be included in all
+#  copies or substantial portions of the Software.
+#  
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#  SOFTWARE.
+#  
+#  ==================================================================================
+
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+#                   Unit testing
+# =-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
+
+import sys
+sys.path.append('../')
+sys.path.append('../../')
+
+from InputCheck.InputCheckDecorators import acceptedValues, accepted
+from InputCheck.InputCheckBatch import validateBatch
+from InputCheck import np
+import unittest
+
+
+class Tests_validateBatch(unittest.TestCase):
+
+    def test_validateBatch_01_number(self):
+        @acceptedValues({'range': [1, 10]}, {'minValue': 5}, {'maxValue': 100, 'set': [1, 50, 100]})
+        def func(input1, input2, input3):
+            pass
+
+        mask = validateBatch(func, [[1, 0, 5, 11], np.array([5, 5, 4, 6]), [1, 50, 100, 2.0]])
+        self.assertEqual(mask.tolist(), [True, False, False, False])
+
+        indices = validateBatch(func, [[1, 0, 5], [5, 5, 4], [1, 50, 100]], returnIndices=True)
+        self.assertEqual(indices.tolist(), [1, 2])
+
+    def test_validateBatch_02_string(self):
+        @acceptedValues({'rangeLength': [1, 3]}, {'set': ['a', 'b']})
+        def func(input1, input2):
+            pass
+
+        mask = validateBatch(func, {'input1': ['a', '', 'abcd', 'ab'], 'input2': np.array(['a', 'b', 'a', 'c'])})
+        self.assertEqual(mask.tolist(), [True, False, False, False])
+
+    def test_validateBatch_03_ranges(self):
+        @acceptedValues({'ranges': [[1, 5], [10, 20]]}, {'rangesLength': [[1, 2], [4, 4]]})
+        def func(input1, input2):
+            pass
+
+        mask = validateBatch(func, [[1, 5.5, 10, 21, 0, float('nan')], ['a', 'ab', 'abc', 'abcd', 'a', 'a']])
+        self.assertEqual(mask.tolist(), [True, False, False, False, False, False])
+
+    def test_validateBatch_04_generic_and_defaults(self):
+        @accepted(types=([int, float], [list, tuple], int), values=({'range': [1, 10], 'command': 'allowNone'}, {'maxLength': 2}, {'minValue': 0}))
+        def func(input1, input2, input3=1):
+            pass
+
+        # mixed types and None values are checked element by element
+        mask = validateBatch(func, [[1, None, 'a', 20], [[1], (1, 2), [1, 2, 3], []]])
+        self.assertEqual(mask.tolist(), [True, True, False, False])
+
+        self.assertEqual(validateBatch(func, [[1], [[1]]], accepted_arg_types=({}, {}, {'minValue': 5})).tolist(), [False])
+
+        # an invalid default value invalidates every row
+        def func2(input1, input2=1):
+            pass
+
+        mask = validateBatch(func2, [[1, 2]], accepted_arg_types=({'range': [1, 10]}, {'minValue': 5}))
+        self.assertEqual(mask.tolist(), [False, False])
+
+    def test_validateBatch_05_errors(self):
+        @acceptedValues({'range': [1, 10]}, {'minValue': 5})
+        def func(input1, input2):
+            pass
+
+        def func2(input1):
+            pass
+
+        with self.assertRaises(ValueError):
+            validateBatch(func, [[1, 2], [5]])
+        with self.assertRaises(ValueError):
+            validateBatch(func, [[1, 2]])
+        with self.assertRaises(ValueError):
+            validateBatch(func, {'input1': [1], 'input3': [5]})
+        with self.assertRaises(ValueError):
+            validateBatch(func2, [[1]])
+        self.assertEqual(validateBatch(func2, [[1, 20]], ({'range': [1, 10]},)).tolist(), [True, False])
+
+
+    def test_validateBatch_06_iterables_and_schemas(self):
+        @acceptedValues({'iterOf': {'type': float, 'range': [0, 1]}}, {'schema': {'keys': {'id': {'type': int}}, 'optional': {'tags': {'listOf': {'type': str}}}}})
+        def func(input1, input2):
+            pass
+
+        items    = [[0.5], [0.5, 2.0], [0.5, 'a'], 5, (0.1,)]
+        payloads = [{'id': 1}, {'id': 2}, {'id': 3}, {'id': 4}, {'id': 5, 'tags': ['a', 1]}]
+        self.assertEqual(validateBatch(func, [items, payloads]).tolist(), [True, False, False, False, False])
+
+        payloads = [{'id': 1, 'tags': []}, {'id': 'a'}, [], None, {'tags': ['a']}]
+        self.assertEqual(validateBatch(func, {'input1': [[0.5]] * 5, 'input2': payloads}).tolist(), [True, False, False, False, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -30,8 +30,26 @@ import sys
 sys.path.append('../')
 sys.path.append('../../')
 
-from InputCheck.InputCheckDecorators import acceptedTypes, acceptedValues
+from InputCheck.InputCheckDecorators import acceptedTypes, acceptedValues, accepted
+from InputCheck.InputCheckDecorators import setChecksEnabled, getChecksEnabled, checksDisabled, checksEnabled
+from InputCheck.InputCheckDecorators import ArgumentError, ArgumentTypeError, ArgumentValueError
+from InputCheck.InputCheckDecorators import acceptedAnnotations, Range, ValidatedAttribute
+from InputCheck.InputCheckDecorators import ValueSpec, MinLength, OneOf, ArraySpec
+from InputCheck import InputCheckDecorators
 from InputCheck import np
+import asyncio
+import collections
+import concurrent.futures
+import inspect
+import itertools
+import numbers
+import os
+import pickle
+import subprocess
+import tempfile
+import threading
+import time
+import typing
 import unittest
 
 # NOTE : the tests are not exhaustive, more test should be designed to check every known possible situation, 
@@ -190,6 +208,69 @@ class Tests_acceptedTypes(unittest.TestCase):
         func2('some text')
 
 
+    def test_acceptedTypes_05_consistency(self):
+        typeCheck = {
+            'type': [list, tuple],
+            'command': {
+                'checkConsistency': True,
+                'consistencyType' : numbers.Real # <-- an abstract type accepts its subclasses
+            }
+        }
+        @acceptedTypes(typeCheck)
+        def func(input1):
+            pass
+
+        typeCheck2 = {
+            'type': list,
+            'command': {
+                'checkConsistency'   : True,
+                'consistencyType'    : dict,
+                'consistencySubclass': True
+            }
+        }
+        @acceptedTypes(typeCheck2)
+        def func2(input1):
+            pass
+
+        func([])
+        func([1.0] * 100000)
+        func((True, False))
+        func([np.float64(1.0), np.float64(2.0)])
+        with self.assertRaises(TypeError):
+            func([1.0] * 100000 + [1])
+        with self.assertRaises(TypeError):
+            func(['a', 'b'])
+
+        func2([collections.OrderedDict(), collections.OrderedDict()])
+        func2([{}, {}])
+        with self.assertRaises(TypeError):
+            func2([{}, collections.OrderedDict()])
+        with self.assertRaises(TypeError):
+            func2([[], []])
+
+    def test_acceptedTypes_06_subclasses(self):
+        @acceptedTypes((int, float), numbers.Real, [collections.abc.Sequence, collections.abc.Mapping], [int, float])
+        def func(input1, input2, input3, input4):
+            return input1
+
+        self.assertEqual(func(True, np.float64(1), (1,), 1), True)
+        self.assertEqual(func(np.float64(1), 1, 'abc', 1.0), np.float64(1))
+        self.assertEqual(func(1, 1.0, collections.OrderedDict(), 1), 1)
+        with self.assertRaises(TypeError):
+            func('1', 1, [], 1)
+        with self.assertRaises(TypeError):
+            func(1, 1j, [], 1)
+        with self.assertRaises(TypeError):
+            func(1, 1, {1}, 1)
+        with self.assertRaises(TypeError) as context:
+            func(1, 1, [], True) # the list of types keeps the exact types
+        self.assertEqual(context.exception.code, 'type')
+
+        # the decision for each type is computed only once
+        typeCheck = func.validationPlan.typeCheckers[1]
+        self.assertEqual(typeCheck.decisions, {np.float64: True, int: True, float: True, complex: False})
+
+
 class Tests_acceptedValues(unittest.TestCase):
 
     def test_acceptedValues_01_number(self):
@@ -380,5 +461,1341 @@ class Tests_acceptedValues(unittest.TestCase):
         func8(None)
 
 
+    def test_acceptedValues_05_array_elements(self):
+        @acceptedValues({'elemRange': [0, 1], 'finite': True}, {'elemMin': 0, 'noNaN': True}, {'dtype': [np.float32, np.float64], 'command': 'allowNone'})
+        def func1(input1, input2, input3=None):
+            pass
+
+        @acceptedValues({'monotonic': 'strictlyIncreasing'})
+        def func2(input1):
+            pass
+
+        func1(np.random.rand(1000), np.array([0, np.inf]))
+        func1(np.random.rand(10, 10)[:, ::2], np.arange(5), np.ones(3, dtype=np.float32))
+        with self.assertRaises(ValueError):
+            func1(np.array([0.5, 2.0]), np.arange(5))
+        with self.assertRaises(ValueError):
+            func1(np.array([0.5, np.nan]), np.arange(5))
+        with self.assertRaises(ValueError):
+            func1(np.array([0.5, -np.inf]), np.arange(5))
+        with self.assertRaises(ValueError):
+            func1(np.array([0.5]), np.array([1.0, np.nan]))
+        with self.assertRaises(ValueError):
+            func1(np.array([0.5]), np.array([-1, 5]))
+        with self.assertRaises(ValueError):
+            func1(np.array([0.5]), np.arange(5), np.arange(5))
+
+        # the elements are checked in chunks, thus, the boundaries between the chunks must be checked as well
+        chunkSize = InputCheckDecorators.arrayChunkSize
+        InputCheckDecorators.arrayChunkSize = 4
+        try:
+            func2(np.arange(10))
+            signal = np.arange(10)
+            signal[4] = 3
+            with self.assertRaises(ValueError):
+                func2(signal)
+            with self.assertRaises(ValueError):
+                func1(np.array([0.5, 0.5, 0.5, 0.5, 0.5, 2.0]), np.arange(5))
+        finally:
+            InputCheckDecorators.arrayChunkSize = chunkSize
+
+    def test_acceptedValues_06_sets_and_ranges(self):
+        codes = list(range(0, 20000, 2))
+
+        @acceptedValues({'set': codes}, {'set': ['a', 'b', [1, 2]]}, {'ranges': [[10, 20], [1, 5], [4, 8]]}, {'rangesLength': [[1, 2], [5, 5]]})
+        def func(input1, input2, input3, input4):
+            return input1
+
+        # the 'set' is hashed once, while the given specification (as a list) is kept for the error messages
+        self.assertEqual(func(19998, 'a', 1, 'ab'), 19998)
+        self.assertEqual(func(4, 'b', 20, 'abcde'), 4)
+        with self.assertRaises(ValueError) as context:
+            func(3, 'a', 1, 'a')
+        self.assertEqual(context.exception.constraint, codes)
+        with self.assertRaises(ValueError):
+            func(4, 'c', 1, 'a')
+
+        # the overlapping intervals are merged and NaN does not belong to any interval
+        self.assertEqual(func(4, 'a', 8.0, 'a'), 4)
+        for value in (0, 9, 8.5, 21, float('nan')):
+            with self.assertRaises(ValueError):
+                func(4, 'a', value, 'a')
+        for value in ('', 'abc', 'abcdef'):
+            with self.assertRaises(ValueError) as context:
+                func(4, 'a', 1, value)
+        self.assertEqual(str(context.exception), 'The 4th argument of the function func() has length out of the accepted ranges: [[1, 2], [5, 5]].')
+
+        with self.assertRaises(ValueError):
+            acceptedValues({'ranges': [[5, 1]]})(lambda input1: input1)
+
+
+    def test_acceptedValues_07_parallel(self):
+        @acceptedValues({'elemRange': [0, 1], 'finite': True, 'parallel': True}, {'monotonic': 'strictlyIncreasing', 'parallel': True})
+        def func(input1, input2):
+            pass
+
+        options = (InputCheckDecorators.parallelWorkers, InputCheckDecorators.parallelMinChunkSize, InputCheckDecorators.arrayChunkSize)
+        InputCheckDecorators.parallelWorkers      = 4
+        InputCheckDecorators.parallelMinChunkSize = 8
+        InputCheckDecorators.arrayChunkSize       = 4
+        try:
+            executor = InputCheckDecorators._parallelExecutor()
+            submit = executor.submit
+            calls = []
+            executor.submit = lambda *args: calls.append(args) or submit(*args)
+
+            # the small arrays are checked by the calling thread
+            func(np.zeros(15), np.arange(15))
+            self.assertEqual(calls, [])
+
+            signal = np.linspace(0, 1, 100)
+            func(signal, np.arange(100))
+            self.assertEqual(len(calls), 8)
+            for idx in (0, 30, 99):
+                invalid = signal.copy()
+                invalid[idx] = np.inf
+                with self.assertRaises(ValueError):
+                    func(invalid, np.arange(100))
+
+            # the monotonicity is checked between the parts as well
+            increasing = np.arange(100)
+            increasing[25] = increasing[24]
+            with self.assertRaises(ValueError):
+                func(signal, increasing)
+            func(signal.reshape(-1, 1), np.arange(100).reshape(1, -1))
+            with self.assertRaises(ValueError):
+                func(signal.reshape(10, 10) * 2, np.arange(100))
+
+            # the thread pool is recreated (when the number of workers changes) while other threads use it
+            errors = []
+            def worker():
+                try:
+                    for _ in range(200):
+                        func(signal, np.arange(100))
+                except Exception as error:
+                    errors.append(error)
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for workers in itertools.cycle((3, 4)):
+                if not any(thread.is_alive() for thread in threads):
+                    break
+                InputCheckDecorators.parallelWorkers = workers
+                time.sleep(0.0001)
+            self.assertEqual(errors, [])
+        finally:
+            del executor.submit
+            InputCheckDecorators.parallelWorkers, InputCheckDecorators.parallelMinChunkSize, InputCheckDecorators.arrayChunkSize = options
+
+
+    def test_acceptedValues_08_array_not_modified(self):
+        @acceptedValues({'rangeLength': [2, 10], 'rowsMin': 2, 'colsMax': 1, 'elemRange': [0, 10], 'monotonic': 'increasing'})
+        def func(input1):
+            return input1
+
+        matrix   = np.arange(20.0).reshape(2, 10) / 2
+        readOnly = np.arange(5.0).reshape(1, 5)
+        readOnly.flags.writeable = False
+
+        with tempfile.TemporaryDirectory() as folder:
+            memmap = np.memmap(os.path.join(folder, 'signal.dat'), dtype=np.float64, mode='w+', shape=(6, 1))
+            memmap[:, 0] = np.arange(6.0)
+
+            # vectors of shape (1, N) or (N, 1), views of not owned and non contiguous data, read only arrays and memmaps
+            for actual_arg in (np.arange(5.0).reshape(1, 5), np.arange(5.0).reshape(5, 1), matrix[:1, ::2], matrix[:, 3:4], readOnly, memmap):
+                shape   = actual_arg.shape
+                address = actual_arg.__array_interface__['data'][0]
+                flags   = [actual_arg.flags[flag] for flag in ('C_CONTIGUOUS', 'F_CONTIGUOUS', 'OWNDATA', 'WRITEABLE', 'ALIGNED')]
+                self.assertIs(func(actual_arg), actual_arg)
+                self.assertEqual(actual_arg.shape, shape)
+                self.assertEqual(actual_arg.__array_interface__['data'][0], address)
+                self.assertEqual([actual_arg.flags[flag] for flag in ('C_CONTIGUOUS', 'F_CONTIGUOUS', 'OWNDATA', 'WRITEABLE', 'ALIGNED')], flags)
+            del memmap
+
+        with self.assertRaises(ValueError):
+            func(np.arange(20.0).reshape(1, 20)) # the length of a row vector is its number of columns
+        with self.assertRaises(ValueError):
+            func(matrix[:1, ::-2])
+        self.assertEqual(matrix.shape, (2, 10))
+
+
+    def test_acceptedValues_09_shapes(self):
+        @acceptedValues({'shape': ('N', 'C'), 'contiguous': 'C', 'aligned': 8}, {'shape': ('C',)}, {'shape': (..., 'N', 3), 'contiguous': True}, {'shape': ('K', 'K', None)})
+        def func(input1, input2, input3, input4=np.zeros((2, 2, 5))):
+            pass
+
+        func(np.ones((4, 3)), np.ones(3), np.ones((2, 2, 4, 3)))
+        func(np.ones((4, 3)), input3=np.ones((4, 3)), input2=np.ones(3), input4=np.ones((3, 3, 1)))
+        invalid = [
+            (np.ones((4, 3)), np.ones(2), np.ones((4, 3))),              # C is bound to 3 by the 1st argument
+            (np.ones((4, 3)), np.ones(3), np.ones((5, 3))),              # N is bound to 4 by the 1st argument
+            (np.ones((4, 3)), np.ones(3), np.ones((4, 2))),              # the last dimension must be 3
+            (np.ones((4, 3)), np.ones(3), np.ones(3)),                   # too few dimensions
+            (np.ones((4, 3, 1)), np.ones(3), np.ones((4, 3))),           # too many dimensions
+            (np.ones((3, 4)).T, np.ones(4), np.ones((3, 3))),            # not C contiguous
+            (np.ones((4, 3)), np.ones(3), np.ones((4, 6))[:, ::2]),      # neither C nor F contiguous
+            (np.ones((4, 3)), np.ones(3), np.ones((4, 3)), np.ones((2, 3, 1))), # K must be the same in both dimensions
+        ]
+        for args in invalid:
+            with self.assertRaises(ArgumentValueError):
+                func(*args)
+
+        with self.assertRaises(ArgumentValueError) as context:
+            func(np.ones((4, 3)), np.ones(3), np.ones((5, 3)))
+        self.assertEqual((context.exception.code, context.exception.arg_num, context.exception.details['symbol']), ('shapeSymbol', 2, 'N'))
+        self.assertIn('bound by the 1st argument', str(context.exception))
+
+        # the unaligned data (a view which starts 1 byte after the beginning of a buffer)
+        unaligned = np.frombuffer(bytearray(8 * 13), dtype=np.uint8)[1:97].view(np.float64).reshape(4, 3)
+        with self.assertRaises(ArgumentValueError) as context:
+            func(unaligned, np.ones(3), np.ones((4, 3)))
+        self.assertEqual(context.exception.code, 'aligned')
+
+        with self.assertRaises(ValueError):
+            acceptedValues({'shape': (..., 'N', ...)})(lambda input1: None)
+
+
+    def test_acceptedValues_10_memmap(self):
+        @acceptedValues({'elemRange': [0, 1000], 'monotonic': 'strictlyIncreasing'})
+        def func(input1):
+            pass
+
+        windowSize = InputCheckDecorators.memmapWindowSize
+        InputCheckDecorators.memmapWindowSize = 64 # 8 elements per window
+        try:
+            with tempfile.TemporaryDirectory() as folder:
+                filename = os.path.join(folder, 'signal.dat')
+                writer = np.memmap(filename, dtype=np.float64, mode='w+', shape=(100,))
+                writer[:] = np.arange(100)
+                writer.flush()
+
+                reader = np.memmap(filename, dtype=np.float64, mode='r', shape=(100,))
+                func(reader)
+                func(np.memmap(filename, dtype=np.float64, mode='r', offset=80, shape=(10, 5)).reshape(-1))
+
+                # the elements are checked across the windows
+                for idx, value in ((3, 2000), (7, 8.5), (8, 6.5), (99, -1)):
+                    writer[idx] = value
+                    writer.flush()
+                    with self.assertRaises(ValueError):
+                        func(writer)
+                    with self.assertRaises(ValueError):
+                        func(np.memmap(filename, dtype=np.float64, mode='r', shape=(100,)))
+                    writer[idx] = idx
+                writer.flush()
+                func(np.memmap(filename, dtype=np.float64, mode='r', shape=(100,)))
+
+                # the verdict of a read only memmap is kept as long as the file has the same modification time and size
+                modified = os.stat(filename).st_mtime_ns - 10 * 10**9
+                os.utime(filename, ns=(modified, modified))
+                func(np.memmap(filename, dtype=np.float64, mode='r', shape=(100,)))
+                writer[50] = -1
+                writer.flush()
+                del writer
+                os.utime(filename, ns=(modified, modified))
+                func(np.memmap(filename, dtype=np.float64, mode='r', shape=(100,))) # the cached verdict
+                os.utime(filename, ns=(modified, modified + 10**9))
+                with self.assertRaises(ValueError):
+                    func(np.memmap(filename, dtype=np.float64, mode='r', shape=(100,)))
+                with self.assertRaises(ValueError):
+                    func(np.memmap(filename, dtype=np.float64, mode='c', shape=(100,)))
+                del reader
+        finally:
+            InputCheckDecorators.memmapWindowSize = windowSize
+
+
+class Tests_validationPlan(unittest.TestCase):
+
+    def test_validationPlan_01_compiled_once(self):
+        @acceptedTypes(int, float, float)
+        def func(input1, input2=2.0, input3=3.0):
+            pass
+
+        plan = func.validationPlan
+        self.assertEqual(plan.names, ('input1', 'input2', 'input3'))
+        self.assertEqual(plan.positions, {'input1': 0, 'input2': 1, 'input3': 2})
+        self.assertEqual(plan.defaults, ((1, 'input2', 2.0), (2, 'input3', 3.0)))
+        self.assertEqual(len(plan.checkers), 3)
+
+        # the signature must not be inspected again when the function is called
+        signature = InputCheckDecorators.inspect.signature
+        InputCheckDecorators.inspect.signature = None
+        try:
+            func(1, input3=4.0)
+        finally:
+            InputCheckDecorators.inspect.signature = signature
+
+    def test_validationPlan_02_binding(self):
+        @acceptedValues({'range': [1, 10]}, {'minValue': 5}, {'maxValue': 100})
+        def func(input1, input2=7.0, input3=3.0):
+            return input1, input2, input3
+
+        self.assertEqual(func(2, 6.0), (2, 6.0, 3.0))
+        self.assertEqual(func(2, input3=50), (2, 7.0, 50))
+        with self.assertRaises(ValueError):
+            func(2, 4.0)
+        with self.assertRaises(ValueError):
+            func(2, input1=3)
+        with self.assertRaises(ValueError):
+            func(2, input4=3)
+        with self.assertRaises(ValueError):
+            func(2, 6.0, 3.0, 4.0)
+
+    def test_validationPlan_03_spec_not_modified(self):
+        typeCheck = {
+            'type': [list, tuple],
+            'command': {
+                'checkConsistency': True,
+                'consistencyType' : int
+            }
+        }
+        @acceptedTypes(typeCheck)
+        def func(input1):
+            pass
+
+        func([1, 2, 3])
+        with self.assertRaises(TypeError):
+            func([1.0, 2.0])
+        self.assertIs(typeCheck['command']['consistencyType'], int)
+
+
+class Tests_specs(unittest.TestCase):
+
+    def test_specs_01_interned(self):
+        spec = {'range': [0, 1]}
+        self.assertIs(ValueSpec(spec), ValueSpec(range=[0, 1]))
+        self.assertIs(Range(0, 1), Range(0, 1))
+        self.assertIsNot(Range(0, 1), ValueSpec(spec)) # the same items, but a different class
+        self.assertEqual(Range(0, 1), spec)
+        self.assertEqual(hash(Range(0, 1)), hash(ValueSpec(spec)))
+        self.assertIsNot(ValueSpec({'set': [1]}), ValueSpec({'set': [True]}))
+        self.assertEqual((Range(0, 1).low, Range(0, 1).high), (0, 1))
+        self.assertEqual(dict(OneOf('a', 'b')), {'set': ['a', 'b']})
+        self.assertEqual(dict(MinLength(1) | {'command': 'allowNone'}), {'minLength': 1, 'command': 'allowNone'})
+        self.assertIs(pickle.loads(pickle.dumps(Range(0, 1))), Range(0, 1))
+        self.assertEqual(repr(Range(0, 1)), 'Range(0, 1)')
+
+        # the specification does not share any mutable part with its caller
+        interned = ValueSpec(spec)
+        spec['range'][1] = 10
+        self.assertEqual(interned['range'], [0, 1])
+        with self.assertRaises(TypeError):
+            interned['range'] = [0, 10]
+        interned['range'][1] = 10
+        dict(interned)['range'][1] = 10
+        interned.valueSpec()['range'][1] = 10
+        self.assertEqual(Range(0, 1)['range'], [0, 1])
+
+        # the equal specifications have equal hashes
+        self.assertNotEqual(Range(0, 1), Range(0.0, 1.0))
+        self.assertNotEqual(ValueSpec({'set': [1]}), ValueSpec({'set': [True]}))
+        self.assertNotEqual(Range(0, 1), {'range': [0.0, 1.0]})
+        self.assertEqual(len({Range(0, 1), Range(0.0, 1.0), ValueSpec({'range': [0, 1]})}), 2)
+        for spec1, spec2 in itertools.combinations([Range(0, 1), Range(0.0, 1.0), ValueSpec({'range': [0, 1]}), OneOf(1), OneOf(True)], 2):
+            if spec1 == spec2:
+                self.assertEqual(hash(spec1), hash(spec2))
+
+        # the order of the items is the order of the checks, thus, it is kept
+        spec1 = ValueSpec({'minLength': 1, 'command': 'allowNone'})
+        spec2 = ValueSpec({'command': 'allowNone', 'minLength': 1})
+        self.assertEqual(list(spec1), ['minLength', 'command'])
+        self.assertEqual(list(spec2), ['command', 'minLength'])
+        self.assertNotEqual(spec1, spec2)
+
+        self.assertEqual(dict(ArraySpec(shape=('N',), finite=True)), {'shape': ('N',), 'finite': True})
+        with self.assertRaises(ValueError):
+            ArraySpec(elemrange=[0, 1])
+
+    def test_specs_02_shared_checks(self):
+        @acceptedValues({'range': [0, 1]}, OneOf('fast', 'slow'))
+        def func1(input1, input2):
+            pass
+
+        @acceptedValues(Range(0, 1), {'set': ['fast', 'slow']}, backend='codegen')
+        def func2(input1, input2):
+            pass
+
+        @acceptedValues({'range': [0, 1]}, {'set': ['fast', np.zeros(1)]}) # an unhashable specification is not interned
+        def func3(input1, input2):
+            pass
+
+        # the dicts are converted to interned specifications and the checks are compiled once
+        plan1, plan2, plan3 = func1.validationPlan, func2.validationPlan, func3.validationPlan
+        self.assertIs(plan1.valueSpecs[0], ValueSpec({'range': [0, 1]}))
+        self.assertIs(plan1.valueCheckers[0], plan3.valueCheckers[0])
+        self.assertIs(plan1.valueCheckers[1], plan2.valueCheckers[1]) # equal items share their check, whatever the class of the specification
+        self.assertIs(type(plan3.valueSpecs[1]), dict)
+
+        # the errors of the shared checks still refer to the decorated function
+        for func in (func1, func2, func3):
+            with self.assertRaises(ArgumentValueError) as context:
+                func(2, 'fast')
+            self.assertIs(context.exception.function, func.__wrapped__)
+            self.assertIn('function {0}()'.format(func.__name__), str(context.exception))
+        with self.assertRaises(ValueError):
+            func2(0.5, 'slower')
+
+
+class Tests_codegen(unittest.TestCase):
+
+    def test_codegen_01_types(self):
+        @acceptedTypes(int, [int, float], {'type': [list, tuple], 'command': {'checkConsistency': True}}, backend='codegen')
+        def func(input1, input2=2.0, *, input3=()):
+            return input1, input2, input3
+
+        self.assertIn('def func(input1=', func.generatedSource)
+        self.assertEqual(func(1), (1, 2.0, ()))
+        self.assertEqual(func(1, 3, input3=[1, 2]), (1, 3, [1, 2]))
+        with self.assertRaises(TypeError):
+            func(1.0)
+        with self.assertRaises(TypeError):
+            func(1, 'some text')
+        with self.assertRaises(TypeError):
+            func(1, input3=[1, 'some text'])
+        with self.assertRaises(ValueError):
+            func()
+
+    def test_codegen_02_values(self):
+        @acceptedValues({'range': [1, 10]}, {'set': ['a', 'b'], 'maxLength': 1}, {'maxLength': 3, 'command': 'allowNone'}, backend='codegen')
+        def func(input1, input2, input3=None):
+            pass
+
+        func(1, 'a')
+        func(10, 'b', [1, 2, 3])
+        with self.assertRaises(ValueError):
+            func(0, 'a')
+        with self.assertRaises(ValueError):
+            func(None, 'a')
+        with self.assertRaises(ValueError):
+            func(5, 'c')
+        with self.assertRaises(ValueError):
+            func(5, 'a', [1, 2, 3, 4])
+
+    def test_codegen_04_builtin_names(self):
+        # the parameters named after builtins (e.g. type, len, int) must not hide them in the generated source
+        @acceptedValues({'set': ['a', 'b']}, {'range': [0, 10]}, backend='codegen')
+        def make(type, size):
+            return type, size
+
+        @accepted(types=([str, list],), values=({'minLength': 2},), backend='codegen')
+        def measure(len):
+            return len
+
+        @accepted(types=(int, [int, float], str), values=({'minValue': 0}, {'maxValue': 1}, {'maxLength': 3}), backend='codegen')
+        def convert(int, float, str):
+            return int, float, str
+
+        self.assertEqual(make('a', 5), ('a', 5))
+        self.assertEqual(measure('ab'), 'ab')
+        self.assertEqual(measure([1, 2]), [1, 2])
+        self.assertEqual(convert(1, 0.5, 'abc'), (1, 0.5, 'abc'))
+        with self.assertRaises(ValueError):
+            make('c', 5)
+        with self.assertRaises(ValueError):
+            measure('a')
+        with self.assertRaises(TypeError):
+            convert(1.0, 0.5, 'abc')
+        with self.assertRaises(ValueError):
+            convert(1, 2, 'abc')
+        with self.assertRaises(ValueError):
+            convert(1, 0.5, 'abcd')
+
+    def test_codegen_05_signature(self):
+        # the keyword-only parameters right after the positional-only ones keep both markers
+        @acceptedTypes(int, int, backend='codegen')
+        def func(input1, /, *, input2):
+            return input1, input2
+
+        self.assertIn('/, *', func.generatedSource)
+        self.assertEqual(func(1, input2=2), (1, 2))
+        with self.assertRaises(TypeError):
+            func(input1=1, input2=2)
+        with self.assertRaises(TypeError):
+            func(1, 2)
+
+    def test_codegen_03_fallback(self):
+        @acceptedValues({'range': [1, 10]}, {'minLength': 1}, backend='codegen')
+        def func(input1, *input2):
+            pass
+
+        self.assertFalse(hasattr(func, 'generatedSource'))
+        func(1, 2)
+        with self.assertRaises(ValueError):
+            func(11, 2)
+
+        with self.assertRaises(ValueError):
+            @acceptedValues({'range': [1, 10]}, backend='unknown')
+            def func2(input1):
+                pass
+
+
+class Tests_accepted(unittest.TestCase):
+
+    def test_accepted_01_fused(self):
+        @accepted(types=([int, float], str, float), values=({'range': [1, 10]}, {'set': ['a', 'b']}, {'minValue': 0}))
+        def func(input1, input2, input3=1.0):
+            return input1, input2, input3
+
+        self.assertEqual(func(1, 'a'), (1, 'a', 1.0))
+        self.assertEqual(func(1, input2='b', input3=2.0), (1, 'b', 2.0))
+        with self.assertRaises(TypeError):
+            func('1', 'a')
+        with self.assertRaises(ValueError):
+            func(0, 'a')
+        with self.assertRaises(TypeError):
+            func(1, 'a', 2)
+        with self.assertRaises(ValueError):
+            func(1, 'a', -2.0)
+        with self.assertRaises(ValueError):
+            func(1)
+
+        @accepted(types=(int, int), values=({'range': [1, 10]}, {'range': [1, 10]}), typesCheckEnabled=False)
+        def func2(input1, input2):
+            pass
+
+        func2(1.5, 2)
+        with self.assertRaises(ValueError):
+            func2(1, 20)
+
+        with self.assertRaises(ValueError):
+            @accepted(types=(int, int), values=({'range': [1, 10]},))
+            def func3(input1, input2):
+                pass
+
+    def test_accepted_02_stacked(self):
+        def func(input1, input2):
+            return input1, input2
+
+        func1 = acceptedTypes([int, float], str)(acceptedValues({'range': [1, 10]}, {'set': ['a']})(func))
+        func2 = acceptedValues({'range': [1, 10]}, {'set': ['a']})(acceptedTypes([int, float], str)(func))
+
+        for fused in (func1, func2):
+            # a single wrapper directly over the original function
+            self.assertIs(fused.__wrapped__, func)
+            self.assertIsNotNone(fused.validationPlan.typeSpecs)
+            self.assertIsNotNone(fused.validationPlan.valueSpecs)
+
+            self.assertEqual(fused(5, 'a'), (5, 'a'))
+            with self.assertRaises(TypeError):
+                fused(5, 1)
+            with self.assertRaises(ValueError):
+                fused(50, 'a')
+            with self.assertRaises(ValueError):
+                fused(5, 'b')
+
+    def test_accepted_03_stacked_options(self):
+        # the fused wrapper keeps the options of both decorators
+        def func(obj, input1):
+            return input1
+
+        func1 = acceptedValues({'range': [1, 10]})(acceptedTypes(int, method=True, backend='codegen')(func))
+        self.assertIs(func1.__wrapped__, func)
+        self.assertTrue(hasattr(func1, 'generatedSource'))
+        self.assertEqual(func1(None, 5), 5)
+        with self.assertRaises(ValueError):
+            func1(None, 50)
+        with self.assertRaises(TypeError):
+            func1(None, 'a')
+
+        threads = []
+
+        class Executor(concurrent.futures.ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                threads.append(fn)
+                return super().submit(fn, *args, **kwargs)
+
+        executor = Executor(1)
+
+        async def coroutine(input1, input2):
+            return input1
+
+        func2 = acceptedTypes(int, {'type': list, 'command': {'checkConsistency': True}})(
+                    acceptedValues({'range': [1, 10]}, {}, offloadThreshold=10, executor=executor)(coroutine))
+        self.assertIs(func2.__wrapped__, coroutine)
+        self.assertEqual(asyncio.run(func2(5, list(range(5)))), 5)
+        self.assertEqual(threads, [])
+        self.assertEqual(asyncio.run(func2(5, list(range(20)))), 5)
+        self.assertEqual(len(threads), 1)
+        with self.assertRaises(TypeError):
+            asyncio.run(func2(5, [1, 'a'] * 10))
+        executor.shutdown()
+
+
+# a module level class, whose methods refer to the class itself (which is not defined while its body is executed)
+class _Vector(object):
+
+    def __init__(self, x):
+        self.x = x
+
+    @acceptedAnnotations
+    def add(self, other: '_Vector') -> '_Vector':
+        return _Vector(self.x + other.x)
+
+    @acceptedAnnotations
+    def scale(self, factor: float) -> '_Vector':
+        return _Vector(self.x * factor)
+
+
+class Tests_acceptedAnnotations(unittest.TestCase):
+
+    def test_acceptedAnnotations_01_hints(self):
+        @acceptedAnnotations
+        def func(input1: int, input2: 'float | None', input3: list[float], input4: typing.Annotated[float, Range(1, 10)], 
+                 input5: np.ndarray = np.zeros(2), input6: typing.Annotated[typing.Optional[str], {'minLength': 2}] = None, 
+                 input7: typing.Literal['fast', 'slow'] = 'fast', input8=None, *args):
+            return input1
+
+        self.assertEqual(func(1, None, [1.0, 2.0], 5), 1)
+        self.assertEqual(func(1, 2, [1, 2], 5.5, np.ones(3), 'ab', 'slow', 'anything', 'more'), 1)
+        with self.assertRaises(TypeError):
+            func(1.0, None, [], 5)
+        with self.assertRaises(TypeError):
+            func(True, None, [], 5)
+        with self.assertRaises(TypeError):
+            func(1, '2', [], 5)
+        with self.assertRaises(TypeError):
+            func(1, None, [1.0, 2], 5)
+        with self.assertRaises(TypeError):
+            func(1, None, ['a'], 5)
+        with self.assertRaises(ValueError):
+            func(1, None, [], 11)
+        with self.assertRaises(TypeError):
+            func(1, None, [], 5, [1])
+        with self.assertRaises(ValueError):
+            func(1, None, [], 5, input6='a')
+        with self.assertRaises(ValueError):
+            func(1, None, [], 5, input7='medium')
+
+        # the hints are resolved only once
+        plan = func.validationPlan
+        self.assertEqual(len(plan.checkers), 8)
+        self.assertEqual(plan.typeSpecs[1], [float, int, type(None)])
+        self.assertEqual(plan.valueSpecs[3], {'range': [1, 10]})
+        self.assertEqual(plan.valueSpecs[5], {'minLength': 2, 'command': 'allowNone'})
+
+        @acceptedAnnotations
+        def func2(input1: typing.Annotated[int, Range(1, 10)] | str | None):
+            return input1
+        self.assertEqual(func2('abc'), 'abc')
+        with self.assertRaises(ValueError):
+            func2(11)
+
+    def test_acceptedAnnotations_02_options(self):
+        @acceptedAnnotations(backend='codegen')
+        def func(input1: numbers.Real, input2: typing.Sequence[int] = ()):
+            return input1
+
+        self.assertEqual(func(np.float32(1)), np.float32(1))
+        self.assertEqual(func(1, [1, 2]), 1)
+        with self.assertRaises(TypeError):
+            func(1j)
+        with self.assertRaises(TypeError):
+            func(1, {1})
+        self.assertTrue(hasattr(func, 'generatedSource'))
+
+        def func2(*args):
+            pass
+        self.assertIs(acceptedAnnotations(func2), func2)
+
+        # the arguments after *args and the **kwargs are not checked
+        @acceptedAnnotations
+        def func3(input1: int, *args, input2: int = 0, **kwargs):
+            return input1, args, input2, kwargs
+        self.assertEqual(func3(1, 'a', input2='b', input3='c'), (1, ('a',), 'b', {'input3': 'c'}))
+        with self.assertRaises(TypeError):
+            func3('1', 'a')
+
+    def test_acceptedAnnotations_03_forward_references(self):
+        # the 'return' hint is not resolved, while the hint of an argument is resolved on the first call
+        self.assertTrue(hasattr(_Vector.scale, 'validationPlan'))
+        self.assertFalse(hasattr(_Vector.add, 'validationPlan'))
+        self.assertEqual(_Vector(1).add(_Vector(2)).x, 3)
+        self.assertEqual(_Vector(1).scale(2.0).x, 2.0)
+        with self.assertRaises(TypeError):
+            _Vector(1).add(2)
+        with self.assertRaises(TypeError):
+            _Vector(1).scale('2')
+
+
+class Tests_methods(unittest.TestCase):
+
+    def test_methods_01_members(self):
+        class Signal(object):
+            @accepted(types=(int,), values=({'minValue': 1},))
+            def decimate(self, factor):
+                return factor
+
+            @acceptedValues({'range': [0, 1]})
+            @classmethod
+            def fromGain(cls, gain):
+                return gain
+
+            @staticmethod
+            @acceptedTypes(float)
+            def clip(value):
+                return value
+
+            @acceptedTypes((object,), int) # the dummy specification of self is still accepted
+            def resample(self, rate):
+                return rate
+
+            @property
+            def gain(self):
+                return self._gain
+
+            @acceptedValues({'range': [0, 2]})
+            @gain.setter
+            def gain(self, value):
+                self._gain = value
+
+        signal = Signal()
+        self.assertEqual(signal.decimate(3), 3)
+        self.assertEqual(signal.decimate(factor=3), 3)
+        self.assertEqual(Signal.fromGain(0.5), 0.5)
+        self.assertEqual(signal.fromGain(0.5), 0.5)
+        self.assertEqual(Signal.clip(1.0), 1.0)
+        self.assertEqual(signal.resample(8000), 8000)
+        signal.gain = 1.5
+        self.assertEqual(signal.gain, 1.5)
+
+        with self.assertRaises(ValueError):
+            signal.decimate(0)
+        with self.assertRaises(TypeError):
+            signal.decimate(1.0)
+        with self.assertRaises(ValueError):
+            Signal.fromGain(2)
+        with self.assertRaises(TypeError):
+            Signal.clip(1)
+        with self.assertRaises(TypeError):
+            signal.resample(1.0)
+        with self.assertRaises(ValueError):
+            signal.gain = 3
+        self.assertEqual(signal.gain, 1.5)
+
+        with self.assertRaises(ValueError):
+            acceptedValues({})(property(lambda self: None))
+
+    def test_methods_02_class(self):
+        @acceptedAnnotations
+        class Filter(object):
+            def __init__(self, order: typing.Annotated[int, Range(1, 10)]):
+                self.order = order
+
+            def apply(self, samples: list[float], gain: float = 1.0) -> 'Filter':
+                return self
+
+            @classmethod
+            def create(cls, order: int) -> 'Filter':
+                return cls(order)
+
+            def _private(self, value: int):
+                return value
+
+            def untyped(self, value):
+                return value
+
+        self.assertEqual(Filter(3).apply([1.0, 2.0]).order, 3)
+        self.assertEqual(Filter.create(2).order, 2)
+        self.assertEqual(Filter(3)._private('a'), 'a')
+        self.assertFalse(hasattr(Filter.untyped, 'validationPlan'))
+        with self.assertRaises(ValueError):
+            Filter(0)
+        with self.assertRaises(TypeError):
+            Filter(3).apply([1.0, 'a'])
+        with self.assertRaises(TypeError):
+            Filter.create('a')
+
+    def test_methods_03_attributes(self):
+        class Signal(object):
+            __slots__ = ('_rate', 'data')
+            rate = ValidatedAttribute(types=[int, float], values={'range': [1, 96000]}, default=8000)
+
+        class Frame(object):
+            size = ValidatedAttribute(types=int, values={'minValue': 1})
+
+        signal = Signal()
+        self.assertEqual(signal.rate, 8000)
+        signal.rate = 44100
+        self.assertEqual(signal.rate, 44100)
+        with self.assertRaises(ArgumentValueError) as context:
+            signal.rate = 0
+        self.assertEqual(str(context.exception), 'The attribute Signal.rate has value out of the accepted range: [1, 96000].')
+        with self.assertRaises(ArgumentTypeError):
+            signal.rate = '1'
+        self.assertEqual(signal.rate, 44100)
+        del signal.rate
+        self.assertEqual(signal.rate, 8000)
+
+        frame = Frame()
+        with self.assertRaises(AttributeError):
+            frame.size
+        frame.size = 256
+        self.assertEqual((frame.size, frame.__dict__), (256, {'size': 256}))
+        with self.assertRaises(ValueError):
+            frame.size = 0
+
+        with self.assertRaises((TypeError, RuntimeError)): # a class without a __dict__ and without the slot '_size'
+            class Block(object):
+                __slots__ = ('data',)
+                size = ValidatedAttribute(types=int)
+
+
+class Tests_schema(unittest.TestCase):
+
+    def setUp(self):
+        user = {'type': dict, 'keys': {'name': {'type': str, 'minLength': 1}, 'age': {'type': int, 'range': [0, 150]}}, 
+                'optional': {'tags': {'type': list, 'listOf': {'type': str}}}, 'extraKeys': False}
+        self.schema = {'keys': {'users': {'type': list, 'listOf': user}, 'meta': {'dictOf': {'type': [int, float]}}}}
+        self.payload = {'users': [{'name': 'a', 'age': 3, 'tags': ['x']}, {'name': 'b', 'age': 4}], 'meta': {'v': 1, 'w': 2.0}}
+
+    def test_schema_01_payload(self):
+        @acceptedValues({'schema': self.schema})
+        def func1(payload):
+            return len(payload['users'])
+
+        @accepted(types=([dict, type(None)],), values=({'schema': self.schema, 'command': 'allowNone'},), backend='codegen')
+        def func2(payload):
+            return payload
+
+        self.assertEqual(func1(self.payload), 2)
+        self.assertIsNone(func2(None))
+        invalid = [
+            # (payload, error, code, path)
+            ({'users': []},                                        ArgumentValueError, 'missingKey', None), 
+            ({'users': [{'name': 'a', 'age': 300}], 'meta': {}},   ArgumentValueError, 'range',      "['users'][0]['age']"), 
+            ({'users': [{'name': 'a'}], 'meta': {}},               ArgumentValueError, 'missingKey', "['users'][0]"), 
+            ({'users': [{'name': '', 'age': 1}], 'meta': {}},      ArgumentValueError, 'minLength',  "['users'][0]['name']"), 
+            ({'users': [{'name': 'a', 'age': 1, 'x': 1}], 'meta': {}}, ArgumentValueError, 'unknownKey', "['users'][0]"), 
+            ({'users': [{'name': 'a', 'age': 1, 'tags': ['a', 2]}], 'meta': {}}, ArgumentTypeError, 'type', "['users'][0]['tags'][1]"), 
+            ({'users': [], 'meta': {'v': '1'}},                    ArgumentTypeError,  'type',       "['meta']['v']"), 
+            ({'users': (), 'meta': {}},                            ArgumentTypeError,  'type',       "['users']"), 
+            ({'users': [], 'meta': []},                            ArgumentTypeError,  'type',       "['meta']"), 
+        ]
+        for payload, error, code, path in invalid:
+            for func in (func1, func2):
+                with self.assertRaises(error) as context:
+                    func(payload)
+                self.assertEqual(context.exception.code, code)
+                self.assertEqual(context.exception.details.get('path'), path)
+                self.assertIs(context.exception.function, func.__wrapped__)
+        self.assertEqual(str(context.exception), 'The element [\'meta\'] of the 1st argument of the function func2() is not a <class \'dict\'>')
+
+    def test_schema_02_recursive(self):
+        tree = {'type': dict, 'keys': {'value': {'type': int}}}
+        tree['optional'] = {'children': {'type': list, 'listOf': tree}}
+
+        @acceptedValues({'schema': tree, 'maxDepth': 7})
+        def func(node):
+            return node['value']
+
+        def deepTree(depth):
+            node = {'value': 0}
+            for value in range(depth):
+                node = {'value': value, 'children': [node]}
+            return node
+
+        self.assertEqual(func(deepTree(3)), 2)
+        with self.assertRaises(ArgumentValueError) as context:
+            func(deepTree(4)) # every level of the tree is a dict and a list, i.e. 9 levels of nesting
+        self.assertEqual(context.exception.code, 'maxDepth')
+        with self.assertRaises(ArgumentTypeError) as context:
+            func({'value': 1, 'children': [{'value': 2}, {'value': 'a'}]})
+        self.assertEqual(context.exception.details['path'], "['children'][1]['value']")
+
+        # a payload much deeper than the recursion limit is checked without any recursion
+        InputCheckDecorators.schemaMaxDepth, previous = 10 ** 6, InputCheckDecorators.schemaMaxDepth
+        try:
+            @acceptedValues({'schema': tree})
+            def func2(node):
+                return node['value']
+            self.assertEqual(func2(deepTree(sys.getrecursionlimit() * 2)), sys.getrecursionlimit() * 2 - 1)
+        finally:
+            InputCheckDecorators.schemaMaxDepth = previous
+
+
+class Tests_async(unittest.TestCase):
+
+    def test_async_01_coroutine(self):
+        threads = []
+
+        class Executor(concurrent.futures.ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                threads.append(fn)
+                return super().submit(fn, *args, **kwargs)
+
+        executor = Executor(1)
+
+        @accepted(types=(int, {'type': list, 'command': {'checkConsistency': True}}), values=({'range': [1, 10]}, {}), offloadThreshold=1000, executor=executor)
+        async def func(input1, input2=[]):
+            await asyncio.sleep(0)
+            return input1
+
+        # only the arguments whose checks walk their elements are counted
+        @accepted(types=(list, dict), values=({'minLength': 1}, {'schema': {'keys': {'values': {'listOf': {'type': int}}}}}), offloadThreshold=1000, executor=executor)
+        async def func2(input1, input2):
+            return len(input1)
+
+        async def main():
+            self.assertEqual(await func(1), 1)
+            self.assertEqual(threads, [])
+            with self.assertRaises(ValueError):
+                await func(11)
+
+            # the large arguments are checked in the thread pool
+            self.assertEqual(await func(2, list(range(1000))), 2)
+            self.assertEqual(len(threads), 1)
+            with self.assertRaises(ValueError):
+                await func(11, list(range(1000)))
+            self.assertEqual(len(threads), 2)
+
+            with checksDisabled(func):
+                self.assertEqual(await func(11), 11)
+
+            self.assertEqual(await func2(list(range(1000)), {'values': []}), 1000)
+            self.assertEqual(len(threads), 2)
+            self.assertEqual(await func2([1], input2={'values': list(range(1000))}), 1)
+            self.assertEqual(len(threads), 3)
+
+        self.assertTrue(asyncio.iscoroutinefunction(func))
+        asyncio.run(main())
+        executor.shutdown()
+
+    def test_async_02_generator(self):
+        @acceptedTypes(int, offloadThreshold=None)
+        async def func(input1):
+            received = yield input1
+            yield received
+
+        async def main():
+            generator = func(1)
+            self.assertEqual(await generator.__anext__(), 1)
+            self.assertEqual(await generator.asend(5), 5)
+            with self.assertRaises(StopAsyncIteration):
+                await generator.__anext__()
+
+            with self.assertRaises(TypeError):
+                async for item in func('1'):
+                    pass
+
+        self.assertTrue(inspect.isasyncgenfunction(func))
+        asyncio.run(main())
+
+
+class Tests_streams(unittest.TestCase):
+
+    def test_streams_01_arguments(self):
+        consumed = []
+
+        def values(items):
+            for item in items:
+                consumed.append(item)
+                yield item
+
+        @acceptedValues({'iterOf': {'type': float, 'range': [0, 1]}, 'maxItems': 3}, {})
+        def func(input1, input2=0):
+            return sum(input1) + input2
+
+        # the containers are checked eagerly
+        self.assertEqual(func([0.5, 0.25]), 0.75)
+        with self.assertRaises(ArgumentValueError) as context:
+            func([0.5, 2.0])
+        self.assertEqual((context.exception.code, context.exception.details['item']), ('range', 1))
+        self.assertIn('The 2nd item of the 1st argument', str(context.exception))
+        with self.assertRaises(ArgumentTypeError):
+            func((1, 0.5))
+        with self.assertRaises(ArgumentValueError) as context:
+            func([0.5] * 4)
+        self.assertEqual(context.exception.code, 'maxItems')
+        with self.assertRaises(ArgumentTypeError) as context:
+            func(5)
+        self.assertEqual(context.exception.code, 'iterable')
+
+        # the iterators are checked lazily, while they are consumed by the function
+        self.assertEqual(func(values([0.5, 0.25]), 1), 1.75)
+        consumed.clear()
+        with self.assertRaises(ArgumentValueError) as context:
+            func(input1=values([0.5, 2.0, 0.5]))
+        self.assertEqual(consumed, [0.5, 2.0])
+        with self.assertRaises(ArgumentValueError) as context:
+            func(iter([0.5] * 4))
+        self.assertEqual(context.exception.code, 'maxItems')
+
+    def test_streams_02_yields(self):
+        @accepted(types=(int,), values=({},), yields={'iterOf': {'minValue': 0}, 'maxItems': 3})
+        def func(input1):
+            received = 0
+            for index in range(input1):
+                received = (yield index - received) or 0
+
+        self.assertEqual(list(func(3)), [0, 1, 2])
+        with self.assertRaises(ArgumentValueError) as context:
+            list(func(4))
+        self.assertEqual(context.exception.code, 'maxItems')
+
+        # the sent values are passed through to the generator
+        generator = func(2)
+        self.assertEqual(next(generator), 0)
+        with self.assertRaises(ArgumentValueError) as context:
+            generator.send(5)
+        self.assertEqual(context.exception.details, {'text': 'value', 'item': 1, 'yielded': True})
+        self.assertIn('The 2nd item yielded by the function func()', str(context.exception))
+
+        with self.assertRaises(ValueError):
+            @acceptedValues({}, yields={'maxItems': 1})
+            def notGenerator(input1):
+                return input1
+
+
+class Tests_sampling(unittest.TestCase):
+
+    def test_sampling_01_calls(self):
+        @acceptedValues({'range': [1, 10]}, sampleEvery=3)
+        def func(input1):
+            pass
+
+        func(5)
+        func(50) # not checked
+        func(50) # not checked
+        with self.assertRaises(ValueError):
+            func(50)
+        self.assertEqual(func.sampling.stats(), {'calls': 4, 'checkedCalls': 2, 'checkedElements': 0})
+
+        @acceptedTypes(int, sampleProbability=0.0)
+        def func2(input1):
+            pass
+
+        func2('some text')
+        func2.sampling.reset()
+        self.assertEqual(func2.sampling.stats()['calls'], 0)
+
+        with self.assertRaises(ValueError):
+            @acceptedTypes(int, sampleProbability=2.0)
+            def func3(input1):
+                pass
+
+    def test_sampling_02_elements(self):
+        typeCheck = {'type': list, 'command': {'checkConsistency': True}}
+
+        @accepted(types=(typeCheck, np.ndarray), values=({}, {'elemRange': [0, 1]}), sampleElements=100, sampleSeed=0)
+        def func(input1, input2):
+            pass
+
+        func([1.0] * 1000, np.random.rand(50, 50))
+        self.assertEqual(func.sampling.stats(), {'calls': 1, 'checkedCalls': 1, 'checkedElements': 200})
+
+        func([1.0] * 10, np.random.rand(10))
+        self.assertEqual(func.sampling.stats()['checkedElements'], 220)
+
+        # a subset of all invalid elements is always caught
+        with self.assertRaises(TypeError):
+            func([1.0, 1] * 1000, np.random.rand(10))
+        with self.assertRaises(ValueError):
+            func([1.0], np.random.rand(10000) + 2)
+
+
+class Tests_runtimeSwitch(unittest.TestCase):
+
+    def tearDown(self):
+        setChecksEnabled(None, __name__)
+        setChecksEnabled(True)
+
+    def test_runtimeSwitch_01_scopes(self):
+        @acceptedValues({'range': [1, 10]})
+        def func(input1):
+            return input1
+
+        @acceptedValues({'range': [1, 10]}, backend='codegen')
+        def func2(input1):
+            return input1
+
+        with checksDisabled():
+            self.assertEqual(func(50), 50)
+            self.assertEqual(func2(50), 50)
+            self.assertFalse(getChecksEnabled(func))
+        with self.assertRaises(ValueError):
+            func(50)
+
+        setChecksEnabled(False, __name__)
+        self.assertEqual(func2(50), 50)
+        with checksEnabled(func2):
+            with self.assertRaises(ValueError):
+                func2(50)
+            self.assertEqual(func(50), 50)
+        self.assertEqual(func2(50), 50)
+        setChecksEnabled(None, __name__)
+
+        with checksDisabled(func):
+            self.assertEqual(func(50), 50)
+            with self.assertRaises(ValueError):
+                func2(50)
+        self.assertTrue(getChecksEnabled(func))
+
+        with self.assertRaises(ValueError):
+            setChecksEnabled(False, len)
+
+    def test_runtimeSwitch_02_environment(self):
+        code = (
+            'from InputCheck.InputCheckDecorators import acceptedValues\n'
+            '@acceptedValues({"range": [1, 10]})\n'
+            'def func(input1):\n'
+            '    return input1\n'
+            'print(func(50))\n'
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        env = dict(os.environ, INPUTCHECK_DISABLED='1', PYTHONPATH=root)
+        output = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True)
+        self.assertEqual(output.stdout.strip(), '50')
+
+    def test_runtimeSwitch_03_async(self):
+        @acceptedValues({'range': [1, 10]})
+        async def func(input1):
+            return input1
+
+        @acceptedValues({'range': [1, 10]})
+        async def func2(input1):
+            yield input1
+
+        async def collect(values):
+            return [value async for value in values]
+
+        with checksDisabled():
+            self.assertEqual(asyncio.run(func(50)), 50)
+            self.assertEqual(asyncio.run(collect(func2(50))), [50])
+        with self.assertRaises(ValueError):
+            asyncio.run(func(50))
+        with self.assertRaises(ValueError):
+            asyncio.run(collect(func2(50)))
+
+        def wrapper(input1):
+            return func(input1)
+        with self.assertRaises(ValueError):
+            InputCheckDecorators.PassthroughFunction(wrapper)
+
+
+class Tests_cache(unittest.TestCase):
+
+    def test_cache_01_hits(self):
+        @accepted(types=([int, float, str], list), values=({'range': [1, 10], 'set': {1, 2.0, 'a'}}, {'minLength': 1}), cacheSize=2)
+        def func(input1, input2=[1]):
+            return input1
+
+        cache = func.validationCache
+        self.assertEqual(func(1), 1)
+        self.assertEqual(func(1), 1)
+        self.assertEqual(func(input1=1), 1)
+        self.assertEqual(cache.stats(), {'size': 2, 'entries': 1, 'hits': 2, 'misses': 1, 'evictions': 0})
+
+        # the type is part of the key and an invalid value is never cached
+        self.assertEqual(func(2.0), 2.0)
+        with self.assertRaises(TypeError):
+            func(True)
+        with self.assertRaises(ValueError):
+            func(3)
+        with self.assertRaises(ValueError):
+            func(3)
+        self.assertEqual(cache.stats()['entries'], 2)
+
+        # the least recently used value is evicted
+        self.assertEqual(func('a'), 'a')
+        self.assertEqual(cache.stats()['evictions'], 1)
+        self.assertNotIn((0, int, 1), cache.entries)
+        self.assertIn((0, float, 2.0), cache.entries)
+
+        # the lists bypass the cache
+        with self.assertRaises(ValueError):
+            func(1, [])
+        self.assertEqual(func(1, [1]), 1)
+        self.assertEqual(cache.stats()['entries'], 2)
+
+        cache.clear()
+        cache.reset()
+        self.assertEqual(cache.stats(), {'size': 2, 'entries': 0, 'hits': 0, 'misses': 0, 'evictions': 0})
+
+    def test_cache_02_options(self):
+        @acceptedTypes(int, cacheSize=8)
+        @acceptedValues({'range': [1, 10]})
+        def func(input1):
+            return input1
+
+        self.assertEqual(func(5), 5)
+        self.assertEqual(func(5), 5)
+        self.assertEqual(func.validationCache.hits, 1)
+        with self.assertRaises(ValueError):
+            func(11)
+
+        with self.assertRaises(ValueError):
+            acceptedTypes(int, cacheSize=0)(lambda input1: input1)
+
+
+class Tests_telemetry(unittest.TestCase):
+
+    def test_telemetry_01_stats(self):
+        @acceptedTypes(int, [int, float], telemetry=True)
+        @acceptedValues({'range': [1, 10]}, {'minValue': 0})
+        def func(input1, input2):
+            return input1
+
+        telemetry = func.telemetry
+        self.assertEqual(func(1, 2), 1)
+        self.assertEqual(func(input2=0.5, input1=3), 3)
+        with self.assertRaises(ValueError):
+            func(11, 2)
+        with self.assertRaises(TypeError):
+            func(1, '2')
+        with self.assertRaises(ValueError):
+            func(1)
+
+        stats = telemetry.stats()
+        self.assertEqual((stats['calls'], stats['failures']), (5, 3))
+        self.assertEqual(stats['failuresByArgument'], {'input1': 1, 'input2': 1, None: 1})
+        self.assertEqual(stats['failuresByConstraint'], {'range': 1, 'type': 1, 'arguments': 1})
+        self.assertGreater(stats['validationTime'], 0)
+        self.assertGreater(stats['functionTime'], 0)
+        self.assertEqual(sorted(name for name, elapsed in stats['slowestArguments']), ['input1', 'input2'])
+
+        telemetry.reset()
+        self.assertEqual(telemetry.stats()['calls'], 0)
+        self.assertEqual(telemetry.stats()['slowestArguments'], [])
+
+    def test_telemetry_02_callback(self):
+        events = []
+
+        @accepted(types=(int,), values=({'range': [1, 10]},), telemetryCallback=lambda function, event: events.append((function.__name__, event)))
+        def func(input1):
+            return input1
+
+        self.assertEqual(func(1), 1)
+        with self.assertRaises(ValueError):
+            func(0)
+        self.assertEqual([name for name, event in events], ['func', 'func'])
+        self.assertIsNone(events[0][1]['error'])
+        self.assertEqual(events[1][1]['error'].code, 'range')
+        self.assertIsNone(events[1][1]['functionTime'])
+
+        # without telemetry, nothing is measured
+        @accepted(types=(int,))
+        def func2(input1):
+            return input1
+        self.assertIsNone(func2.telemetry)
+        self.assertIsNone(func2.validationPlan.telemetry)
+
+
+# a module level function, so as to be called by the workers of a process pool
+@accepted(types=(int,), values=({'range': [1, 10]},))
+def _poolFunction(input1):
+    return input1
+
+
+class Tests_errors(unittest.TestCase):
+
+    def test_errors_01_attributes(self):
+        @accepted(types=[int, str], values=[{'range': [1, 10]}, {'rangeLength': [2, 4]}])
+        def func(input1, input2):
+            return input1
+
+        with self.assertRaises(ArgumentTypeError) as context:
+            func(1.0, 'abc')
+        error = context.exception
+        self.assertIsInstance(error, TypeError)
+        self.assertEqual((error.code, error.arg_num, error.name, error.constraint, error.value), ('type', 0, 'input1', int, 1.0))
+        self.assertIs(error.function, func.__wrapped__)
+
+        with self.assertRaises(ArgumentValueError) as context:
+            func(1, 'abcdef')
+        error = context.exception
+        self.assertIsInstance(error, ValueError)
+        self.assertEqual((error.code, error.arg_num, error.name, error.constraint, error.value), ('rangeLength', 1, 'input2', [2, 4], 6))
+
+        with self.assertRaises(ArgumentValueError) as context:
+            func(1)
+        self.assertEqual(context.exception.code, 'arguments')
+        self.assertIsNone(context.exception.name)
+
+    def test_errors_02_messages(self):
+        @acceptedTypes([int, float], {'type': list, 'command': {'checkConsistency': True}})
+        @acceptedValues({'range': [1, 10]}, {'set': {1, 2}})
+        def func(input1, input2):
+            return input1
+
+        with self.assertRaises(TypeError) as context:
+            func('a', [1])
+        self.assertEqual(str(context.exception), "The type of the 1st argument of function func() does not belong in [<class 'int'>, <class 'float'>]")
+        with self.assertRaises(TypeError) as context:
+            func(1, [1, 'a'])
+        self.assertEqual(str(context.exception), 'Each element of the 2nd variable must have the same type.')
+        with self.assertRaises(ValueError) as context:
+            func(11, [1])
+        self.assertEqual(str(context.exception), 'The 1st argument of the function func() has value out of the accepted range: [1, 10].')
+
+        error = pickle.loads(pickle.dumps(ArgumentValueError('minValue', None, 2, 5, 3, 'min', text='value')))
+        self.assertEqual((error.code, error.arg_num, error.constraint, error.value), ('minValue', 2, 5, 3))
+        self.assertEqual(str(error), 'The 3rd argument of the function None() has lower value than the accepted: 5.')
+        self.assertTrue(issubclass(ArgumentTypeError, ArgumentError))
+
+
+    def test_errors_04_pickle(self):
+        @accepted(types=(int, str), values=({'range': [1, 10]}, {'minLength': 1}))
+        def func(input1, input2):
+            return input1
+
+        with self.assertRaises(ArgumentValueError) as context:
+            func(11, 'a')
+        error = context.exception
+        self.assertEqual(error.args, ('range', 0, [1, 10], 11))
+        copied = pickle.loads(pickle.dumps(error))
+        self.assertIs(type(copied), ArgumentValueError)
+        self.assertEqual((copied.code, copied.arg_num, copied.name, copied.constraint, copied.value), ('range', 0, 'input1', [1, 10], 11))
+        self.assertEqual(copied.function, 'func')
+        self.assertEqual(str(copied), str(error))
+        self.assertEqual(str(ArgumentValueError()), '')
+        self.assertEqual(str(ArgumentTypeError('custom')), 'custom') # a code without a message
+
+    def test_errors_05_process_pool(self):
+        with concurrent.futures.ProcessPoolExecutor(1) as executor:
+            self.assertEqual(executor.submit(_poolFunction, 5).result(), 5)
+            with self.assertRaises(ArgumentValueError) as context:
+                executor.submit(_poolFunction, 11).result()
+            self.assertEqual(str(context.exception), 'The 1st argument of the function _poolFunction() has value out of the accepted range: [1, 10].')
+            with self.assertRaises(ArgumentTypeError):
+                executor.submit(_poolFunction, 'a').result()
+
+
+class Tests_lazyNumpy(unittest.TestCase):
+
+    def test_lazyNumpy_01_import(self):
+        code = (
+            'import sys\n'
+            'from InputCheck.InputCheckDecorators import acceptedValues, accepted\n'
+            '@accepted(types=(int, [str, list]), values=({"range": [1, 10]}, {"minLength": 2}))\n'
+            'def func(input1, input2):\n'
+            '    return input1\n'
+            'func(5, "ab"); func(5, [1, 2])\n'
+            'print("numpy" in sys.modules)\n'
+            '@acceptedValues({"minLength": 2})\n'
+            'def func2(input1):\n'
+            '    return input1\n'
+            'import numpy as np\n' # the arrays are checked as soon as NumPy has been imported
+            'try:\n'
+            '    func2(np.zeros(1))\n'
+            'except ValueError:\n'
+            '    print("checked")\n'
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        env = dict(os.environ, PYTHONPATH=root)
+        output = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True)
+        self.assertEqual(output.stdout.split(), ['False', 'checked'], output.stderr)
+
+        code = (
+            'import sys\n'
+            'from InputCheck.InputCheckDecorators import acceptedValues\n'
+            '@acceptedValues({"elemRange": [0, 1]})\n' # an array specification imports NumPy
+            'def func(input1):\n'
+            '    return input1\n'
+            'print("numpy" in sys.modules)\n'
+        )
+        output = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True)
+        self.assertEqual(output.stdout.strip(), 'True', output.stderr)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file